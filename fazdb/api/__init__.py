@@ -1,4 +1,5 @@
 # type: ignore
+from .json_decoder import JsonDecoder
 from .ratelimit_handler import RatelimitHandler
 from .response_set import ResponseSet
 
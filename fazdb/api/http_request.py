@@ -1,10 +1,11 @@
 from __future__ import annotations
 import asyncio
-from typing import TYPE_CHECKING, Any
+import json
+from time import time
+from typing import TYPE_CHECKING, Any, Callable
 
 from aiohttp import ClientSession, ClientTimeout
 
-from . import ResponseSet
 from fazdb import (
     BadRequest,
     Forbidden,
@@ -16,8 +17,12 @@ from fazdb import (
     Unauthorized,
     FazDbError
 )
+from fazdb.lru_cache import LruCache
+
+from . import ResponseSet
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
     from aiohttp import ClientResponse
     from . import RatelimitHandler
 
@@ -30,13 +35,33 @@ class HttpRequest:
         api_key: None | str = None,
         headers: dict[str, Any] = {},
         ratelimit: None | RatelimitHandler = None,
-        timeout: int = 120
+        timeout: int = 120,
+        executor: None | Executor = None,
+        offload_threshold: int = 65536,
+        json_loads: Callable[[bytes], Any] = json.loads,
+        cache_size: int = 0
     ) -> None:
+        """
+        Args:
+            executor: Thread pool that decodes response bodies of at least `offload_threshold` bytes, off the
+                event loop. Bodies are decoded on the event loop if None.
+            json_loads: Decodes the raw response body, see `JsonDecoder`.
+            cache_size: Responses kept by URL, and returned by `get` until their `Expires` header. 0 disables it.
+        """
         self._api_key = api_key
         self._base_url = base_url
         self._ratelimit = ratelimit
         self._headers = headers
         self._timeout = timeout
+        self._executor = executor
+        self._offload_threshold = offload_threshold
+        self._json_loads = json_loads
+        self._cache: None | LruCache[tuple[str, Any], tuple[float, ResponseSet[Any, Any]]] = (
+                LruCache(cache_size) if cache_size > 0 else None
+        )
+        """(url_param, body_factory): (expiry timestamp, response)"""
+        self._cache_hits = 0
+        self._cache_misses = 0
 
         if self._api_key is not None:
             self._headers["apikey"] = self._api_key
@@ -53,14 +78,28 @@ class HttpRequest:
             self,
             url_param: str,
             retries: None | int = None,  # HACK: bad code obv. please change this if you know a better
-            retry_on_exc: bool = False
+            retry_on_exc: bool = False,
+            body_factory: None | Callable[[Any], Any] = None
         ) -> ResponseSet[Any, Any]:
+        """
+        Args:
+            body_factory: Builds the response body from the decoded JSON, e.g. a model class. Runs in the same
+                place as the decoding, so large bodies are built off the event loop too.
+        """
         if retry_on_exc and retries is None:
             raise ValueError("Retries must be set to a valid integer if retry_on_exc is True")
 
         if self._session is None or self._session.closed:
             raise FazDbError("Session is not open")
 
+        if self._cache is not None:
+            cached = self._cache.get((url_param, body_factory))
+            if cached is not None and cached[0] > time():
+                # NOTE: Not counted by the ratelimiter, on purpose. No request is sent, so there is nothing to limit.
+                self._cache_hits += 1
+                return cached[1]
+            self._cache_misses += 1
+
         resp: ClientResponse
         if self._ratelimit:
             await self._ratelimit.limit()
@@ -70,7 +109,10 @@ class HttpRequest:
         if resp.ok:
             if self._ratelimit:
                 self._ratelimit.update(dict(resp.headers))
-            return ResponseSet(await resp.json(), dict(resp.headers))
+            ret = ResponseSet(await self._decode(await resp.read(), body_factory), dict(resp.headers))
+            if self._cache is not None:
+                self._cache_response(url_param, body_factory, ret)
+            return ret
 
         try:
             match resp.status:
@@ -94,15 +136,51 @@ class HttpRequest:
                 await self._ratelimit.ratelimited()
             else:
                 await asyncio.sleep(60)
-            return await self.get(url_param, retries, retry_on_exc)
+            return await self.get(url_param, retries, retry_on_exc, body_factory)
 
         except HTTPError as e:
             if retry_on_exc and retries is not None:
                 if retries <= 0:
                     raise TooManyRetries(url_param + f" ({e})")
-                return await self.get(url_param, retries - 1, retry_on_exc)
+                return await self.get(url_param, retries - 1, retry_on_exc, body_factory)
             raise
 
+    async def _decode(self, raw: bytes, body_factory: None | Callable[[Any], Any]) -> Any:
+        if self._executor is None or len(raw) < self._offload_threshold:
+            return _decode_body(raw, self._json_loads, body_factory)
+        return await asyncio.get_running_loop().run_in_executor(
+                self._executor, _decode_body, raw, self._json_loads, body_factory
+        )
+
+    def _cache_response(self, url_param: str, body_factory: Any, resp: ResponseSet[Any, dict[str, Any]]) -> None:
+        # NOTE: Imported here, fazdb.api.wynn imports this module through fazdb.api
+        from fazdb.api.wynn.model.field import HeaderDateField
+
+        assert self._cache is not None
+        cache_control = resp.headers.get("Cache-Control", "")
+        if "no-store" in cache_control or "no-cache" in cache_control:
+            return
+        try:
+            expires = HeaderDateField(resp.headers["Expires"]).to_datetime().timestamp()
+        except (KeyError, TypeError, ValueError):
+            return
+        if expires > time():
+            self._cache.put((url_param, body_factory), (expires, resp))
+
+    @property
+    def json_loads(self) -> Callable[[bytes], Any]:
+        return self._json_loads
+
+    @property
+    def cache_hits(self) -> int:
+        """Responses returned from the cache."""
+        return self._cache_hits
+
+    @property
+    def cache_misses(self) -> int:
+        """Requests sent over the network while the cache is enabled."""
+        return self._cache_misses
+
     def is_open(self) -> bool:
         return self._session is not None and not self._session.closed
 
@@ -113,3 +191,8 @@ class HttpRequest:
     async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
         if self._session is not None:
             await self._session.close()
+
+
+def _decode_body(raw: bytes, json_loads: Callable[[bytes], Any], body_factory: None | Callable[[Any], Any]) -> Any:
+    body = json_loads(raw)
+    return body if body_factory is None else body_factory(body)
@@ -0,0 +1,23 @@
+import importlib
+import json
+from typing import Any, Callable
+
+
+class JsonDecoder:
+    """Resolves the function that decodes JSON response bodies from raw bytes."""
+
+    DECODERS: tuple[str, ...] = ("orjson", "ujson", "json")
+    """Decoder modules by preference. Each module must have a `loads` function that accepts bytes."""
+
+    @staticmethod
+    def get(name: str = "auto") -> Callable[[bytes], Any]:
+        """`loads` function of the decoder module `name`.
+        "auto" picks the first installed module from `DECODERS`, which always ends up with stdlib `json`."""
+        if name != "auto":
+            return importlib.import_module(name).loads
+        for module in JsonDecoder.DECODERS:
+            try:
+                return importlib.import_module(module).loads
+            except ImportError:
+                continue
+        return json.loads
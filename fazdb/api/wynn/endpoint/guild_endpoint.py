@@ -5,6 +5,7 @@
 from typing import Any
 
 from . import AbstractEndpoint
+from ..model import Guild
 from ..response import GuildResponse
 
 
@@ -24,6 +25,7 @@ class GuildEndpoint(AbstractEndpoint):
                 **kwargs,
                 retries=self._retries,
                 retry_on_exc=self._retry_on_exc,
+                body_factory=Guild
         )
         return GuildResponse(response.body, response.headers)
 
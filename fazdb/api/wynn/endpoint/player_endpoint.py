@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 
 
 from . import AbstractEndpoint
+from ..model import OnlinePlayers, Player
 from ..response import PlayerResponse, OnlinePlayersResponse
 
 if TYPE_CHECKING:
@@ -18,6 +19,7 @@ class PlayerEndpoint(AbstractEndpoint):
                 f"{self.path}/%s?fullResult=True" % username_or_uuid,
                 retries=self._retries,
                 retry_on_exc=self._retry_on_exc,
+                body_factory=Player
         )
         return PlayerResponse(response.body, response.headers)
 
@@ -26,6 +28,7 @@ class PlayerEndpoint(AbstractEndpoint):
                 f"{self.path}?identifier=uuid",
                 retries=self._retries,
                 retry_on_exc=self._retry_on_exc,
+                body_factory=OnlinePlayers
         )
         return OnlinePlayersResponse(response.body, response.headers)
 
@@ -3,8 +3,9 @@ from .character_type_field import CharacterTypeField
 from .date_field import DateField
 from .gamemode_field import GamemodeField
 from .nullable import Nullable
-from .username_or_uuid_field import UsernameOrUuidField
-from .uuid_field import UuidField
 
 from .header_date_field import HeaderDateField  # DateField
 from .body_date_field import BodyDateField  # DateField
+
+from .username_or_uuid_field import UsernameOrUuidField  # UuidCache
+from .uuid_field import UuidField  # UuidCache
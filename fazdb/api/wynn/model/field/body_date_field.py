@@ -1,4 +1,6 @@
 from datetime import datetime
+from functools import lru_cache
+
 from dateutil import parser
 
 from . import DateField
@@ -6,8 +8,19 @@ from . import DateField
 
 class BodyDateField(DateField):
 
+    __slots__ = ()
+
     def __init__(self, datestr: str) -> None:
         super().__init__(datestr, "")
 
     def to_datetime(self) -> datetime:
-        return parser.parse(self.datestr)
+        return self._parse(self.datestr)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse(datestr: str) -> datetime:
+        """Parses an ISO 8601 date, e.g. `2024-01-30T11:59:35.123Z`. Falls back to dateutil for anything else."""
+        try:
+            return datetime.fromisoformat(datestr)
+        except ValueError:
+            return parser.parse(datestr)
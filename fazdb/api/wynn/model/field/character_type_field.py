@@ -3,6 +3,8 @@ from fazdb.api.wynn.model.enum import CharacterType
 
 class CharacterTypeField:
 
+    __slots__ = ("_type",)
+
     def __init__(self, type_: str) -> None:
         self._type: str = type_
 
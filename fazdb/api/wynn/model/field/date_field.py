@@ -3,6 +3,8 @@ from datetime import datetime
 
 class DateField:
 
+    __slots__ = ("_datestr", "_datefmt")
+
     def __init__(self, datestr: str, datefmt: str) -> None:
         self._datestr: str = datestr
         self._datefmt: str = datefmt
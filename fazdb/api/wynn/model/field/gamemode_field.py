@@ -3,6 +3,8 @@ from ..enum import Gamemode
 
 class GamemodeField:
 
+    __slots__ = ("_gamemodes_str", "_gamemodes")
+
     def __init__(self, gamemodes: list[str]) -> None:
         self._gamemodes_str: list[str] = gamemodes
         self._gamemodes: list[Gamemode] = []
@@ -1,4 +1,6 @@
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
+
 from dateutil import parser
 
 from . import DateField
@@ -6,10 +8,34 @@ from . import DateField
 
 class HeaderDateField(DateField):
 
+    __slots__ = ()
+
     HEADERS_DATEFMT: str = "%a, %d %b %Y %H:%M:%S %Z"
+    _MONTHS: dict[str, int] = {
+        month: i for i, month in enumerate(
+            ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"), 1
+        )
+    }
 
     def __init__(self, datestr: str) -> None:
         super().__init__(datestr, self.HEADERS_DATEFMT)
 
     def to_datetime(self) -> datetime:
-        return parser.parse(self.datestr)
+        return self._parse(self.datestr)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _parse(datestr: str) -> datetime:
+        """Parses an RFC 1123 date, e.g. `Tue, 30 Jan 2024 11:59:35 GMT`, into a UTC datetime.
+        Falls back to dateutil for anything else."""
+        try:
+            _, day, month, year, time, tz = datestr.split()
+            if tz != "GMT":
+                raise ValueError(datestr)
+            hour, minute, second = time.split(":")
+            return datetime(
+                int(year), HeaderDateField._MONTHS[month], int(day), int(hour), int(minute), int(second),
+                tzinfo=timezone.utc
+            )
+        except (KeyError, ValueError):
+            return parser.parse(datestr)
@@ -1,34 +1,31 @@
 from uuid import UUID
 
+from fazdb.util.uuid_cache import UuidCache
+
 
 class UsernameOrUuidField:
 
+    __slots__ = ("_username_or_uuid", "_uuid_bytes")
+
     def __init__(self, username_or_uuid: str) -> None:
         self._username_or_uuid: str = username_or_uuid
-        self._is_uuid: bool = False
-        self._username: None | str = None
-        self._uuid: None | UUID = None
-        try:
-            self._uuid = UUID(username_or_uuid)
-            self._is_uuid = True
-        except ValueError:
-            self._username = username_or_uuid
+        self._uuid_bytes: None | bytes = UuidCache.parse(username_or_uuid)
 
     def __str__(self) -> str:
         return self._username_or_uuid
 
     def to_bytes(self) -> bytes:
-        if self._uuid is None:
+        if self._uuid_bytes is None:
             raise ValueError("UUID is None.")
-        return self._uuid.bytes
+        return self._uuid_bytes
 
     def is_uuid(self) -> bool:
-        return self._is_uuid
+        return self._uuid_bytes is not None
 
     @property
     def username(self) -> None | str:
         """Returns an username if this object is not an uuid else None."""
-        return self._username
+        return self._username_or_uuid if self._uuid_bytes is None else None
 
     @property
     def username_or_uuid(self) -> str:
@@ -37,4 +34,4 @@ class UsernameOrUuidField:
     @property
     def uuid(self) -> None | UUID:
         """Returns an uuid if this object is an uuid else None."""
-        return self._uuid
+        return None if self._uuid_bytes is None else UUID(bytes=self._uuid_bytes)
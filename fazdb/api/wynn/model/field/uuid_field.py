@@ -1,13 +1,15 @@
-from uuid import UUID
+from fazdb.util.uuid_cache import UuidCache
 
 
 class UuidField:
 
+    __slots__ = ("_uuid",)
+
     def __init__(self, uuid_: str) -> None:
         self._uuid: str = uuid_
 
     def to_bytes(self) -> bytes:
-        return UUID(self._uuid).bytes
+        return UuidCache.to_bytes(self._uuid)
 
     @property
     def uuid(self) -> str:
@@ -7,6 +7,11 @@ from .field import BodyDateField, Nullable, UsernameOrUuidField, UuidField
 
 class Guild:
 
+    __slots__ = (
+        "_raw", "_uuid", "_name", "_prefix", "_level", "_xp_percent", "_territories", "_wars", "_created", "_online",
+        "_members", "_banner", "_season_ranks"
+    )
+
     def __init__(self, raw: dict[str, Any]) -> None:
         self._raw = raw
         self._uuid = UuidField(raw["uuid"])
@@ -17,48 +22,72 @@ class Guild:
         self._territories = raw["territories"]
         self._wars = raw["wars"] or 0
         self._created = BodyDateField(raw["created"])
-        self._members = Guild.Members(raw["members"])
         self._online = raw["online"]
-        self._banner = Nullable(Guild.Banner, raw.get("banner"))
-        self._season_ranks = {
-            season: Guild.SeasonRankInfo(season_rank_info)
-            for season, season_rank_info in raw["seasonRanks"].items()
-        }
+        self._members: None | Guild.Members = None
+        self._banner: None | Guild.Banner = None
+        self._season_ranks: None | dict[str, Guild.SeasonRankInfo] = None
+        # NOTE: Nested objects are parsed from `raw` on first access, then cached.
 
     def iter_seasonranks(self) -> Generator[tuple[str, Guild.SeasonRankInfo], Any, None]:
         yield from self.season_ranks.items()
 
     class Members:
+        __slots__ = ("_total", "_node", "_ranks", "_online", "_rank_counts", "_by_uuid")
+
+        RANKS: tuple[str, ...] = ("owner", "chief", "strategist", "captain", "recruiter", "recruit")
+
         def __init__(self, node: dict[str, Any]) -> None:
             self._total = node["total"]
-            self._owner = self._members_constructor(node["owner"])
-            self._chief = self._members_constructor(node["chief"])
-            self._strategist = self._members_constructor(node["strategist"])
-            self._captain = self._members_constructor(node["captain"])
-            self._recruiter = self._members_constructor(node["recruiter"])
-            self._recruit = self._members_constructor(node["recruit"])
+            self._node = node
+            self._ranks: dict[str, dict[UsernameOrUuidField, Guild.Members.MemberInfo]] = {}
+            # NOTE: Index of every rank, built once on the first query
+            self._online: None | list[tuple[str, UsernameOrUuidField, Guild.Members.MemberInfo]] = None
+            self._rank_counts: dict[str, int] = {}
+            self._by_uuid: dict[bytes, Guild.Members.MemberInfo] = {}
 
         def get_online_members(self) -> int:
-            return len(tuple(self.iter_online_members()))
+            return len(self._get_online())
+
+        def get_rank_count(self, rank: str) -> int:
+            """Number of members with `rank`."""
+            self._get_online()
+            return self._rank_counts[rank]
+
+        def get_member(self, uuid: bytes) -> None | Guild.Members.MemberInfo:
+            """Member with the 16-byte `uuid`, or None if they aren't in the guild."""
+            self._get_online()
+            return self._by_uuid.get(uuid)
 
         def iter_online_members(self) -> Generator[tuple[str, UsernameOrUuidField, Guild.Members.MemberInfo], Any, None]:
-            for rank, uuid, memberinfo in self.iter_members():
-                if memberinfo.online:
-                    yield (rank, uuid, memberinfo)
+            yield from self._get_online()
 
         def iter_members(self) -> Generator[tuple[str, UsernameOrUuidField, Guild.Members.MemberInfo], Any, None]:
-            all_: dict[str, dict[UsernameOrUuidField, Guild.Members.MemberInfo]] = {
-                "owner": self.owner,
-                "chief": self.chief,
-                "strategist": self.strategist,
-                "captain": self.captain,
-                "recruiter": self.recruiter,
-                "recruit": self.recruit
-            }
-            for rank, members in all_.items():
-                for identifier, member in members.items():
+            for rank in self.RANKS:
+                for identifier, member in self._get_rank(rank).items():
                     yield (rank, identifier, member)
 
+        def _get_online(self) -> list[tuple[str, UsernameOrUuidField, Guild.Members.MemberInfo]]:
+            if self._online is None:
+                online: list[tuple[str, UsernameOrUuidField, Guild.Members.MemberInfo]] = []
+                for rank in self.RANKS:
+                    members = self._get_rank(rank)
+                    self._rank_counts[rank] = len(members)
+                    for identifier, member in members.items():
+                        if identifier.is_uuid():
+                            self._by_uuid[identifier.to_bytes()] = member
+                        elif member.uuid is not None:
+                            self._by_uuid[member.uuid.to_bytes()] = member
+                        if member.online:
+                            online.append((rank, identifier, member))
+                self._online = online
+            return self._online
+
+        def _get_rank(self, rank: str) -> dict[UsernameOrUuidField, Guild.Members.MemberInfo]:
+            members = self._ranks.get(rank)
+            if members is None:
+                members = self._ranks[rank] = self._members_constructor(self._node[rank])
+            return members
+
         def _members_constructor(self, node: dict[str, Any]) -> dict[UsernameOrUuidField, Guild.Members.MemberInfo]:
             return {
                 UsernameOrUuidField(identifier): Guild.Members.MemberInfo(member)
@@ -66,6 +95,8 @@ class Guild:
             }
 
         class MemberInfo:
+            __slots__ = ("_uuid", "_username", "_online", "_server", "_contributed", "_contribution_rank", "_joined")
+
             def __init__(self, node: dict[str, Any]) -> None:
                 self._uuid = Nullable(UuidField, node.get("uuid"))
                 self._username = node.get("username" )
@@ -109,39 +140,41 @@ class Guild:
 
         @property
         def owner(self) -> dict[UsernameOrUuidField, MemberInfo]:
-            return self._owner
+            return self._get_rank("owner")
 
         @property
         def chief(self) -> dict[UsernameOrUuidField, MemberInfo]:
-            return self._chief
+            return self._get_rank("chief")
 
         @property
         def strategist(self) -> dict[UsernameOrUuidField, MemberInfo]:
-            return self._strategist
+            return self._get_rank("strategist")
 
         @property
         def captain(self) -> dict[UsernameOrUuidField, MemberInfo]:
-            return self._captain
+            return self._get_rank("captain")
 
         @property
         def recruiter(self) -> dict[UsernameOrUuidField, MemberInfo]:
-            return self._recruiter
+            return self._get_rank("recruiter")
 
         @property
         def recruit(self) -> dict[UsernameOrUuidField, MemberInfo]:
-            return self._recruit
+            return self._get_rank("recruit")
 
     class Banner:
+        __slots__ = ("_base", "_tier", "_structure", "_node", "_layers")
+
         def __init__(self, node: dict[str, Any]) -> None:
             self._base = node["base"]
             self._tier = node["tier"]
             self._structure = node.get("structure")
-            self._layers = [
-                Guild.Banner.LayerInfo(layer)
-                for layer in node["layers"]
-            ]
+            self._node = node
+            self._layers: None | list[Guild.Banner.LayerInfo] = None
 
         class LayerInfo:
+            __slots__ = ("_colour", "_pattern")
+
             def __init__(self, node: dict[str, Any]) -> None:
                 self._colour: str = node["colour"]
                 self._pattern: str = node["pattern"]
@@ -168,9 +201,13 @@ class Guild:
 
         @property
         def layers(self) -> list[LayerInfo]:
+            if self._layers is None:
+                self._layers = [Guild.Banner.LayerInfo(layer) for layer in self._node["layers"]]
             return self._layers
 
     class SeasonRankInfo:
+        __slots__ = ("_rating", "_final_territories")
+
         def __init__(self, node: dict[str, Any]) -> None:
             self._rating = node["rating"]
             self._final_territories = node["finalTerritories"]
@@ -221,6 +258,8 @@ class Guild:
 
     @property
     def members(self) -> Guild.Members:
+        if self._members is None:
+            self._members = Guild.Members(self._raw["members"])
         return self._members
 
     @property
@@ -229,8 +268,15 @@ class Guild:
 
     @property
     def banner(self) -> None | Guild.Banner:
+        if self._banner is None:
+            self._banner = Nullable(Guild.Banner, self._raw.get("banner"))
         return self._banner
 
     @property
     def season_ranks(self) -> dict[str, Guild.SeasonRankInfo]:
+        if self._season_ranks is None:
+            self._season_ranks = {
+                season: Guild.SeasonRankInfo(season_rank_info)
+                for season, season_rank_info in self._raw["seasonRanks"].items()
+            }
         return self._season_ranks
@@ -7,6 +7,11 @@ from .field import HeaderDateField
 
 class Headers:
 
+    __slots__ = (
+        "_raw", "_cache_control", "_date", "_expires", "_ratelimit_limit", "_ratelimit_remaining",
+        "_ratelimit_reset", "_datetime"
+    )
+
     def __init__(self, raw: dict[str, Any]) -> None:
         self._raw = raw
         self._cache_control = raw["Cache-Control"]
@@ -15,6 +20,7 @@ class Headers:
         self._ratelimit_limit = int(raw["RateLimit-Limit"])
         self._ratelimit_remaining = int(raw["RateLimit-Remaining"])
         self._ratelimit_reset = int(raw["RateLimit-Reset"])
+        self._datetime: None | datetime = None
 
     def to_datetime(self) -> datetime:
         """
@@ -23,9 +29,12 @@ class Headers:
         Returns:
             datetime: The timestamp of the response.
         """
-        expiry_date: datetime = self.expires.to_datetime()
-        cache_control: timedelta = timedelta(seconds=int(self.cache_control.split("=")[1]))
-        return expiry_date - cache_control
+        # NOTE: Called for every row made from the response, so it's only computed once
+        if self._datetime is None:
+            expiry_date: datetime = self.expires.to_datetime()
+            cache_control: timedelta = timedelta(seconds=int(self.cache_control.split("=")[1]))
+            self._datetime = expiry_date - cache_control
+        return self._datetime
 
     @property
     def raw(self) -> dict[str, Any]:
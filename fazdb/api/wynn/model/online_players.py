@@ -1,20 +1,78 @@
+from __future__ import annotations
+from array import array
 from typing import Any, Generator
 
+from fazdb.util.uuid_cache import UuidCache
+
 from .field import UsernameOrUuidField
 
 
 class OnlinePlayers:
+    """Online players, parsed compactly.
+
+    UUID keys are stored as one block of sorted 16-byte UUIDs, with the id of each player's server in
+    `server_ids`, an index into `servers`. Keys that aren't UUIDs are left out of the compact form. The
+    `UsernameOrUuidField` dict of `players` is only built on first access.
+    """
+
+    __slots__ = ("_raw", "_total", "_players", "_uuids", "_server_ids", "_servers")
 
     def __init__(self, raw: dict[str, Any]) -> None:
         self._raw = raw
         self._total = raw["total"]
-        self._players = {
-            UsernameOrUuidField(usernameoruuid): server
-            for usernameoruuid, server in raw["players"].items()
-        }
+        self._players: None | dict[UsernameOrUuidField, str] = None
+
+        server_ids: dict[str, int] = {}
+        entries = sorted(
+                (uuid, server_ids.setdefault(server, len(server_ids)))
+                for uuid, server in zip(map(UuidCache.parse, raw["players"]), raw["players"].values())
+                if uuid is not None
+        )
+        self._uuids = b"".join(uuid for uuid, _ in entries)
+        self._server_ids = array("H", (server_id for _, server_id in entries))
+        self._servers = tuple(server_ids)
 
     def iter_players(self) -> Generator[tuple[UsernameOrUuidField, str], Any, None]:
-        yield from self._players.items()
+        yield from self.players.items()
+
+    def iter_uuids(self) -> Generator[tuple[bytes, str], Any, None]:
+        """Yields the 16-byte UUID and server of every online player, ordered by UUID."""
+        uuids = self._uuids
+        servers = self._servers
+        for i, server_id in enumerate(self._server_ids):
+            yield uuids[i * 16:i * 16 + 16], servers[server_id]
+
+    @staticmethod
+    def diff(old_uuids: bytes, new_uuids: bytes) -> tuple[list[bytes], list[bytes]]:
+        """Merges two sorted UUID blocks, see `uuids`. Returns the UUIDs only in `new_uuids` (logged on), and the
+        UUIDs only in `old_uuids` (logged off)."""
+        logged_on: list[bytes] = []
+        logged_off: list[bytes] = []
+        if old_uuids == new_uuids:
+            return logged_on, logged_off
+
+        i = j = 0
+        old_end = len(old_uuids)
+        new_end = len(new_uuids)
+        while i < old_end and j < new_end:
+            old = old_uuids[i:i + 16]
+            new = new_uuids[j:j + 16]
+            if old == new:
+                i += 16
+                j += 16
+            elif old < new:
+                logged_off.append(old)
+                i += 16
+            else:
+                logged_on.append(new)
+                j += 16
+        logged_off.extend(old_uuids[k:k + 16] for k in range(i, old_end, 16))
+        logged_on.extend(new_uuids[k:k + 16] for k in range(j, new_end, 16))
+        return logged_on, logged_off
+
+    def __len__(self) -> int:
+        """Number of players in the compact form."""
+        return len(self._server_ids)
 
     @property
     def raw(self) -> dict[str, Any]:
@@ -26,4 +84,23 @@ class OnlinePlayers:
 
     @property
     def players(self) -> dict[UsernameOrUuidField, str]:
+        if self._players is None:
+            self._players = {
+                UsernameOrUuidField(usernameoruuid): server
+                for usernameoruuid, server in self._raw["players"].items()
+            }
         return self._players
+
+    @property
+    def uuids(self) -> bytes:
+        """Sorted block of the online players' 16-byte UUIDs."""
+        return self._uuids
+
+    @property
+    def server_ids(self) -> array[int]:
+        """Server of each UUID in `uuids`, as an index into `servers`."""
+        return self._server_ids
+
+    @property
+    def servers(self) -> tuple[str, ...]:
+        return self._servers
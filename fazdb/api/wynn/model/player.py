@@ -13,6 +13,12 @@ from .field import (
 
 class Player:
 
+    __slots__ = (
+        "_raw", "_username", "_online", "_server", "_active_character", "_uuid", "_rank", "_rank_badge",
+        "_legacy_rank_colour", "_shortened_rank", "_support_rank", "_veteran", "_first_join", "_last_join",
+        "_playtime", "_guild", "_global_data", "_forum_link", "_ranking", "_public_profile", "_characters"
+    )
+
     def __init__(self, raw: dict[str, Any]) -> None:
         self._raw = raw
         self._username = raw["username"]
@@ -22,32 +28,32 @@ class Player:
         self._uuid = UuidField(raw["uuid"])
         self._rank = raw["rank"]
         self._rank_badge = raw["rankBadge"]
-        self._legacy_rank_colour = Nullable(self.LegacyRankColour, raw.get("legacyRankColour"))
+        self._legacy_rank_colour: None | Player.LegacyRankColour = None
         self._shortened_rank = raw["shortenedRank"]
         self._support_rank = raw["supportRank"]
         self._veteran = raw["veteran"] or False
         self._first_join = BodyDateField(raw["firstJoin"])
         self._last_join = BodyDateField(raw["lastJoin"])
         self._playtime = Decimal(raw["playtime"])
-        self._guild = Nullable(self.Guild, raw.get("guild"))
-        self._global_data = self.GlobalData(raw["globalData"])
+        self._guild: None | Player.Guild = None
+        self._global_data: None | Player.GlobalData = None
         self._forum_link = raw["forumLink"]
         self._ranking = raw["ranking"]
         """`rankingName: nthRank`"""
         self._public_profile = raw["publicProfile"]
-        self._characters = {
-            UuidField(character_uuid): self.Character(character)
-            for character_uuid, character in raw["characters"].items()
-        }
+        self._characters: None | dict[UuidField, Player.Character] = None
+        # NOTE: Nested objects are parsed from `raw` on first access, then cached.
 
     def get_character_uuids(self) -> list[UuidField]:
         return list(self.characters.keys())
 
     def iter_characters(self) -> Generator[tuple[UuidField, Player.Character], Any, None]:
-        for character_uuid, character in self._characters.items():
+        for character_uuid, character in self.characters.items():
             yield (character_uuid, character)
 
     class LegacyRankColour:
+        __slots__ = ("_main", "_sub")
+
         def __init__(self, node: dict[str, str]) -> None:
             self._main = node["main"]
             self._sub = node["sub"]
@@ -61,6 +67,8 @@ class Player:
             return self._sub
 
     class Guild:
+        __slots__ = ("_uuid", "_name", "_prefix", "_rank", "_rank_stars")
+
         def __init__(self, node: dict[str, Any]) -> None:
             self._uuid = UuidField(node["uuid"])
             self._name = node["name"]
@@ -89,15 +97,21 @@ class Player:
             return self._rank_stars
 
     class GlobalData:
+        __slots__ = (
+            "_wars", "_total_level", "_killed_mobs", "_chests_found", "_completed_quests", "_node", "_dungeons",
+            "_raids", "_pvp"
+        )
+
         def __init__(self, node: dict[str, Any]) -> None:
             self._wars = node["wars"]
             self._total_level = node["totalLevel"]
             self._killed_mobs = node["killedMobs"]
             self._chests_found = node["chestsFound"]
-            self._dungeons = Player.Dungeons(node["dungeons"])
-            self._raids = Player.Raids(node["raids"])
             self._completed_quests = node["completedQuests"]
-            self._pvp = Player.Pvp(node["pvp"])
+            self._node = node
+            self._dungeons: None | Player.Dungeons = None
+            self._raids: None | Player.Raids = None
+            self._pvp: None | Player.Pvp = None
 
         @property
         def wars(self) -> int:
@@ -117,10 +131,14 @@ class Player:
 
         @property
         def dungeons(self) -> Player.Dungeons:
+            if self._dungeons is None:
+                self._dungeons = Player.Dungeons(self._node["dungeons"])
             return self._dungeons
 
         @property
         def raids(self) -> Player.Raids:
+            if self._raids is None:
+                self._raids = Player.Raids(self._node["raids"])
             return self._raids
 
         @property
@@ -129,9 +147,13 @@ class Player:
 
         @property
         def pvp(self) -> Player.Pvp:
+            if self._pvp is None:
+                self._pvp = Player.Pvp(self._node["pvp"])
             return self._pvp
 
     class Dungeons:
+        __slots__ = ("_total", "_list")
+
         def __init__(self, node: dict[str, Any]) -> None:
             self._total = node.get("total", 0)
             self._list = node.get("list", {})
@@ -146,6 +168,8 @@ class Player:
             return self._list
 
     class Raids:
+        __slots__ = ("_total", "_list")
+
         def __init__(self, node: dict[str, Any]) -> None:
             self._total = node.get("total", 0)
             self._list = node.get("list", {})
@@ -160,6 +184,8 @@ class Player:
             return self._list
 
     class Pvp:
+        __slots__ = ("_kills", "_deaths")
+
         def __init__(self, node: dict[str, Any]) -> None:
             self._kills = node.get("kills", 0) or 0
             self._deaths = node.get("deaths", 0) or 0
@@ -173,7 +199,15 @@ class Player:
             return self._deaths
 
     class Character:
+        __slots__ = (
+            "_node", "_type", "_nickname", "_level", "_xp", "_xp_percent", "_total_level", "_wars", "_playtime",
+            "_mobs_killed", "_chests_found", "_items_identified", "_blocks_walked", "_logins", "_deaths",
+            "_discoveries", "_pre_economy", "_gamemode", "_quests", "_pvp", "_skill_points", "_professions",
+            "_dungeons", "_raids"
+        )
+
         def __init__(self, node: dict[str, Any]) -> None:
+            self._node = node
             self._type = CharacterTypeField(node["type"])
             self._nickname = node["nickname"]
             self._level = node["level"]
@@ -190,15 +224,17 @@ class Player:
             self._deaths = node["deaths"]
             self._discoveries = node["discoveries"]
             self._pre_economy = node["preEconomy"] or False
-            self._pvp = Player.Pvp(node["pvp"])
             self._gamemode = GamemodeField(node["gamemode"])
-            self._skill_points = self.SkillPoints(node["skillPoints"])
-            self._professions = self.Professions(node["professions"])
-            self._dungeons = Player.Dungeons(node.get("dungeons", {}) or {})
-            self._raids = Player.Raids(node.get("raids", {}) or {})
             self._quests = node["quests"]
+            self._pvp: None | Player.Pvp = None
+            self._skill_points: None | Player.Character.SkillPoints = None
+            self._professions: None | Player.Character.Professions = None
+            self._dungeons: None | Player.Dungeons = None
+            self._raids: None | Player.Raids = None
 
         class SkillPoints:
+            __slots__ = ("_earth", "_thunder", "_water", "_fire", "_air")
+
             def __init__(self, node: dict[str, Any]) -> None:
                 self._earth = node.get("earth", 0)
                 self._thunder = node.get("thunder", 0)
@@ -227,22 +263,21 @@ class Player:
                 return self._air
 
         class Professions:
+            __slots__ = ("_node", "_infos")
+
             def __init__(self, node: dict[str, Any]) -> None:
-                ProfessionInfo = self.ProfessionInfo
-                self._alchemism = ProfessionInfo(node.get("alchemism", {}))
-                self._armouring = ProfessionInfo(node.get("armouring", {}))
-                self._cooking = ProfessionInfo(node.get("cooking", {}))
-                self._farming = ProfessionInfo(node.get("farming", {}))
-                self._fishing = ProfessionInfo(node.get("fishing", {}))
-                self._jeweling = ProfessionInfo(node.get("jeweling", {}))
-                self._mining = ProfessionInfo(node.get("mining", {}))
-                self._scribing = ProfessionInfo(node.get("scribing", {}))
-                self._tailoring = ProfessionInfo(node.get("tailoring", {}))
-                self._weaponsmithing = ProfessionInfo(node.get("weaponsmithing", {}))
-                self._woodcutting = ProfessionInfo(node.get("woodcutting", {}))
-                self._woodworking = ProfessionInfo(node.get("woodworking", {}))
+                self._node = node
+                self._infos: dict[str, Player.Character.Professions.ProfessionInfo] = {}
+
+            def _get_info(self, name: str) -> Player.Character.Professions.ProfessionInfo:
+                info = self._infos.get(name)
+                if info is None:
+                    info = self._infos[name] = self.ProfessionInfo(self._node.get(name, {}))
+                return info
 
             class ProfessionInfo:
+                __slots__ = ("_level", "_xp_percent")
+
                 def __init__(self, node: dict[str, Any]) -> None:
                     self._level = node.get("level", 0)
                     self._xp_percent = node.get("xpPercent", 0)
@@ -260,51 +295,51 @@ class Player:
 
             @property
             def alchemism(self) -> Player.Character.Professions.ProfessionInfo:
-                return self._alchemism
+                return self._get_info("alchemism")
 
             @property
             def armouring(self) -> Player.Character.Professions.ProfessionInfo:
-                return self._armouring
+                return self._get_info("armouring")
 
             @property
             def cooking(self) -> Player.Character.Professions.ProfessionInfo:
-                return self._cooking
+                return self._get_info("cooking")
 
             @property
             def farming(self) -> Player.Character.Professions.ProfessionInfo:
-                return self._farming
+                return self._get_info("farming")
 
             @property
             def fishing(self) -> Player.Character.Professions.ProfessionInfo:
-                return self._fishing
+                return self._get_info("fishing")
 
             @property
             def jeweling(self) -> Player.Character.Professions.ProfessionInfo:
-                return self._jeweling
+                return self._get_info("jeweling")
 
             @property
             def mining(self) -> Player.Character.Professions.ProfessionInfo:
-                return self._mining
+                return self._get_info("mining")
 
             @property
             def scribing(self) -> Player.Character.Professions.ProfessionInfo:
-                return self._scribing
+                return self._get_info("scribing")
 
             @property
             def tailoring(self) -> Player.Character.Professions.ProfessionInfo:
-                return self._tailoring
+                return self._get_info("tailoring")
 
             @property
             def weaponsmithing(self) -> Player.Character.Professions.ProfessionInfo:
-                return self._weaponsmithing
+                return self._get_info("weaponsmithing")
 
             @property
             def woodcutting(self) -> Player.Character.Professions.ProfessionInfo:
-                return self._woodcutting
+                return self._get_info("woodcutting")
 
             @property
             def woodworking(self) -> Player.Character.Professions.ProfessionInfo:
-                return self._woodworking
+                return self._get_info("woodworking")
 
         # Make character properties
         @property
@@ -373,6 +408,8 @@ class Player:
 
         @property
         def pvp(self) -> Player.Pvp:
+            if self._pvp is None:
+                self._pvp = Player.Pvp(self._node["pvp"])
             return self._pvp
 
         @property
@@ -382,18 +419,26 @@ class Player:
 
         @property
         def skill_points(self) -> Player.Character.SkillPoints:
+            if self._skill_points is None:
+                self._skill_points = self.SkillPoints(self._node["skillPoints"])
             return self._skill_points
 
         @property
         def professions(self) -> Player.Character.Professions:
+            if self._professions is None:
+                self._professions = self.Professions(self._node["professions"])
             return self._professions
 
         @property
         def dungeons(self) -> Player.Dungeons:
+            if self._dungeons is None:
+                self._dungeons = Player.Dungeons(self._node.get("dungeons", {}) or {})
             return self._dungeons
 
         @property
         def raids(self) -> Player.Raids:
+            if self._raids is None:
+                self._raids = Player.Raids(self._node.get("raids", {}) or {})
             return self._raids
 
         @property
@@ -434,6 +479,8 @@ class Player:
 
     @property
     def legacy_rank_colour(self) -> None | Player.LegacyRankColour:
+        if self._legacy_rank_colour is None:
+            self._legacy_rank_colour = Nullable(self.LegacyRankColour, self._raw.get("legacyRankColour"))
         return self._legacy_rank_colour
 
     @property
@@ -462,10 +509,14 @@ class Player:
 
     @property
     def guild(self) -> None | Player.Guild:
+        if self._guild is None:
+            self._guild = Nullable(self.Guild, self._raw.get("guild"))
         return self._guild
 
     @property
     def global_data(self) -> Player.GlobalData:
+        if self._global_data is None:
+            self._global_data = self.GlobalData(self._raw["globalData"])
         return self._global_data
 
     @property
@@ -482,4 +533,9 @@ class Player:
 
     @property
     def characters(self) -> dict[UuidField, Player.Character]:
+        if self._characters is None:
+            self._characters = {
+                UuidField(character_uuid): self.Character(character)
+                for character_uuid, character in self._raw["characters"].items()
+            }
         return self._characters
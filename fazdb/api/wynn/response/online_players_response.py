@@ -6,5 +6,5 @@ from . import AbstractWynnResponse
 
 class OnlinePlayersResponse(AbstractWynnResponse[OnlinePlayers]):
 
-    def __init__(self, body: dict[str, Any], headers: dict[str, Any]) -> None:
-        super().__init__(OnlinePlayers(body), Headers(headers))
+    def __init__(self, body: dict[str, Any] | OnlinePlayers, headers: dict[str, Any]) -> None:
+        super().__init__(body if isinstance(body, OnlinePlayers) else OnlinePlayers(body), Headers(headers))
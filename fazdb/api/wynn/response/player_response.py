@@ -6,8 +6,8 @@ from . import AbstractWynnResponse
 
 class PlayerResponse(AbstractWynnResponse[Player]):
 
-    def __init__(self, body: dict[str, Any], headers: dict[str, Any]) -> None:
-        super().__init__(Player(body), Headers(headers))
+    def __init__(self, body: dict[str, Any] | Player, headers: dict[str, Any]) -> None:
+        super().__init__(body if isinstance(body, Player) else Player(body), Headers(headers))
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(username={self.body.username})"
@@ -1,10 +1,11 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 from . import Api, WynnRatelimitHandler
 from .endpoint import GuildEndpoint, PlayerEndpoint
 from fazdb import __version__
-from .. import HttpRequest
+from .. import HttpRequest, JsonDecoder
 
 if TYPE_CHECKING:
     from fazdb import Logger
@@ -13,14 +14,36 @@ if TYPE_CHECKING:
 
 class WynnApi(Api):
 
-    def __init__(self, logger: Logger) -> None:
+    def __init__(
+        self,
+        logger: Logger,
+        offload_workers: int = 0,
+        offload_threshold: int = 65536,
+        json_decoder: str = "auto",
+        cache_size: int = 0
+    ) -> None:
+        """
+        Args:
+            offload_workers: Size of the thread pool that decodes response bodies and builds their models, for bodies of
+                at least `offload_threshold` bytes. 0 decodes every body on the event loop.
+            json_decoder: JSON decoder module name, or "auto" for the fastest installed one. See `JsonDecoder`.
+            cache_size: Responses cached until they expire, see `HttpRequest`. 0 disables the cache.
+        """
         self._logger = logger
         self._ratelimit = WynnRatelimitHandler(5, 180, self._logger)
+        # NOTE: Threads, not processes. The lazy models keep the raw dict, which a process pool would pickle back whole
+        self._executor: None | ThreadPoolExecutor = None
+        if offload_workers > 0:
+            self._executor = ThreadPoolExecutor(offload_workers, thread_name_prefix="WynnApiDecode")
         self._request = HttpRequest(
                 "https://api.wynncraft.com",
                 ratelimit=self._ratelimit,
-                headers={"User-Agent": f"faz-db/{__version__}", "Content-Type": "application/json"
-        })
+                headers={"User-Agent": f"faz-db/{__version__}", "Content-Type": "application/json"},
+                executor=self._executor,
+                offload_threshold=offload_threshold,
+                json_loads=JsonDecoder.get(json_decoder),
+                cache_size=cache_size
+        )
 
         self._guild_endpoint = GuildEndpoint(self._request, 3, True)
         self._player_endpoint = PlayerEndpoint(self._request, 3, True)
@@ -30,6 +53,8 @@ class WynnApi(Api):
 
     async def close(self) -> None:
         await self._request.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
 
     @property
     def guild(self) -> GuildEndpoint:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import asyncio
+from time import monotonic
 from typing import TYPE_CHECKING, Any
 
 from .model.headers import Headers
@@ -10,22 +11,55 @@ if TYPE_CHECKING:
 
 
 class WynnRatelimitHandler(RatelimitHandler):
+    """Token bucket that spreads the ratelimit budget evenly over the reset window.
 
-    def __init__(self, min_limit: int, total: int, logger: Logger) -> None:
+    The bucket is refilled at `(remaining - min_limit) / reset` tokens per second, recalculated from every
+    response's headers, and holds at most `burst` tokens. Concurrent callers of `limit` wait on a shared
+    condition until a token is available.
+    """
+
+    _DEFAULT_WINDOW = 60.0
+    """Reset window assumed before the first response's headers are known, in seconds."""
+
+    def __init__(self, min_limit: int, total: int, logger: Logger, burst: int = 10) -> None:
         self._min_limit = min_limit
         self._logger = logger
         self._remaining = total
         self._total = total
+        self._burst = burst
 
         self._reset: float = 0.0
+        self._tokens: float = min(burst, max(total - min_limit, 0))
+        self._rate: float = max(total - min_limit, 1) / self._DEFAULT_WINDOW
+        """Tokens refilled per second"""
+        self._last_refill: float = monotonic()
+        self._waiters = 0
+        self._condition: None | asyncio.Condition = None
 
     async def limit(self) -> None:
-        if self._remaining <= self.min_limit:
-            await self.ratelimited()
+        condition = self._get_condition()
+        async with condition:
+            self._waiters += 1
+            try:
+                while True:
+                    self._refill()
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    try:
+                        await asyncio.wait_for(condition.wait(), (1 - self._tokens) / self._rate)
+                    except TimeoutError:
+                        pass
+            finally:
+                self._waiters -= 1
 
     async def ratelimited(self) -> None:
-        self._logger.console.warning(f"Ratelimited, waiting for {self.reset}")
-        await asyncio.sleep(self.reset)
+        window = self.reset or self._DEFAULT_WINDOW
+        self._logger.console.warning(f"Ratelimited, pacing requests over {window}s")
+        # NOTE: Drain the bucket. The retried request then waits in `limit` along with every other request.
+        self._refill()
+        self._tokens = 0.0
+        self._rate = 1 / window
 
     def update(self, headers: dict[str, Any]) -> None:
         header = Headers(headers)
@@ -33,6 +67,31 @@ class WynnRatelimitHandler(RatelimitHandler):
         self._remaining = header.ratelimit_remaining
         self._reset = header.ratelimit_reset
 
+        self._refill()
+        budget = self._remaining - self._min_limit
+        self._tokens = min(self._tokens, max(budget, 0))
+        # NOTE: Once the budget is spent, a single token becomes available when the window resets
+        self._rate = max(budget, 1) / max(self._reset, 1.0)
+        if self._waiters > 0:
+            asyncio.create_task(self._notify_waiters())
+
+    def _refill(self) -> None:
+        now = monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._last_refill) * self._rate)
+        self._last_refill = now
+
+    async def _notify_waiters(self) -> None:
+        """Wakes up waiting callers so they recalculate their wait with the new refill rate."""
+        condition = self._get_condition()
+        async with condition:
+            condition.notify_all()
+
+    def _get_condition(self) -> asyncio.Condition:
+        # NOTE: Created lazily so it's bound to the event loop that makes the requests
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
     @property
     def min_limit(self) -> int:
         return self._min_limit
@@ -48,3 +107,8 @@ class WynnRatelimitHandler(RatelimitHandler):
     @property
     def reset(self) -> float:
         return self._reset
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently in the bucket."""
+        return self._tokens
@@ -5,7 +5,8 @@ from fazdb.api import WynnApi
 from fazdb.config import Config
 from fazdb.db import DatabaseQuery
 from fazdb.db.fazdb import FazDbDatabase
-from fazdb.heartbeat import SimpleHeartbeat
+from fazdb.db.fazdb.model.column import UniqueIdMixin
+from fazdb.heartbeat import AsyncHeartbeat
 from fazdb.logger import FazDbLogger
 
 from . import App
@@ -23,7 +24,15 @@ class FazDb(App):
 
         self._logger = FazDbLogger()
 
-        self._api = WynnApi(self.logger)
+        UniqueIdMixin.set_unique_id_version(config.fazdb_unique_id_version)
+
+        self._api = WynnApi(
+            self.logger,
+            config.fazdb_api_offload_workers,
+            config.fazdb_api_offload_threshold,
+            config.fazdb_api_json_decoder,
+            config.fazdb_api_cache_size,
+        )
 
         fazdb_query = DatabaseQuery(
             config.mysql_username,
@@ -32,10 +41,15 @@ class FazDb(App):
             config.mysql_port,
             config.fazdb_db_name,
             config.fazdb_db_max_retries,
+            config.fazdb_db_pool_minsize,
+            config.fazdb_db_pool_maxsize,
+            config.fazdb_db_pool_recycle,
+            config.fazdb_db_pool_ping_interval,
+            config.fazdb_db_local_infile,
         )
         self._db = FazDbDatabase(self.logger, fazdb_query)
 
-        self._heartbeat = SimpleHeartbeat(self.api, self.db, self.logger)
+        self._heartbeat = AsyncHeartbeat(self.api, self.db, self.logger)
 
     def start(self) -> None:
         self.logger.console.info("Starting WynnDb Heartbeat...")
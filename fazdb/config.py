@@ -9,7 +9,18 @@ class Config:
     discord_log_webhook: str
     discord_status_webhook: str
 
+    fazdb_api_offload_workers: int
+    fazdb_api_offload_threshold: int
+    fazdb_api_json_decoder: str
+    fazdb_api_cache_size: int
+
     fazdb_db_max_retries: int
+    fazdb_db_pool_minsize: int
+    fazdb_db_pool_maxsize: int
+    fazdb_db_pool_recycle: int
+    fazdb_db_pool_ping_interval: float
+    fazdb_db_local_infile: bool
+    fazdb_unique_id_version: int
 
     mysql_host: str
     mysql_port: int
@@ -24,7 +35,18 @@ class Config:
         cls.discord_log_webhook = cls.__must_get_env("DISCORD_LOG_WEBHOOK")
         cls.discord_status_webhook = cls.__must_get_env("DISCORD_STATUS_WEBHOOK")
 
+        cls.fazdb_api_offload_workers = cls.__get_env("FAZDB_API_OFFLOAD_WORKERS", int, 0)
+        cls.fazdb_api_offload_threshold = cls.__get_env("FAZDB_API_OFFLOAD_THRESHOLD", int, 65536)
+        cls.fazdb_api_json_decoder = cls.__get_env("FAZDB_API_JSON_DECODER", str, "auto")
+        cls.fazdb_api_cache_size = cls.__get_env("FAZDB_API_CACHE_SIZE", int, 0)
+
         cls.fazdb_db_max_retries = cls.__must_get_env("FAZDB_DB_MAX_RETRIES", int)
+        cls.fazdb_db_pool_minsize = cls.__get_env("FAZDB_DB_POOL_MINSIZE", int, 1)
+        cls.fazdb_db_pool_maxsize = cls.__get_env("FAZDB_DB_POOL_MAXSIZE", int, 10)
+        cls.fazdb_db_pool_recycle = cls.__get_env("FAZDB_DB_POOL_RECYCLE", int, 3600)
+        cls.fazdb_db_pool_ping_interval = cls.__get_env("FAZDB_DB_POOL_PING_INTERVAL", float, 30.0)
+        cls.fazdb_db_local_infile = cls.__get_env("FAZDB_DB_LOCAL_INFILE", int, 0) == 1
+        cls.fazdb_unique_id_version = cls.__get_env("FAZDB_UNIQUE_ID_VERSION", int, 1)
 
         cls.mysql_host = cls.__must_get_env("MYSQL_HOST")
         cls.mysql_port = cls.__must_get_env("MYSQL_PORT", int)
@@ -39,3 +61,13 @@ class Config:
             return type_strategy(env)  # type: ignore
         except ValueError:
             raise ValueError(f"Failed parsing environment variable {key} into type {type_strategy}")
+
+    @staticmethod
+    def __get_env[T](key: str, type_strategy: Callable[[str], T], default: T) -> T:
+        env = os.getenv(key)
+        if not env:
+            return default
+        try:
+            return type_strategy(env)
+        except ValueError:
+            raise ValueError(f"Failed parsing environment variable {key} into type {type_strategy}")
@@ -1,20 +1,30 @@
 from __future__ import annotations
+import asyncio
 from asyncio import Future
 from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any, AsyncGenerator, Iterable, Mapping
 from warnings import filterwarnings
 
-from aiomysql import DictCursor, connect, Warning
+from aiomysql import DictCursor, connect, create_pool, Warning
 
 from fazdb.util import ErrorHandler
 
 if TYPE_CHECKING:
-    from aiomysql import Connection
+    from asyncio import AbstractEventLoop
+    from aiomysql import Connection, Pool
 
 filterwarnings("ignore", category=Warning)
 
 
 class DatabaseQuery:
+    """Executes queries against a MySQL database.
+
+    With `pool_maxsize` above 0, connections are borrowed from an `aiomysql` pool, one pool per event loop.
+    Otherwise a new connection is made for every call that isn't given one.
+
+    Calls made on a connection passed by the caller aren't committed, the caller owns that transaction.
+    See `transaction`.
+    """
 
     def __init__(
             self,
@@ -23,15 +33,34 @@ class DatabaseQuery:
             host: str,
             port: int,
             database: str,
-            retries: int = 0
+            retries: int = 0,
+            pool_minsize: int = 1,
+            pool_maxsize: int = 0,
+            pool_recycle: int = 3600,
+            pool_ping_interval: float = 30.0,
+            local_infile: bool = False
         ) -> None:
+        """
+        Args:
+            pool_minsize: Connections kept open in the pool.
+            pool_maxsize: Maximum connections in the pool. 0 disables pooling.
+            pool_recycle: Seconds after which a pooled connection is replaced, -1 to never recycle.
+            pool_ping_interval: Seconds a pooled connection may be idle before it is pinged when borrowed.
+            local_infile: Allow `LOAD DATA LOCAL INFILE`. The server's `local_infile` has to be enabled too.
+        """
         self._user = user
         self._password = password
         self._host = host
         self._port = port
         self._database = database
         self._retries = retries
+        self._pool_minsize = pool_minsize
+        self._pool_maxsize = pool_maxsize
+        self._pool_recycle = pool_recycle
+        self._pool_ping_interval = pool_ping_interval
+        self._local_infile = local_infile
 
+        self._pools: dict[AbstractEventLoop, asyncio.Task[Pool]] = {}
         self._retry_decorator = ErrorHandler.retry_decorator(self.retries, Exception)
 
     async def fetch(
@@ -42,8 +71,7 @@ class DatabaseQuery:
     ) -> list[dict[str, Any]]:
         async with self.get_cursor(connection) as curs:
             await self._execute(curs, sql, params)
-            conn: Connection = curs.connection  # type: ignore
-            await conn.commit()
+            await self._commit(curs, connection)
             return await curs.fetchall()
 
     async def fetch_many(
@@ -54,8 +82,7 @@ class DatabaseQuery:
     ) -> list[dict[str, Any]]:
         async with self.get_cursor(connection) as curs:
             await self._executemany(curs, sql, params)
-            conn: Connection = curs.connection  # type: ignore
-            await conn.commit()
+            await self._commit(curs, connection)
             return await curs.fetchall()
 
     async def execute(
@@ -66,8 +93,7 @@ class DatabaseQuery:
     ) -> int:
         async with self.get_cursor(connection) as curs:
             await self._execute(curs, sql, params)
-            conn: Connection = curs.connection  # type: ignore
-            await conn.commit()
+            await self._commit(curs, connection)
             return curs.rowcount or 0
 
     async def execute_many(
@@ -78,8 +104,7 @@ class DatabaseQuery:
     ) -> int:
         async with self.get_cursor(connection) as curs:
             await self._executemany(curs, sql, params)
-            conn: Connection = curs.connection  # type: ignore
-            await conn.commit()
+            await self._commit(curs, connection)
             return curs.rowcount or 0
 
     @asynccontextmanager
@@ -95,13 +120,77 @@ class DatabaseQuery:
     @asynccontextmanager
     async def create_connection(self) -> AsyncGenerator[Connection, Any]:
         conn: Connection
-        async with connect(
-            user=self.user, password=self.password, db=self.database, host=self.host, port=self.port
-        ) as conn:
+        if not self.is_pooled:
+            async with connect(
+                user=self.user,
+                password=self.password,
+                db=self.database,
+                host=self.host,
+                port=self.port,
+                local_infile=self.local_infile
+            ) as conn:
+                yield conn
+            return
+
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            await self._check_health(conn)
             yield conn
 
-    def transaction_group(self) -> DatabaseQuery._TransactionGroupContextManager:
-        return self._TransactionGroupContextManager(self)
+    async def close(self) -> None:
+        """Closes the connection pool of the running event loop, if any."""
+        pool_task = self._pools.pop(asyncio.get_running_loop(), None)
+        if pool_task is None:
+            return
+        pool = await pool_task
+        pool.close()
+        await pool.wait_closed()
+
+    async def _get_pool(self) -> Pool:
+        # NOTE: aiomysql pools are bound to the event loop they're created in
+        loop = asyncio.get_running_loop()
+        if loop not in self._pools:
+            self._pools[loop] = loop.create_task(create_pool(
+                minsize=self._pool_minsize,
+                maxsize=self._pool_maxsize,
+                pool_recycle=self._pool_recycle,
+                user=self.user,
+                password=self.password,
+                db=self.database,
+                host=self.host,
+                port=self.port,
+                local_infile=self.local_infile,
+            ))
+        try:
+            return await self._pools[loop]
+        except Exception:
+            self._pools.pop(loop, None)
+            raise
+
+    async def _check_health(self, conn: Connection) -> None:
+        """Pings connections that have been idle for a while, reconnecting if the server dropped them."""
+        if asyncio.get_running_loop().time() - conn.last_usage > self._pool_ping_interval:
+            await conn.ping(reconnect=True)
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncGenerator[Connection, Any]:
+        """Yields a connection whose statements are committed together on exit, or rolled back on error."""
+        async with self.create_connection() as conn:
+            await conn.begin()
+            try:
+                yield conn
+            except BaseException:
+                await conn.rollback()
+                raise
+            await conn.commit()
+
+    def transaction_group(self, connection: None | Connection = None) -> DatabaseQuery._TransactionGroupContextManager:
+        return self._TransactionGroupContextManager(self, connection)
+
+    async def _commit(self, cursor: DictCursor, connection: None | Connection) -> None:
+        if connection is None:
+            conn: Connection = cursor.connection  # type: ignore
+            await conn.commit()
 
     async def _execute(self, cursor: DictCursor, sql: str, params: None | tuple[Any, ...] | dict[str, Any] | Mapping[str, Any]= None) -> None:
         decorated = self._retry_decorator(cursor.execute)
@@ -135,11 +224,20 @@ class DatabaseQuery:
     def retries(self) -> int:
         return self._retries
 
+    @property
+    def local_infile(self) -> bool:
+        return self._local_infile
+
+    @property
+    def is_pooled(self) -> bool:
+        return self._pool_maxsize > 0
+
 
     class _TransactionGroupContextManager:
 
-        def __init__(self, parent: DatabaseQuery) -> None:
+        def __init__(self, parent: DatabaseQuery, connection: None | Connection = None) -> None:
             self._parent: DatabaseQuery = parent
+            self._connection = connection
             self._sql: list[tuple[str, None | tuple[Any, ...] | dict[Any, Any]]] = []
 
             self._affectedrows: Future[int] = Future()
@@ -148,14 +246,13 @@ class DatabaseQuery:
             return self
 
         async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
-            async with self._parent.get_cursor() as curs:
+            async with self._parent.get_cursor(self._connection) as curs:
                 for q, p in self._sql:
                     if p:
                         await self._parent._executemany(curs, q, p)
                     else:
                         await self._parent._execute(curs, q)
-                conn: Connection = curs.connection  # type: ignore
-                await conn.commit()
+                await self._parent._commit(curs, self._connection)
                 self._affectedrows.set_result(curs.rowcount or 0)
 
         def add(self, sql: str, params: None | tuple[Any, ...] | dict[Any, Any] = None) -> None:
@@ -1,6 +1,7 @@
 from __future__ import annotations
+from contextlib import asynccontextmanager
 from decimal import Decimal
-from typing import Any, TYPE_CHECKING
+from typing import Any, AsyncGenerator, Callable, TYPE_CHECKING
 
 from . import IFazDbDatabase
 from .repository import (
@@ -18,6 +19,8 @@ from .repository import (
 )
 
 if TYPE_CHECKING:
+    from contextlib import AbstractAsyncContextManager
+    from aiomysql import Connection
     from .. import DatabaseQuery
     from fazdb import Logger
 
@@ -50,6 +53,7 @@ class FazDbDatabase(IFazDbDatabase):
                 self._player_history_repository,
                 self._player_info_repository,
         ]
+        self._rollback_listeners: list[Callable[[], Any]] = []
 
     async def create_all(self) -> None:
         for repo in self._repositories:
@@ -61,6 +65,32 @@ class FazDbDatabase(IFazDbDatabase):
             sum_size += await repo.table_size()
         return sum_size
 
+    async def load_caches(self) -> None:
+        for repo in self._repositories:
+            await repo.load_cache()
+
+    def clear_caches(self) -> None:
+        for repo in self._repositories:
+            repo.clear_cache()
+
+    def add_rollback_listener(self, listener: Callable[[], Any]) -> None:
+        self._rollback_listeners.append(listener)
+
+    def unit_of_work(self) -> AbstractAsyncContextManager[Connection]:
+        return self._unit_of_work()
+
+    @asynccontextmanager
+    async def _unit_of_work(self) -> AsyncGenerator[Connection, Any]:
+        try:
+            async with self.query.transaction() as conn:
+                yield conn
+        except BaseException:
+            # NOTE: Rows the repositories cached as written were rolled back
+            self.clear_caches()
+            for listener in self._rollback_listeners:
+                listener()
+            raise
+
     @property
     def guild_history_repository(self) -> GuildHistoryRepository:
         return self._guild_history_repository
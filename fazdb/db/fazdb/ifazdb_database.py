@@ -1,8 +1,10 @@
 from __future__ import annotations
-from typing import Protocol, TYPE_CHECKING
+from typing import Any, Callable, Protocol, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from contextlib import AbstractAsyncContextManager
     from decimal import Decimal
+    from aiomysql import Connection
     from .. import DatabaseQuery
     from .repository import (
         CharacterInfoRepository,
@@ -24,6 +26,16 @@ class IFazDbDatabase(Protocol):
     implemented by `WynndataDatabase`"""
     async def create_all(self) -> None: ...
     async def total_size(self) -> Decimal: ...
+    async def load_caches(self) -> None:
+        """Warms the repositories' caches of written rows from the database."""
+        ...
+    def clear_caches(self) -> None: ...
+    def add_rollback_listener(self, listener: Callable[[], Any]) -> None:
+        """Calls `listener` when a `unit_of_work` is rolled back, after the repositories' caches are cleared."""
+        ...
+    def unit_of_work(self) -> AbstractAsyncContextManager[Connection]:
+        """Connection to pass to repository calls so they're committed together, once, on exit."""
+        ...
     @property
     def character_history_repository(self) -> CharacterHistoryRepository: ...
     @property
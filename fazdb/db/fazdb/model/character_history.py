@@ -11,6 +11,16 @@ if TYPE_CHECKING:
 class CharacterHistory(UniqueIdMixin):
     """id: `character_uuid`, `datetime`"""
 
+    __slots__ = (
+        "_character_uuid", "_datetime", "_level", "_xp", "_wars", "_playtime", "_mobs_killed", "_chests_found",
+        "_logins", "_deaths", "_discoveries", "_hardcore", "_ultimate_ironman", "_ironman", "_craftsman", "_hunted",
+        "_alchemism", "_armouring", "_cooking", "_jeweling", "_scribing", "_tailoring", "_weaponsmithing",
+        "_woodworking", "_mining", "_woodcutting", "_farming", "_fishing", "_dungeon_completions",
+        "_quest_completions", "_raid_completions"
+    )
+
+    _UNIQUE_ID_LAYOUT = "s" + "q" * 8 + "?" * 5 + "d" * 12 + "q" * 3
+
     def __init__(
         self,
         character_uuid: bytes | UuidColumn,
@@ -3,6 +3,8 @@ from .column import UuidColumn
 
 class CharacterInfo:
 
+    __slots__ = ("_character_uuid", "_uuid", "_type")
+
     def __init__(self, character_uuid: bytes | UuidColumn, uuid: bytes | UuidColumn, type: str) -> None:
         self._character_uuid = character_uuid if isinstance(character_uuid, UuidColumn) else UuidColumn(character_uuid)
         self._uuid = uuid if isinstance(uuid, UuidColumn) else UuidColumn(uuid)
@@ -7,6 +7,8 @@ if TYPE_CHECKING:
 
 class DateColumn:
 
+    __slots__ = ("_datetime",)
+
     _MYSQL_DT_FMT: str = "%Y-%m-%d %H:%M:%S"
 
     def __init__(self, datetime: datetime):
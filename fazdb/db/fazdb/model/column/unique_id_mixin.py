@@ -1,18 +1,225 @@
+from __future__ import annotations
 from abc import ABC
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from functools import lru_cache
 import hashlib
-from typing import Any
+from itertools import chain, repeat
+from operator import itemgetter
+import struct
+from typing import Any, Callable, ClassVar, Iterable, Sequence
 
-from . import UuidColumn
+from . import DateColumn, UuidColumn
 
 
 class UniqueIdMixin(ABC):
-        
+    """Adds a `unique_id` fingerprint of the row's values, used to skip inserting duplicate rows.
+
+    Version 1 SHA-256 hashes the joined `str()` of the values. Version 2 packs the values into the binary layout
+    declared by `_UNIQUE_ID_LAYOUT` and hashes it with BLAKE2b. Rows hashed with different versions never have
+    the same `unique_id`, so switching versions only stops deduplicating against rows inserted before the switch.
+    """
+
+    __slots__ = ("_unique_id",)
+
+    UNIQUE_ID_VERSIONS: ClassVar[tuple[int, ...]] = (1, 2)
+    _unique_id_version: ClassVar[int] = 1
+    _UNIQUE_ID_LAYOUT: ClassVar[None | str] = None
+    """One code per hashed value, see `_V2Layout`. Derived from the value types if None."""
+
     def __init__(self, unique_id: bytes | UuidColumn | None = None, *args: Any) -> None:
-        encoded_variables = ''.join(list(map(str, args))).encode()
-        hashed_variables = hashlib.sha256(encoded_variables).digest()
-        self._unique_id = unique_id if isinstance(unique_id, UuidColumn) else UuidColumn(hashed_variables)
+        if unique_id is None:
+            unique_id = self.compute_unique_id(*args)
+        self._unique_id = unique_id if isinstance(unique_id, UuidColumn) else UuidColumn(unique_id)
+
+    @staticmethod
+    def set_unique_id_version(version: int) -> None:
+        """Sets the version used for every `unique_id` computed afterwards."""
+        if version not in UniqueIdMixin.UNIQUE_ID_VERSIONS:
+            raise ValueError(f"Unknown unique_id version {version}, expected one of {UniqueIdMixin.UNIQUE_ID_VERSIONS}")
+        UniqueIdMixin._unique_id_version = version
+
+    @classmethod
+    def compute_unique_id(cls, *args: Any) -> bytes:
+        """Unique ID of a row made of `args`. Used by code that builds rows without the model, so both hash the same."""
+        return cls.compute_unique_ids((args,))[0]
+
+    @classmethod
+    def compute_unique_ids(cls, rows: Iterable[Sequence[Any]]) -> list[bytes]:
+        """`compute_unique_id` over every row of `rows`. With version 2 and a declared `_UNIQUE_ID_LAYOUT`, the
+        rows are hashed as one batch, see `_V2Layout.hash_many`."""
+        if UniqueIdMixin._unique_id_version == 1:
+            return [hashlib.sha256(''.join(map(str, row)).encode()).digest() for row in rows]
+        rows = rows if isinstance(rows, list) else list(rows)
+        if cls._UNIQUE_ID_LAYOUT is not None:
+            try:
+                return cls._get_v2_layout(cls._UNIQUE_ID_LAYOUT).hash_many(rows)
+            except (struct.error, TypeError):
+                # NOTE: A value doesn't fit its declared code, e.g. None or an int out of the int64 range. The
+                # rows are hashed one by one instead, falling back for the rows that don't fit
+                pass
+        return [cls._compute_v2_unique_id(row) for row in rows]
+
+    @classmethod
+    def compute_unique_ids_from_columns(cls, columns: Sequence[Sequence[Any]]) -> list[bytes]:
+        """`compute_unique_ids` over rows given column by column, e.g. `array.array`s. With version 2 and a declared
+        `_UNIQUE_ID_LAYOUT`, the values are packed straight from the columns, see `_V2Layout.hash_columns`."""
+        if UniqueIdMixin._unique_id_version == 2 and cls._UNIQUE_ID_LAYOUT is not None:
+            try:
+                return cls._get_v2_layout(cls._UNIQUE_ID_LAYOUT).hash_columns(columns)
+            except (struct.error, TypeError):
+                pass
+        return cls.compute_unique_ids(list(zip(*columns)))
+
+    @classmethod
+    def _compute_v2_unique_id(cls, row: Sequence[Any]) -> bytes:
+        layout = cls._get_v2_layout(cls._UNIQUE_ID_LAYOUT or cls._V2Layout.codes_of(row))
+        try:
+            return layout.hash_many((row,))[0]
+        except (struct.error, TypeError):
+            return cls._get_v2_layout("s" * len(row)).hash_many((row,))[0]
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _get_v2_layout(codes: str) -> UniqueIdMixin._V2Layout:
+        return UniqueIdMixin._V2Layout(codes)
+
+    class _V2Layout:
+        """Binary layout of a row, one code per value.
+
+        - `q`: int, `?`: bool, `d`: Decimal or float, packed together with one struct
+        - `t`: datetime or `DateColumn`, packed as microseconds since epoch
+        - `s`: str, bytes, `UuidColumn` or None, appended with their length
+
+        The codes are hashed first, so rows with different layouts never collide.
+        """
+
+        _PERSON = b"fazdb-uid-v2"
+        _EPOCH = datetime(1970, 1, 1)
+        _MICROSECOND = timedelta(microseconds=1)
+        _NONE_LENGTH = (0xFFFFFFFF).to_bytes(4, "little")
+        _BATCH_ROWS = 256
+        """Rows whose fixed-size values are packed with one `struct` call"""
+
+        def __init__(self, codes: str) -> None:
+            self._codes = codes.encode()
+            self._fixed = [i for i, code in enumerate(codes) if code in "q?d"]
+            self._dates = [i for i, code in enumerate(codes) if code == "t"]
+            self._variables = [i for i, code in enumerate(codes) if code == "s"]
+            self._fixed_codes = "".join(codes[i] for i in self._fixed)
+            self._fixed_size = struct.calcsize("<" + self._fixed_codes)
+            self._get_fixed = self._getter(self._fixed)
+            self._get_dates = self._getter(self._dates)
+            self._get_variables = self._getter(self._variables)
+            self._prefix = hashlib.blake2b(self._codes, digest_size=16, person=self._PERSON)
+            """Hash state after the codes, copied for every row"""
+
+        def hash_many(self, rows: Sequence[Sequence[Any]]) -> list[bytes]:
+            """Hashes every row. The fixed-size values and dates of up to `_BATCH_ROWS` rows are packed at once, with
+            a `struct` compiled once per layout and row count, then each row hashes its slice of the packed block."""
+            ret: list[bytes] = []
+            for start in range(0, len(rows), self._BATCH_ROWS):
+                chunk = rows[start:start + self._BATCH_ROWS]
+                ret.extend(self._hash_chunk(
+                        len(chunk),
+                        chain.from_iterable(map(self._get_fixed, chunk)),
+                        chain.from_iterable(map(self._get_dates, chunk)),
+                        map(self._get_variables, chunk)
+                ))
+            return ret
+
+        def hash_columns(self, columns: Sequence[Sequence[Any]]) -> list[bytes]:
+            """Same as `hash_many` over the rows of `columns`, one sequence per value. The fixed-size values and dates
+            are interleaved from their columns into the packed block, without building the rows."""
+            ret: list[bytes] = []
+            row_count = len(columns[0]) if columns else 0
+            for start in range(0, row_count, self._BATCH_ROWS):
+                stop = min(start + self._BATCH_ROWS, row_count)
+                fixed = [columns[i][start:stop] for i in self._fixed]
+                dates = [columns[i][start:stop] for i in self._dates]
+                variables = [columns[i][start:stop] for i in self._variables]
+                ret.extend(self._hash_chunk(
+                        stop - start,
+                        chain.from_iterable(zip(*fixed)),
+                        chain.from_iterable(zip(*dates)),
+                        zip(*variables) if variables else repeat((), stop - start)
+                ))
+            return ret
+
+        def _hash_chunk(
+            self,
+            row_count: int,
+            fixed_values: Iterable[Any],
+            date_values: Iterable[datetime | DateColumn],
+            variables: Iterable[Sequence[Any]]
+        ) -> list[bytes]:
+            # NOTE: struct converts Decimals with `__float__`, so they're never formatted in Python
+            fixed = memoryview(self._get_struct(self._fixed_codes, row_count).pack(*fixed_values))
+            fixed_size = self._fixed_size
+            dates = None
+            dates_size = len(self._dates) * 8
+            if self._dates:
+                dates = memoryview(self._get_struct("q" * len(self._dates), row_count).pack(
+                        *map(self._to_micros, date_values)
+                ))
+
+            ret: list[bytes] = []
+            new = self._prefix.copy
+            for i, row_variables in enumerate(variables):
+                h = new()
+                h.update(fixed[i * fixed_size:(i + 1) * fixed_size])
+                if dates is not None:
+                    h.update(dates[i * dates_size:(i + 1) * dates_size])
+                for value in row_variables:
+                    if value is None:
+                        h.update(self._NONE_LENGTH)
+                        continue
+                    if value.__class__ is UuidColumn:
+                        value = value.uuid
+                    elif value.__class__ is not bytes:
+                        value = str(value).encode()
+                    h.update(len(value).to_bytes(4, "little"))
+                    h.update(value)
+                ret.append(h.digest())
+            return ret
+
+        @staticmethod
+        @lru_cache(maxsize=1024)
+        def _get_struct(codes: str, row_count: int) -> struct.Struct:
+            return struct.Struct("<" + codes * row_count)
+
+        @staticmethod
+        def codes_of(row: Sequence[Any]) -> str:
+            codes: list[str] = []
+            for value in row:
+                if value.__class__ is bool:
+                    codes.append("?")
+                elif value.__class__ is int:
+                    codes.append("q")
+                elif isinstance(value, (Decimal, float)):
+                    codes.append("d")
+                elif isinstance(value, (datetime, DateColumn)):
+                    codes.append("t")
+                else:
+                    codes.append("s")
+            return "".join(codes)
+
+        @classmethod
+        def _to_micros(cls, value: datetime | DateColumn) -> int:
+            dt = value.datetime if isinstance(value, DateColumn) else value
+            if dt.tzinfo is not None:
+                dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+            return (dt - cls._EPOCH) // cls._MICROSECOND
+
+        @staticmethod
+        def _getter(indices: list[int]) -> Callable[[Sequence[Any]], Sequence[Any]]:
+            if len(indices) == 0:
+                return lambda _: ()
+            if len(indices) == 1:
+                index = indices[0]
+                return lambda row: (row[index],)
+            return itemgetter(*indices)
 
     @property
     def unique_id(self) -> UuidColumn:
         return self._unique_id
-
@@ -1,18 +1,21 @@
 from __future__ import annotations
-from uuid import UUID
+
+from fazdb.util.uuid_cache import UuidCache
 
 
 class UuidColumn:
 
+    __slots__ = ("_uuid",)
+
     def __init__(self, uuid_: bytes) -> None:
         self._uuid: bytes = uuid_
 
     @classmethod
     def from_str(cls, uuid: str) -> UuidColumn:
-        return cls(UUID(uuid).bytes)
+        return cls(UuidCache.to_bytes(uuid))
 
     def to_str(self, hypen: bool = True) -> str:
-        return str(UUID(bytes=self._uuid)) if hypen else UUID(bytes=self._uuid).hex
+        return UuidCache.to_str(self._uuid, hypen)
 
     @property
     def uuid(self) -> bytes:
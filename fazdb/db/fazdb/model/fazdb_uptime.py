@@ -9,6 +9,8 @@ if TYPE_CHECKING:
 
 class FazDbUptime:
 
+    __slots__ = ("_start_time", "_stop_time")
+
     def __init__(self, start_time: datetime | DateColumn, stop_time: datetime | DateColumn) -> None:
         self._start_time = start_time if isinstance(start_time, DateColumn) else DateColumn(start_time)
         self._stop_time = stop_time if isinstance(stop_time, DateColumn) else DateColumn(stop_time)
@@ -10,6 +10,10 @@ if TYPE_CHECKING:
 
 class GuildHistory(UniqueIdMixin):
 
+    __slots__ = ("_name", "_datetime", "_level", "_territories", "_wars", "_member_total", "_online_members")
+
+    _UNIQUE_ID_LAYOUT = "sdqqqq"
+
     def __init__(
         self,
         name: str,
@@ -9,6 +9,8 @@ if TYPE_CHECKING:
 
 class GuildInfo:
 
+    __slots__ = ("_uuid", "_name", "_prefix", "_created")
+
     def __init__(
         self,
         uuid: bytes | UuidColumn,
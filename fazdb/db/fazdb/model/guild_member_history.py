@@ -9,6 +9,10 @@ if TYPE_CHECKING:
 
 class GuildMemberHistory(UniqueIdMixin):
 
+    __slots__ = ("_uuid", "_datetime", "_contributed", "_joined")
+
+    _UNIQUE_ID_LAYOUT = "sqt"
+
     def __init__(
         self,
         uuid: bytes | UuidColumn,
@@ -3,6 +3,8 @@ from .column import UuidColumn
 
 class OnlinePlayers:
 
+    __slots__ = ("_uuid", "_server")
+
     def __init__(self, uuid: bytes | UuidColumn, server: str) -> None:
         self._uuid = uuid if isinstance(uuid, UuidColumn) else UuidColumn(uuid)
         self._server = server
@@ -9,6 +9,8 @@ if TYPE_CHECKING:
 
 class PlayerActivityHistory:
 
+    __slots__ = ("_uuid", "_logon_datetime", "_logoff_datetime")
+
     def __init__(
         self,
         uuid: bytes | UuidColumn,
@@ -10,6 +10,10 @@ if TYPE_CHECKING:
 
 class PlayerHistory(UniqueIdMixin):
 
+    __slots__ = ("_uuid", "_datetime", "_username", "_support_rank", "_playtime", "_guild_name", "_guild_rank", "_rank")
+
+    _UNIQUE_ID_LAYOUT = "ssssss"
+
     def __init__(
         self,
         uuid: bytes | UuidColumn,
@@ -9,6 +9,8 @@ if TYPE_CHECKING:
 
 class PlayerInfo:
 
+    __slots__ = ("_uuid", "_latest_username", "_first_join")
+
     def __init__(self, uuid: bytes | UuidColumn, latest_username: str, first_join: datetime | DateColumn) -> None:
         self._uuid = uuid if isinstance(uuid, UuidColumn) else UuidColumn(uuid)
         self._latest_username = latest_username
@@ -1,9 +1,21 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, TYPE_CHECKING
+import asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+from functools import lru_cache
+from io import StringIO
+from itertools import chain, islice
+from operator import itemgetter
+import os
+from tempfile import NamedTemporaryFile
+from typing import Any, Callable, ClassVar, Iterable, Sequence, TYPE_CHECKING
+
+from pymysql.converters import escape_datetime
+
+from fazdb.lru_cache import LruCache
 
 if TYPE_CHECKING:
-    from decimal import Decimal
     from aiomysql import Connection
     from ... import DatabaseQuery
 
@@ -15,8 +27,32 @@ class Repository[T](ABC):
         `Generic[T]`: The type of the entity.
     """
 
+    _COLUMNS: ClassVar[tuple[str, ...]]
+    """Columns written by `insert`, in the order of `_model_to_tuple`."""
+    _BINARY_COLUMNS: ClassVar[tuple[str, ...]] = ()
+    """Columns declared `binary` in `create_table`. `LOAD DATA` sends them hex encoded."""
+    _INSERT_STATEMENT: ClassVar[str] = "INSERT IGNORE"
+    """Verb of the statements made by `insert_rows`, e.g. `INSERT IGNORE` or `REPLACE`."""
+    _UPDATE_COLUMNS: ClassVar[tuple[str, ...]] = ()
+    """Columns set with `ON DUPLICATE KEY UPDATE` by `insert_rows`. Used with an `INSERT` `_INSERT_STATEMENT`.
+    Read from the `new` row alias, which needs MySQL 8.0.19 or later."""
+    _MAX_ALLOWED_PACKET: ClassVar[int] = 4 * 1024 * 1024
+    """Lowest `max_allowed_packet` default across MySQL versions. Bulk insert statements are kept under this."""
+    _LOAD_DATA_THRESHOLD: ClassVar[None | int] = None
+    """Row count from which `INSERT IGNORE` bulk inserts are ingested with `LOAD DATA LOCAL INFILE` instead,
+    if the database allows it. None disables it."""
+    _CACHE_MAXSIZE: ClassVar[int] = 0
+    """Keys whose latest written values are cached. `insert_rows` skips rows whose values are unchanged since.
+    0 disables the cache."""
+    _CACHE_KEY_COLUMNS: ClassVar[tuple[str, ...]] = ()
+    _CACHE_VALUE_COLUMNS: ClassVar[tuple[str, ...]] = ()
+    """Compared to the cached values. If empty, rows of any cached key are skipped."""
+    _CACHE_WARM_WINDOW: ClassVar[timedelta] = timedelta(hours=1)
+    """How far back `load_cache` reads the written rows. Keys not written since start cold."""
+
     def __init__(self, db: DatabaseQuery) -> None:
         self._db = db
+        self._cache: None | LruCache[Any, Any] = LruCache(self._CACHE_MAXSIZE) if self._CACHE_MAXSIZE > 0 else None
 
     async def table_size(self, conn: None | Connection = None) -> Decimal:
         SQL = f"""
@@ -34,13 +70,214 @@ class Repository[T](ABC):
     @abstractmethod
     async def insert(self, entities: Iterable[T], conn: None | Connection = None) -> int: ...
 
+    async def load_cache(self, conn: None | Connection = None) -> None:
+        """Warms the cache of written rows from the table. Repositories that don't override it start cold."""
+
+    def clear_cache(self) -> None:
+        """Forgets the rows recorded as written, e.g. after they were rolled back."""
+        if self._cache is not None:
+            self._cache.clear()
+
     @abstractmethod
     async def create_table(self, conn: None | Connection = None) -> None: ...
 
+    async def insert_rows(self, rows: Iterable[tuple[Any, ...]], conn: None | Connection = None) -> int:
+        """Inserts rows that are already in `_COLUMNS` order, e.g. from `ApiResponseAdapter.Player.to_*_rows`.
+
+        Rows are sent with multi-row `VALUES (...),(...)` statements, chunked to fit `_MAX_ALLOWED_PACKET`. If the
+        repository has a cache, rows already written with the same values are skipped.
+        """
+        rows = list(rows)
+        if self._cache is None:
+            return await self._send_rows(rows, conn)
+
+        cache = self._cache
+        get_key, get_value = self._get_cache_getters(self._COLUMNS, self._CACHE_KEY_COLUMNS, self._CACHE_VALUE_COLUMNS)
+        rows = [row for row in rows if cache.get(get_key(row), _MISSING) != get_value(row)]
+        affected_rows = await self._send_rows(rows, conn)
+        for row in rows:
+            cache.put(get_key(row), get_value(row))
+        return affected_rows
+
+    async def insert_columns(self, columns: Sequence[Sequence[Any]], conn: None | Connection = None) -> int:
+        """Inserts rows given column by column, in `_COLUMNS` order, e.g. from `PlayerResponseBatch`.
+
+        Same as `insert_rows`, but the cache is checked over the key and value columns, and row tuples are only
+        assembled for the rows that changed.
+        """
+        if len(columns) != len(self._COLUMNS):
+            raise ValueError(f"Expected {len(self._COLUMNS)} columns, got {len(columns)}")
+        if self._cache is None:
+            return await self._send_rows(list(zip(*columns)), conn)
+
+        cache = self._cache
+        keys = self._select_columns(columns, self._CACHE_KEY_COLUMNS)
+        # NOTE: Key only, every row of a cached key is skipped
+        values = (
+                self._select_columns(columns, self._CACHE_VALUE_COLUMNS) if self._CACHE_VALUE_COLUMNS
+                else [True] * len(keys)
+        )
+        changed = [i for i, (key, value) in enumerate(zip(keys, values)) if cache.get(key, _MISSING) != value]
+
+        if len(changed) == len(keys):
+            rows = list(zip(*columns))
+        elif len(changed) == 1:
+            rows = [tuple(column[changed[0]] for column in columns)]
+        elif changed:
+            take = itemgetter(*changed)
+            rows = list(zip(*map(take, columns)))
+        else:
+            rows = []
+        affected_rows = await self._send_rows(rows, conn)
+        for i in changed:
+            cache.put(keys[i], values[i])
+        return affected_rows
+
+    def _select_columns(self, columns: Sequence[Sequence[Any]], names: tuple[str, ...]) -> Sequence[Any]:
+        """The column of `names`, or its values zipped to tuples if there are several, as `itemgetter` would."""
+        if len(names) == 1:
+            return columns[self._COLUMNS.index(names[0])]
+        return list(zip(*(columns[self._COLUMNS.index(name)] for name in names)))
+
+    async def _send_rows(self, rows: list[tuple[Any, ...]], conn: None | Connection = None) -> int:
+        statement = self._INSERT_STATEMENT
+        if not rows:
+            return 0
+
+        if (
+            statement == "INSERT IGNORE"
+            and self._LOAD_DATA_THRESHOLD is not None
+            and len(rows) >= self._LOAD_DATA_THRESHOLD
+            and self._db.local_infile
+        ):
+            return await self._load_data(rows, conn)
+
+        chunk_size = self._get_chunk_size(rows[0])
+        affected_rows = 0
+        it = iter(rows)
+        while chunk := tuple(islice(it, chunk_size)):
+            sql = self._get_bulk_insert_sql(statement, self.table_name, self._COLUMNS, len(chunk), self._UPDATE_COLUMNS)
+            affected_rows += await self._db.execute(sql, tuple(chain.from_iterable(chunk)), conn)
+        return affected_rows
+
+    async def _load_data(self, rows: list[tuple[Any, ...]], conn: None | Connection = None) -> int:
+        """Ingests rows with `LOAD DATA LOCAL INFILE ... IGNORE`. Duplicates are skipped by the table's unique keys,
+        same as `INSERT IGNORE`."""
+        # NOTE: Binary columns are sent hex encoded and decoded with UNHEX()
+        binary_columns = frozenset(map(self._COLUMNS.index, self._BINARY_COLUMNS))
+        data = self._to_tsv(rows, binary_columns).encode()
+        sql = self._get_load_data_sql(self.table_name, self._COLUMNS, binary_columns)
+
+        # NOTE: aiomysql reads LOAD DATA LOCAL INFILE from a file name, so the buffer is spilled to a temporary file
+        path = await asyncio.to_thread(self._write_temp_file, data)
+        try:
+            return await self._db.execute(sql, (path,), conn)
+        finally:
+            await asyncio.to_thread(os.remove, path)
+
+    @staticmethod
+    def _to_tsv(rows: list[tuple[Any, ...]], binary_columns: frozenset[int]) -> str:
+        buf = StringIO()
+        for row in rows:
+            fields: list[str] = []
+            for i, value in enumerate(row):
+                if value is None:
+                    fields.append("\\N")
+                elif i in binary_columns:
+                    fields.append(value.hex())
+                elif isinstance(value, bool):
+                    fields.append("1" if value else "0")
+                elif isinstance(value, datetime):
+                    # NOTE: Same converter the INSERT path escapes datetimes with, without the quotes. The
+                    # timezone is dropped, not converted, on both paths
+                    fields.append(escape_datetime(value)[1:-1])
+                elif isinstance(value, bytes):
+                    raise ValueError(f"Bytes in column {i} not declared in _BINARY_COLUMNS")
+                elif isinstance(value, str):
+                    fields.append(value.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n"))
+                else:
+                    fields.append(str(value))
+            buf.write("\t".join(fields))
+            buf.write("\n")
+        return buf.getvalue()
+
+    @staticmethod
+    def _write_temp_file(data: bytes) -> str:
+        with NamedTemporaryFile("wb", prefix="fazdb-", suffix=".tsv", delete=False) as f:
+            f.write(data)
+            return f.name
+
+    @staticmethod
+    def _get_load_data_sql(table_name: str, columns: tuple[str, ...], binary_columns: frozenset[int]) -> str:
+        columns_sql = ", ".join(f"@`{column}`" if i in binary_columns else f"`{column}`" for i, column in enumerate(columns))
+        set_sql = ", ".join(f"`{columns[i]}` = UNHEX(@`{columns[i]}`)" for i in sorted(binary_columns))
+        return (
+            f"LOAD DATA LOCAL INFILE %s IGNORE INTO TABLE `{table_name}` CHARACTER SET utf8mb4"
+            " FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' LINES TERMINATED BY '\\n'"
+            f" ({columns_sql})" + (f" SET {set_sql}" if set_sql else "")
+        )
+
+    @classmethod
+    def _get_chunk_size(cls, row: tuple[Any, ...]) -> int:
+        # NOTE: Estimated from one row, with 2x headroom for rows with longer strings
+        return max(cls._MAX_ALLOWED_PACKET // (cls._estimate_row_size(row) * 2), 1)
+
+    @staticmethod
+    def _estimate_row_size(row: tuple[Any, ...]) -> int:
+        """Upper estimate of a row's size in the statement, in bytes."""
+        size = 3  # "(", ")" and ","
+        for value in row:
+            if isinstance(value, (str, bytes)):
+                size += len(value) * 2 + 10  # worst case escaping, quotes and _binary prefix
+            elif isinstance(value, (datetime, Decimal)):
+                size += 30
+            else:
+                size += 22
+            size += 1
+        return size
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _get_bulk_insert_sql(
+        statement: str,
+        table_name: str,
+        columns: tuple[str, ...],
+        row_count: int,
+        update_columns: tuple[str, ...] = ()
+    ) -> str:
+        columns_sql = ", ".join(f"`{column}`" for column in columns)
+        row_sql = f"({', '.join(['%s'] * len(columns))})"
+        sql = f"{statement} INTO `{table_name}` ({columns_sql}) VALUES {', '.join([row_sql] * row_count)}"
+        if update_columns:
+            # NOTE: VALUES() in ON DUPLICATE KEY UPDATE is deprecated since MySQL 8.0.20
+            sql += " AS new ON DUPLICATE KEY UPDATE " + ", ".join(
+                    f"`{column}` = new.`{column}`" for column in update_columns
+            )
+        return sql
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _get_cache_getters(
+        columns: tuple[str, ...],
+        key_columns: tuple[str, ...],
+        value_columns: tuple[str, ...]
+    ) -> tuple[Callable[[tuple[Any, ...]], Any], Callable[[tuple[Any, ...]], Any]]:
+        get_key = itemgetter(*map(columns.index, key_columns))
+        # NOTE: Key only, every row of a cached key is skipped
+        get_value = itemgetter(*map(columns.index, value_columns)) if value_columns else lambda _: True
+        return get_key, get_value
+
+    @classmethod
+    def _model_to_dict(cls, entity: T) -> dict[str, Any]:
+        return dict(zip(cls._COLUMNS, cls._model_to_tuple(entity)))
+
     @staticmethod
     @abstractmethod
-    def _model_to_dict(entity: T) -> dict[str, Any]: ...
+    def _model_to_tuple(entity: T) -> tuple[Any, ...]: ...
 
     @property
     @abstractmethod
     def table_name(self) -> str: ...
+
+
+_MISSING = object()
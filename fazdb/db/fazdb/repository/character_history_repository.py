@@ -1,4 +1,5 @@
 from __future__ import annotations
+from datetime import datetime
 from typing import Any, Iterable, TYPE_CHECKING
 
 from . import Repository
@@ -11,25 +12,46 @@ if TYPE_CHECKING:
 class CharacterHistoryRepository(Repository[CharacterHistory]):
 
     _TABLE_NAME: str = "character_history"
+    _LOAD_DATA_THRESHOLD = 1000
+    _COLUMNS = (
+            "character_uuid", "level", "xp", "wars", "playtime", "mobs_killed", "chests_found", "logins",
+            "deaths", "discoveries", "hardcore", "ultimate_ironman", "ironman", "craftsman", "hunted",
+            "alchemism", "armouring", "cooking", "jeweling", "scribing", "tailoring", "weaponsmithing",
+            "woodworking", "mining", "woodcutting", "farming", "fishing", "dungeon_completions",
+            "quest_completions", "raid_completions", "datetime", "unique_id"
+    )
+    _BINARY_COLUMNS = ("character_uuid", "unique_id")
+    _CACHE_MAXSIZE = 65536
+    """Sized above the characters of the peak online players."""
+    # NOTE: A character whose latest unique_id is unchanged is skipped. INSERT IGNORE would discard it anyway.
+    _CACHE_KEY_COLUMNS = ("character_uuid",)
+    _CACHE_VALUE_COLUMNS = ("unique_id",)
 
     async def insert(self, entities: Iterable[CharacterHistory], conn: None | Connection = None) -> int:
+        return await self.insert_rows(map(self._model_to_tuple, entities), conn)
+
+    async def load_cache(self, conn: None | Connection = None) -> None:
+        """Caches the `unique_id` of the latest row of the characters updated within `_CACHE_WARM_WINDOW`."""
         SQL = f"""
-            INSERT IGNORE INTO `{self.table_name}` (
-                `character_uuid`, `level`, `xp`, `wars`, `playtime`, `mobs_killed`, `chests_found`, `logins`,
-                `deaths`, `discoveries`, `hardcore`, `ultimate_ironman`, `ironman`, `craftsman`, `hunted`,
-                `alchemism`, `armouring`, `cooking`, `jeweling`, `scribing`, `tailoring`, `weaponsmithing`,
-                `woodworking`, `mining`, `woodcutting`, `farming`, `fishing`, `dungeon_completions`, 
-                `quest_completions`, `raid_completions`, `datetime`, `unique_id`
-            )
-            VALUES (
-                %(character_uuid)s, %(level)s, %(xp)s, %(wars)s, %(playtime)s, %(mobs_killed)s, %(chests_found)s, %(logins)s,
-                %(deaths)s, %(discoveries)s, %(hardcore)s, %(ultimate_ironman)s, %(ironman)s, %(craftsman)s, %(hunted)s,
-                %(alchemism)s, %(armouring)s, %(cooking)s, %(jeweling)s, %(scribing)s, %(tailoring)s, %(weaponsmithing)s,
-                %(woodworking)s, %(mining)s, %(woodcutting)s, %(farming)s, %(fishing)s, %(dungeon_completions)s, 
-                %(quest_completions)s, %(raid_completions)s, %(datetime)s, %(unique_id)s
-            )
+            SELECT
+                h.`character_uuid`, h.`unique_id`
+            FROM
+                `{self.table_name}` h
+                JOIN (
+                    SELECT `character_uuid`, MAX(`datetime`) AS `datetime`
+                    FROM `{self.table_name}`
+                    WHERE `datetime` >= %s
+                    GROUP BY `character_uuid`
+                    ORDER BY `datetime` DESC
+                    LIMIT %s
+                ) latest ON h.`character_uuid` = latest.`character_uuid` AND h.`datetime` = latest.`datetime`
+            ORDER BY h.`datetime`
         """
-        return await self._db.execute_many(SQL, tuple(self._model_to_dict(entity) for entity in entities), conn)
+        assert self._cache is not None
+        res = await self._db.fetch(SQL, (datetime.now() - self._CACHE_WARM_WINDOW, self._cache.maxsize), conn)
+        # NOTE: Oldest first, so the most recently updated characters are the last to be evicted
+        for row in res:
+            self._cache.put(row["character_uuid"], row["unique_id"])
 
     async def create_table(self, conn: None | Connection = None) -> None:
         SQL = f"""
@@ -73,41 +95,41 @@ class CharacterHistoryRepository(Repository[CharacterHistory]):
         await self._db.execute(SQL, connection=conn)
 
     @staticmethod
-    def _model_to_dict(entity: CharacterHistory) -> dict[str, Any]:
-        return {
-            "character_uuid": entity.character_uuid.uuid,
-            "level": entity.level,
-            "xp": entity.xp,
-            "wars": entity.wars,
-            "playtime": entity.playtime,
-            "mobs_killed": entity.mobs_killed,
-            "chests_found": entity.chests_found,
-            "logins": entity.logins,
-            "deaths": entity.deaths,
-            "discoveries": entity.discoveries,
-            "alchemism": entity.alchemism,
-            "hardcore": entity.hardcore,
-            "ultimate_ironman": entity.ultimate_ironman,
-            "ironman": entity.ironman,
-            "craftsman": entity.craftsman,
-            "hunted": entity.hunted,
-            "armouring": entity.armouring,
-            "cooking": entity.cooking,
-            "jeweling": entity.jeweling,
-            "scribing": entity.scribing,
-            "tailoring": entity.tailoring,
-            "weaponsmithing": entity.weaponsmithing,
-            "woodworking": entity.woodworking,
-            "mining": entity.mining,
-            "woodcutting": entity.woodcutting,
-            "farming": entity.farming,
-            "fishing": entity.fishing,
-            "dungeon_completions": entity.dungeon_completions,
-            "quest_completions": entity.quest_completions,
-            "raid_completions": entity.raid_completions,
-            "datetime": entity.datetime.datetime,
-            "unique_id": entity.unique_id.uuid
-        }
+    def _model_to_tuple(entity: CharacterHistory) -> tuple[Any, ...]:
+        return (
+            entity.character_uuid.uuid,
+            entity.level,
+            entity.xp,
+            entity.wars,
+            entity.playtime,
+            entity.mobs_killed,
+            entity.chests_found,
+            entity.logins,
+            entity.deaths,
+            entity.discoveries,
+            entity.hardcore,
+            entity.ultimate_ironman,
+            entity.ironman,
+            entity.craftsman,
+            entity.hunted,
+            entity.alchemism,
+            entity.armouring,
+            entity.cooking,
+            entity.jeweling,
+            entity.scribing,
+            entity.tailoring,
+            entity.weaponsmithing,
+            entity.woodworking,
+            entity.mining,
+            entity.woodcutting,
+            entity.farming,
+            entity.fishing,
+            entity.dungeon_completions,
+            entity.quest_completions,
+            entity.raid_completions,
+            entity.datetime.datetime,
+            entity.unique_id.uuid
+        )
 
     @property
     def table_name(self) -> str:
@@ -11,14 +11,15 @@ if TYPE_CHECKING:
 class CharacterInfoRepository(Repository[CharacterInfo]):
 
     _TABLE_NAME: str = "character_info"
+    _COLUMNS = ("character_uuid", "uuid", "type")
+    _BINARY_COLUMNS = ("character_uuid", "uuid")
+    _CACHE_MAXSIZE = 65536
+    # NOTE: INSERT IGNORE never changes an existing row, so only characters not yet written are sent
+    _CACHE_KEY_COLUMNS = ("character_uuid",)
 
     async def insert(self, entities: Iterable[CharacterInfo], conn: None | Connection = None) -> int:
         # NOTE: This doesn't change. Ignore duplicates.
-        SQL = f"""
-            INSERT IGNORE INTO `{self.table_name}` (`character_uuid`, `uuid`, `type`)
-            VALUES (%(character_uuid)s, %(uuid)s, %(type)s)
-        """
-        return await self._db.execute_many(SQL, tuple(self._model_to_dict(entity) for entity in entities), conn)
+        return await self.insert_rows(map(self._model_to_tuple, entities), conn)
 
     async def create_table(self, conn: None | Connection = None) -> None:
         SQL = f"""
@@ -32,12 +33,12 @@ class CharacterInfoRepository(Repository[CharacterInfo]):
         await self._db.execute(SQL)
 
     @staticmethod
-    def _model_to_dict(entity: CharacterInfo) -> dict[str, Any]:
-        return {
-            "character_uuid": entity.character_uuid.uuid,
-            "uuid": entity.uuid.uuid,
-            "type": entity.type
-        }
+    def _model_to_tuple(entity: CharacterInfo) -> tuple[Any, ...]:
+        return (
+            entity.character_uuid.uuid,
+            entity.uuid.uuid,
+            entity.type
+        )
 
     @property
     def table_name(self) -> str:
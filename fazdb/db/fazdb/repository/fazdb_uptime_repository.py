@@ -11,13 +11,11 @@ if TYPE_CHECKING:
 class FazDbUptimeRepository(Repository[FazDbUptime]):
 
     _TABLE_NAME: str = "kans_uptime"
+    _INSERT_STATEMENT = "REPLACE"
+    _COLUMNS = ("start_time", "stop_time")
 
     async def insert(self, entities: Iterable[FazDbUptime], conn: None | Connection = None) -> int:
-        SQL = f"""
-            REPLACE INTO `{self.table_name}` (`start_time`, `stop_time`)
-            VALUES (%(start_time)s, %(stop_time)s)
-        """
-        return await self._db.execute_many(SQL, tuple(self._model_to_dict(entity) for entity in entities), conn)
+        return await self.insert_rows(map(self._model_to_tuple, entities), conn)
 
     async def create_table(self, conn: None | Connection = None) -> None:
         SQL = f"""
@@ -30,11 +28,11 @@ class FazDbUptimeRepository(Repository[FazDbUptime]):
         await self._db.execute(SQL, connection=conn)
 
     @staticmethod
-    def _model_to_dict(entity: FazDbUptime) -> dict[str, Any]:
-        return {
-            "start_time": entity.start_time.datetime,
-            "stop_time": entity.stop_time.datetime
-        }
+    def _model_to_tuple(entity: FazDbUptime) -> tuple[Any, ...]:
+        return (
+            entity.start_time.datetime,
+            entity.stop_time.datetime
+        )
 
     @property
     def table_name(self) -> str:
@@ -11,15 +11,11 @@ if TYPE_CHECKING:
 class GuildHistoryRepository(Repository[GuildHistory]):
 
     _TABLE_NAME: str = "guild_history"
+    _COLUMNS = ("name", "level", "territories", "wars", "member_total", "online_members", "datetime", "unique_id")
+    _BINARY_COLUMNS = ("unique_id",)
 
     async def insert(self, entities: Iterable[GuildHistory], conn: None | Connection = None) -> int:
-        SQL = f"""
-            INSERT IGNORE INTO `{self.table_name}`
-                (`name`, `level`, `territories`, `wars`, `member_total`, `online_members`, `datetime`, `unique_id`)
-            VALUES
-                (%(name)s, %(level)s, %(territories)s, %(wars)s, %(member_total)s, %(online_members)s, %(datetime)s, %(unique_id)s)
-        """
-        return await self._db.execute_many(SQL, tuple(self._model_to_dict(entity) for entity in entities), conn)
+        return await self.insert_rows(map(self._model_to_tuple, entities), conn)
 
     async def create_table(self, conn: None | Connection = None) -> None:
         SQL = f"""
@@ -39,17 +35,17 @@ class GuildHistoryRepository(Repository[GuildHistory]):
         await self._db.execute(SQL)
 
     @staticmethod
-    def _model_to_dict(entity: GuildHistory) -> dict[str, Any]:
-        return {
-            "name": entity.name,
-            "level": entity.level,
-            "territories": entity.territories,
-            "wars": entity.wars,
-            "member_total": entity.member_total,
-            "online_members": entity.online_members,
-            "datetime": entity.datetime.datetime,
-            "unique_id": entity.unique_id.uuid
-        }
+    def _model_to_tuple(entity: GuildHistory) -> tuple[Any, ...]:
+        return (
+            entity.name,
+            entity.level,
+            entity.territories,
+            entity.wars,
+            entity.member_total,
+            entity.online_members,
+            entity.datetime.datetime,
+            entity.unique_id.uuid
+        )
 
 
     @property
@@ -11,14 +11,15 @@ if TYPE_CHECKING:
 class GuildInfoRepository(Repository[GuildInfo]):
 
     _TABLE_NAME: str = "guild_info"
+    _COLUMNS = ("uuid", "name", "prefix", "created")
+    _BINARY_COLUMNS = ("uuid",)
+    _CACHE_MAXSIZE = 8192
+    # NOTE: INSERT IGNORE never changes an existing row, so only guilds not yet written are sent
+    _CACHE_KEY_COLUMNS = ("name",)
 
     async def insert(self, entities: Iterable[GuildInfo], conn: None | Connection = None) -> int:
         # NOTE: This doesn't change. Ignore duplicates.
-        SQL = f"""
-            INSERT IGNORE INTO `{self.table_name}` (`uuid`, `name`, `prefix`, `created`)
-            VALUES (%(uuid)s, %(name)s, %(prefix)s, %(created)s)
-        """
-        return await self._db.execute_many(SQL, (self._model_to_dict(entity) for entity in entities), conn)
+        return await self.insert_rows(map(self._model_to_tuple, entities), conn)
 
     async def create_table(self, conn: None | Connection = None) -> None:
         SQL = f"""
@@ -33,13 +34,13 @@ class GuildInfoRepository(Repository[GuildInfo]):
         await self._db.execute(SQL)
 
     @staticmethod
-    def _model_to_dict(entity: GuildInfo) -> dict[str, Any]:
-        return {
-            "uuid": entity.uuid.uuid,
-            "name": entity.name,
-            "prefix": entity.prefix,
-            "created": entity.created.datetime
-        }
+    def _model_to_tuple(entity: GuildInfo) -> tuple[Any, ...]:
+        return (
+            entity.uuid.uuid,
+            entity.name,
+            entity.prefix,
+            entity.created.datetime
+        )
 
     @property
     def table_name(self) -> str:
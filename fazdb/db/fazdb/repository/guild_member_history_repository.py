@@ -11,15 +11,12 @@ if TYPE_CHECKING:
 class GuildMemberHistoryRepository(Repository[GuildMemberHistory]):
 
     _TABLE_NAME: str = "guild_member_history"
+    _LOAD_DATA_THRESHOLD = 1000
+    _COLUMNS = ("uuid", "contributed", "joined", "datetime", "unique_id")
+    _BINARY_COLUMNS = ("uuid", "unique_id")
 
     async def insert(self, entities: Iterable[GuildMemberHistory], conn: None | Connection = None) -> int:
-        SQL = f"""
-            INSERT IGNORE INTO `{self.table_name}`
-                (`uuid`, `contributed`, `joined`, `datetime`, `unique_id`)
-            VALUES
-                (%(uuid)s, %(contributed)s, %(joined)s, %(datetime)s, %(unique_id)s)
-        """
-        return await self._db.execute_many(SQL, tuple(self._model_to_dict(entity) for entity in entities), conn)
+        return await self.insert_rows(map(self._model_to_tuple, entities), conn)
 
     async def create_table(self, conn: None | Connection = None) -> None:
         SQL = f"""
@@ -36,14 +33,14 @@ class GuildMemberHistoryRepository(Repository[GuildMemberHistory]):
         await self._db.execute(SQL, connection=conn)
 
     @staticmethod
-    def _model_to_dict(entity: GuildMemberHistory) -> dict[str, Any]:
-        return {
-            "uuid": entity.uuid.uuid,
-            "contributed": entity.contributed,
-            "joined": entity.joined.datetime,
-            "datetime": entity.datetime.datetime,
-            "unique_id": entity.unique_id.uuid
-        }
+    def _model_to_tuple(entity: GuildMemberHistory) -> tuple[Any, ...]:
+        return (
+            entity.uuid.uuid,
+            entity.contributed,
+            entity.joined.datetime,
+            entity.datetime.datetime,
+            entity.unique_id.uuid
+        )
 
     @property
     def table_name(self) -> str:
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from itertools import batched
 from typing import Iterable, TYPE_CHECKING, Any
 
 from . import Repository
@@ -6,21 +7,84 @@ from ..model import OnlinePlayers
 
 if TYPE_CHECKING:
     from aiomysql import Connection
+    from ... import DatabaseQuery
 
 
 class OnlinePlayersRepository(Repository[OnlinePlayers]):
+    """Keeps `online_players` equal to the latest online players.
+
+    The table is rewritten on the first insert, then only changes are written: logged off players are deleted,
+    logged on players inserted, and players that changed server updated. If the affected row counts show the
+    table drifted from the last written players, it's rewritten again.
+    """
 
     _TABLE_NAME: str = "online_players"
+    _INSERT_STATEMENT = "REPLACE"
+    _COLUMNS = ("uuid", "server")
+    _BINARY_COLUMNS = ("uuid",)
+    _IN_CHUNK_SIZE = 1000
+    """UUIDs per `IN (...)` list of the delete and update statements."""
+
+    def __init__(self, db: DatabaseQuery) -> None:
+        super().__init__(db)
+        self._servers: None | dict[bytes, str] = None
+        """uuid: server of the rows last written to the table. None if the table's rows are unknown."""
 
     async def insert(self, entities: Iterable[OnlinePlayers], conn: None | Connection = None) -> int:
-        async with self._db.transaction_group() as tg:
-            tg.add(f"DELETE FROM `{self.table_name}` WHERE `uuid` IS NOT NULL")
-            tg.add(
-                    f"REPLACE INTO `{self.table_name}` (`uuid`, `server`) VALUES (%(uuid)s, %(server)s)",
-                    tuple(self._model_to_dict(entity) for entity in entities)
+        servers = {entity.uuid.uuid: entity.server for entity in entities}
+        if conn is None:
+            async with self._db.transaction() as conn:
+                return await self._write(servers, conn)
+        return await self._write(servers, conn)
+
+    def clear_cache(self) -> None:
+        # NOTE: Rewrites the table on the next insert
+        self._servers = None
+
+    async def _write(self, servers: dict[bytes, str], conn: Connection) -> int:
+        affected_rows = None
+        if self._servers is not None:
+            affected_rows = await self._write_changes(self._servers, servers, conn)
+        if affected_rows is None:
+            affected_rows = await self._rewrite(servers, conn)
+        self._servers = servers
+        return affected_rows
+
+    async def _rewrite(self, servers: dict[bytes, str], conn: Connection) -> int:
+        affected_rows = await self._db.execute(f"DELETE FROM `{self.table_name}` WHERE `uuid` IS NOT NULL", None, conn)
+        return affected_rows + await self.insert_rows(servers.items(), conn)
+
+    async def _write_changes(self, old: dict[bytes, str], new: dict[bytes, str], conn: Connection) -> None | int:
+        """Writes the difference between `old` and `new`. Returns None if the table didn't match `old`."""
+        logged_off = [uuid for uuid in old if uuid not in new]
+        logged_on: list[tuple[bytes, str]] = []
+        moved: dict[str, list[bytes]] = {}
+        """server: uuids that moved to it"""
+        for uuid, server in new.items():
+            old_server = old.get(uuid)
+            if old_server is None:
+                logged_on.append((uuid, server))
+            elif old_server != server:
+                moved.setdefault(server, []).append(uuid)
+
+        affected_rows = 0
+        for chunk in batched(logged_off, self._IN_CHUNK_SIZE):
+            affected_rows += await self._db.execute(
+                    f"DELETE FROM `{self.table_name}` WHERE `uuid` IN ({', '.join(['%s'] * len(chunk))})", chunk, conn
             )
-            affected_rows = tg.get_future_affectedrows()
-        return affected_rows.result()
+        # NOTE: REPLACE counts 2 rows if the player was already in the table, which is detected as drift
+        affected_rows += await self.insert_rows(logged_on, conn)
+        for server, uuids in moved.items():
+            for chunk in batched(uuids, self._IN_CHUNK_SIZE):
+                affected_rows += await self._db.execute(
+                        f"UPDATE `{self.table_name}` SET `server` = %s"
+                        f" WHERE `uuid` IN ({', '.join(['%s'] * len(chunk))})",
+                        (server, *chunk),
+                        conn
+                )
+
+        expected_rows = len(logged_off) + len(logged_on) + sum(map(len, moved.values()))
+        return affected_rows if affected_rows == expected_rows else None
 
     async def create_table(self, conn: None | Connection = None) -> None:
         SQL = f"""
@@ -33,11 +97,11 @@ class OnlinePlayersRepository(Repository[OnlinePlayers]):
         await self._db.execute(SQL)
 
     @staticmethod
-    def _model_to_dict(entity: OnlinePlayers) -> dict[str, Any]:
-        return {
-            "uuid": entity.uuid.uuid,
-            "server": entity.server
-        }
+    def _model_to_tuple(entity: OnlinePlayers) -> tuple[Any, ...]:
+        return (
+            entity.uuid.uuid,
+            entity.server
+        )
 
     @property
     def table_name(self) -> str:
@@ -1,23 +1,42 @@
 from __future__ import annotations
+from itertools import batched, chain
 from typing import Any, Iterable, TYPE_CHECKING
 
 from . import Repository
 from ..model import PlayerActivityHistory
 
 if TYPE_CHECKING:
+    from datetime import datetime
     from aiomysql import Connection
 
 
 class PlayerActivityHistoryRepository(Repository[PlayerActivityHistory]):
 
     _TABLE_NAME: str = "player_activity_history"
+    _INSERT_STATEMENT = "REPLACE"
+    _COLUMNS = ("uuid", "logon_datetime", "logoff_datetime")
+    _BINARY_COLUMNS = ("uuid",)
+    _UPDATE_CHUNK_SIZE = 1000
+    """Sessions per `IN (...)` list of `update_logoff_datetime`."""
 
     async def insert(self, entities: Iterable[PlayerActivityHistory], conn: None | Connection = None) -> int:
-        SQL = f"""
-            REPLACE INTO `{self.table_name}` (`uuid`, `logon_datetime`, `logoff_datetime`)
-            VALUES (%(uuid)s, %(logon_datetime)s, %(logoff_datetime)s)
-        """
-        return await self._db.execute_many(SQL, tuple(self._model_to_dict(entity) for entity in entities), conn)
+        return await self.insert_rows(map(self._model_to_tuple, entities), conn)
+
+    async def update_logoff_datetime(
+        self,
+        sessions: Iterable[tuple[bytes, datetime]],
+        logoff_datetime: datetime,
+        conn: None | Connection = None
+    ) -> int:
+        """Sets the `logoff_datetime` of the rows of `sessions`, given as (uuid, logon_datetime) pairs."""
+        affected_rows = 0
+        for chunk in batched(sessions, self._UPDATE_CHUNK_SIZE):
+            sql = (
+                f"UPDATE `{self.table_name}` SET `logoff_datetime` = %s"
+                f" WHERE (`uuid`, `logon_datetime`) IN ({', '.join(['(%s, %s)'] * len(chunk))})"
+            )
+            affected_rows += await self._db.execute(sql, (logoff_datetime, *chain.from_iterable(chunk)), conn)
+        return affected_rows
 
     async def create_table(self, conn: None | Connection = None) -> None:
         SQL = f"""
@@ -32,12 +51,12 @@ class PlayerActivityHistoryRepository(Repository[PlayerActivityHistory]):
         await self._db.execute(SQL)
 
     @staticmethod
-    def _model_to_dict(entity: PlayerActivityHistory) -> dict[str, Any]:
-        return {
-            "uuid": entity.uuid.uuid,
-            "logon_datetime": entity.logon_datetime.datetime,
-            "logoff_datetime": entity.logoff_datetime.datetime,
-        }
+    def _model_to_tuple(entity: PlayerActivityHistory) -> tuple[Any, ...]:
+        return (
+            entity.uuid.uuid,
+            entity.logon_datetime.datetime,
+            entity.logoff_datetime.datetime
+        )
 
     @property
     def table_name(self) -> str:
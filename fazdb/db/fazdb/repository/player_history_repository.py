@@ -11,15 +11,15 @@ if TYPE_CHECKING:
 class PlayerHistoryRepository(Repository[PlayerHistory]):
 
     _TABLE_NAME: str = "player_history"
+    _LOAD_DATA_THRESHOLD = 1000
+    _COLUMNS = (
+            "uuid", "username", "support_rank", "playtime", "guild_name", "guild_rank", "rank", "datetime",
+            "unique_id"
+    )
+    _BINARY_COLUMNS = ("uuid", "unique_id")
 
     async def insert(self, entities: Iterable[PlayerHistory], conn: None | Connection = None) -> int:
-        SQL = f"""
-            INSERT IGNORE INTO `{self.table_name}`
-                (`uuid`, `username`, `support_rank`, `playtime`, `guild_name`, `guild_rank`, `rank`, `datetime`, `unique_id`)
-            VALUES
-                (%(uuid)s, %(username)s, %(support_rank)s, %(playtime)s, %(guild_name)s, %(guild_rank)s, %(rank)s, %(datetime)s, %(unique_id)s)
-        """
-        return await self._db.execute_many(SQL, tuple(self._model_to_dict(entity) for entity in entities), conn)
+        return await self.insert_rows(map(self._model_to_tuple, entities), conn)
 
     async def create_table(self, conn: None | Connection = None) -> None:
         SQL = f"""
@@ -40,18 +40,18 @@ class PlayerHistoryRepository(Repository[PlayerHistory]):
         await self._db.execute(SQL)
 
     @staticmethod
-    def _model_to_dict(entity: PlayerHistory) -> dict[str, Any]:
-        return {
-            "uuid": entity.uuid.uuid,
-            "username": entity.username,
-            "support_rank": entity.support_rank,
-            "playtime": entity.playtime,
-            "guild_name": entity.guild_name,
-            "guild_rank": entity.guild_rank,
-            "rank": entity.rank,
-            "datetime": entity.datetime.datetime,
-            "unique_id": entity.unique_id.uuid
-        }
+    def _model_to_tuple(entity: PlayerHistory) -> tuple[Any, ...]:
+        return (
+            entity.uuid.uuid,
+            entity.username,
+            entity.support_rank,
+            entity.playtime,
+            entity.guild_name,
+            entity.guild_rank,
+            entity.rank,
+            entity.datetime.datetime,
+            entity.unique_id.uuid
+        )
 
     @property
     def table_name(self) -> str:
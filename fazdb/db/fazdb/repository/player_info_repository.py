@@ -11,13 +11,33 @@ if TYPE_CHECKING:
 class PlayerInfoRepository(Repository[PlayerInfo]):
 
     _TABLE_NAME: str = "player_info"
+    _INSERT_STATEMENT = "INSERT"
+    _UPDATE_COLUMNS = ("latest_username", "first_join")
+    _COLUMNS = ("uuid", "latest_username", "first_join")
+    _BINARY_COLUMNS = ("uuid",)
+    _CACHE_MAXSIZE = 32768
+    """Sized above the peak online player count."""
+    # NOTE: Only new players and changed usernames are written, with an upsert instead of REPLACE's delete and insert
+    _CACHE_KEY_COLUMNS = ("uuid",)
+    _CACHE_VALUE_COLUMNS = ("latest_username", "first_join")
 
     async def insert(self, entities: Iterable[PlayerInfo], conn: None | Connection = None) -> int:
+        return await self.insert_rows(map(self._model_to_tuple, entities), conn)
+
+    async def load_cache(self, conn: None | Connection = None) -> None:
+        """Caches the rows of the players in `online_players`, who are the next to be written."""
         SQL = f"""
-            REPLACE INTO `{self.table_name}` (`uuid`, `latest_username`, `first_join`)
-            VALUES (%(uuid)s, %(latest_username)s, %(first_join)s)
+            SELECT
+                i.`uuid`, i.`latest_username`, i.`first_join`
+            FROM
+                `online_players` o
+                JOIN `{self.table_name}` i ON i.`uuid` = o.`uuid`
+            LIMIT %s
         """
-        return await self._db.execute_many(SQL, tuple(self._model_to_dict(entity) for entity in entities), conn)
+        assert self._cache is not None
+        res = await self._db.fetch(SQL, (self._cache.maxsize,), conn)
+        for row in res:
+            self._cache.put(row["uuid"], (row["latest_username"], row["first_join"]))
 
     async def create_table(self, conn: None | Connection = None) -> None:
         SQL = f"""
@@ -31,12 +51,12 @@ class PlayerInfoRepository(Repository[PlayerInfo]):
         await self._db.execute(SQL)
 
     @staticmethod
-    def _model_to_dict(entity: PlayerInfo) -> dict[str, Any]:
-        return {
-            "uuid": entity.uuid.uuid,
-            "latest_username": entity.latest_username,
-            "first_join": entity.first_join.datetime
-        }
+    def _model_to_tuple(entity: PlayerInfo) -> tuple[Any, ...]:
+        return (
+            entity.uuid.uuid,
+            entity.latest_username,
+            entity.first_join.datetime
+        )
 
     @property
     def table_name(self) -> str:
@@ -1,4 +1,5 @@
 # type: ignore
 from .heartbeat_task import HeartbeatTask
 from .heartbeat import Heartbeat
-from .simple_heartbeat import SimpleHeartbeat
\ No newline at end of file
+from .simple_heartbeat import SimpleHeartbeat
+from .async_heartbeat import AsyncHeartbeat
@@ -0,0 +1,80 @@
+from __future__ import annotations
+import asyncio
+from contextlib import suppress
+from threading import Thread
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from . import Heartbeat
+from .task import TaskFactory
+
+if TYPE_CHECKING:
+    from .task import Task
+    from fazdb import Api, Database, Logger
+
+
+class AsyncHeartbeat(Thread, Heartbeat):
+    """Runs every task as a long-lived coroutine on a single event loop, in one thread.
+
+    Unlike `SimpleHeartbeat`, the event loop keeps running between task runs, so in-flight requests
+    make progress continuously.
+    """
+
+    def __init__(self, api: Api, db: Database, logger: Logger) -> None:
+        super().__init__(daemon=True)
+        self._logger = logger
+
+        self._event_loop = asyncio.new_event_loop()
+        self._tasks: list[Task] = []
+        self._main_task: None | asyncio.Task[None] = None
+        """`_run`, cancelled by `stop`"""
+
+        for task in TaskFactory.create_all(api, db, logger, continuous=True):
+            self._add_task(task)
+
+    def start(self) -> None:
+        super().start()
+
+    def stop(self) -> None:
+        if not self.is_alive():
+            return
+        self._event_loop.call_soon_threadsafe(self._cancel_main_task)
+        self.join()
+
+    def run(self) -> None:
+        asyncio.set_event_loop(self._event_loop)
+        self._main_task = self._event_loop.create_task(self._run())
+        try:
+            with suppress(asyncio.CancelledError):
+                self._event_loop.run_until_complete(self._main_task)
+        finally:
+            self._event_loop.close()
+
+    async def _run(self) -> None:
+        # NOTE: Cancelled at any point, including during setup. Only the tasks that were set up are torn down.
+        set_up: list[Task] = []
+        try:
+            for task in self._tasks:
+                await task.async_setup()
+                set_up.append(task)
+
+            running_tasks = [asyncio.create_task(self._run_task(task), name=task.name) for task in self._tasks]
+            await asyncio.gather(*running_tasks, return_exceptions=True)
+        finally:
+            for task in set_up:
+                await task.async_teardown()
+
+    async def _run_task(self, task: Task) -> None:
+        await asyncio.sleep(task.first_delay)
+        while True:
+            t1 = perf_counter()
+            await task.async_run()
+            self._logger.console.success(f"Task {task.name} took {perf_counter() - t1:.2f} seconds")
+            await asyncio.sleep(task.interval)
+
+    def _cancel_main_task(self) -> None:
+        if self._main_task is not None:
+            self._main_task.cancel()
+
+    def _add_task(self, task: Task) -> None:
+        self._tasks.append(task)
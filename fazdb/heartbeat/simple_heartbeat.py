@@ -3,13 +3,7 @@ from threading import Thread
 from typing import TYPE_CHECKING
 
 from . import Heartbeat,HeartbeatTask
-from .task import (
-    RequestQueue,
-    ResponseQueue,
-    TaskApiRequest,
-    TaskDbInsert,
-    TaskStatusReport,
-)
+from .task import TaskFactory
 
 if TYPE_CHECKING:
     from .task import Task
@@ -23,17 +17,8 @@ class SimpleHeartbeat(Thread, Heartbeat):
         self._logger = logger
 
         self._tasks: list[HeartbeatTask] = []
-
-        request_list = RequestQueue()
-        response_list = ResponseQueue()
-
-        api_request = TaskApiRequest(api, logger, request_list, response_list)
-        db_insert = TaskDbInsert(api, db, logger, request_list, response_list)
-        status_report = TaskStatusReport(logger, api, api_request, db, db_insert, request_list)
-
-        self._add_task(api_request)
-        self._add_task(db_insert)
-        self._add_task(status_report)
+        for task in TaskFactory.create_all(api, db, logger):
+            self._add_task(task)
 
     def start(self) -> None:
         for task in self._tasks:
@@ -1,7 +1,10 @@
 # type: ignore
+from .player_activity_tracker import PlayerActivityTracker
+from .request_kind import RequestKind
 from .request_queue import RequestQueue
 from .response_queue import ResponseQueue
 from .task import Task
 from .task_api_request import TaskApiRequest
 from .task_db_insert import TaskDbInsert
 from .task_status_report import TaskStatusReport
+from .task_factory import TaskFactory
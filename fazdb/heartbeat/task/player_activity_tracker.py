@@ -0,0 +1,93 @@
+from __future__ import annotations
+from datetime import timedelta
+from itertools import chain
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from aiomysql import Connection
+    from fazdb.db.fazdb.repository import PlayerActivityHistoryRepository
+
+
+class PlayerActivityTracker:
+    """Keeps the open sessions of online players, and writes `player_activity_history` per session.
+
+    A session's row is inserted when the player logs on. Its `logoff_datetime` is updated when the player logs
+    off, and for every open session at once every `checkpoint_interval`. After a crash, open sessions are left
+    with the `logoff_datetime` of the last checkpoint.
+    """
+
+    def __init__(self, repository: PlayerActivityHistoryRepository, checkpoint_interval: timedelta = timedelta(minutes=5)) -> None:
+        self._repository = repository
+        self._checkpoint_interval = checkpoint_interval
+
+        self._sessions: dict[bytes, datetime] = {}
+        """uuid: logon_datetime"""
+        self._last_seen: None | datetime = None
+        """Datetime of the latest online players response, when the open sessions were last seen online"""
+        self._last_checkpoint: None | datetime = None
+        self._written = False
+        """Whether every open session has its row in the table"""
+        self._closed: list[tuple[bytes, datetime, datetime]] = []
+        """uuid, logon_datetime, logoff_datetime of the sessions closed by the latest update"""
+        self._unwritten_closed: list[tuple[bytes, datetime, datetime]] = []
+        """Closed sessions whose writes were rolled back"""
+
+    async def update(
+        self,
+        logged_on: Iterable[bytes],
+        logged_off: Iterable[bytes],
+        datetime: datetime,
+        conn: None | Connection = None
+    ) -> None:
+        """Opens and closes sessions from an online players response made at `datetime`."""
+        last_seen = self._last_seen
+        closed: list[tuple[bytes, datetime, datetime]] = []
+        if last_seen is not None:
+            closed = [(uuid, self._sessions.pop(uuid), last_seen) for uuid in logged_off if uuid in self._sessions]
+        opened = [(uuid, datetime) for uuid in logged_on]
+        self._sessions.update(opened)
+
+        # NOTE: The previous update was committed, unless `reset` moved its closed sessions to `_unwritten_closed`
+        self._closed = self._unwritten_closed + closed
+        self._unwritten_closed = []
+
+        if not self._written:
+            # NOTE: Rows of the open sessions are missing or stale, e.g. on startup or after a rollback. Rows of the
+            # closed sessions may be missing too, so they're all replaced
+            await self._repository.insert_rows(
+                    chain(self._closed, ((uuid, logon, datetime) for uuid, logon in self._sessions.items())), conn
+            )
+            self._written = True
+            self._last_checkpoint = datetime
+        else:
+            if closed and last_seen is not None:
+                await self._repository.update_logoff_datetime(
+                        [(uuid, logon) for uuid, logon, _ in closed], last_seen, conn
+                )
+            await self._repository.insert_rows(((uuid, logon, datetime) for uuid, logon in opened), conn)
+            if self._last_checkpoint is None or datetime - self._last_checkpoint >= self._checkpoint_interval:
+                await self.checkpoint(datetime, conn)
+
+        self._last_seen = datetime
+
+    async def checkpoint(self, datetime: datetime, conn: None | Connection = None) -> None:
+        """Moves the `logoff_datetime` of every open session to `datetime`, with one batched update."""
+        await self._repository.update_logoff_datetime(self._sessions.items(), datetime, conn)
+        self._last_checkpoint = datetime
+
+    def reset(self) -> None:
+        """Rewrites every open session, and the sessions closed by the latest update, on the next update, e.g. after
+        the latest writes were rolled back."""
+        self._written = False
+        self._unwritten_closed.extend(self._closed)
+        self._closed = []
+
+    @property
+    def sessions(self) -> dict[bytes, datetime]:
+        """Open sessions, uuid: logon_datetime."""
+        return self._sessions
+
+    @property
+    def checkpoint_interval(self) -> timedelta:
+        return self._checkpoint_interval
@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class RequestKind(Enum):
+    """Wynncraft API endpoint a queued request is made to. Values are the endpoint methods' qualnames."""
+    GUILD = "GuildEndpoint.get"
+    ONLINE_PLAYERS = "PlayerEndpoint.get_online_uuids"
+    PLAYER = "PlayerEndpoint.get_full_stats"
@@ -1,94 +1,133 @@
 from __future__ import annotations
 from datetime import datetime
+from heapq import heappop, heappush
+from itertools import count
 from threading import Lock
-from typing import TYPE_CHECKING, Any, Coroutine, Generator
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Generator
+
+from .request_kind import RequestKind
 
 if TYPE_CHECKING:
+    from fazdb import Api
     from fazdb.api.wynn.response import AbstractWynnResponse
 
 
 class RequestQueue:
+    """Priority queue of API requests waiting for their resource's cache to expire.
+
+    Items are lightweight `RequestItem` descriptors, only turned into coroutines with
+    `RequestItem.to_coro` once they are dispatched. Items wait in `_pending`, a heap ordered by
+    eligibility time. Once eligible, they are moved to `_eligible`, a heap ordered by priority then
+    eligibility time. `_items` indexes every queued item by its `RequestItem.key`, which makes
+    duplicate detection O(1).
+    """
 
     def __init__(self) -> None:
         # self._api: Api  # TODO: inject dependency into constructor
-        self._list: list[RequestQueue.RequestItem] = []
+        self._pending: list[tuple[float, int, RequestQueue.RequestItem]] = []
+        """heap of (req_ts, insertion order, item)"""
+        self._eligible: list[tuple[int, float, int, RequestQueue.RequestItem]] = []
+        """heap of (-priority, req_ts, insertion order, item)"""
+        self._items: dict[tuple[RequestKind, None | str], RequestQueue.RequestItem] = {}
+        self._counter = count()
         self._lock: Lock = Lock()
+        self._enqueue_listeners: list[Callable[[], None]] = []
 
-    def dequeue(self, amount: int) -> list[Coroutine[AbstractWynnResponse[Any], Any, Any]]:
+    def dequeue(self, amount: int) -> list[RequestItem]:
         now = datetime.now().timestamp()
 
-        ret: list[Coroutine[AbstractWynnResponse[Any], Any, Any]] = []
+        ret: list[RequestQueue.RequestItem] = []
         with self._lock:
-            for _ in range(amount):
-                item = self._dequeue_one(now)
-                if item is None:
-                    # Stop yielding because the rest of the list is not eligible
-                    break
-                ret.append(item.coro)
+            self._promote_eligible(now)
+            while self._eligible and len(ret) < amount:
+                item = heappop(self._eligible)[-1]
+                del self._items[item.key]
+                ret.append(item)
         return ret
 
     def enqueue(
         self,
         request_ts: float,
-        coro: Coroutine[AbstractWynnResponse[Any], Any, Any],
+        kind: RequestKind,
+        arg: None | str = None,
         priority: int = 100
     ) -> None:
+        item = self.RequestItem(kind, arg, priority, request_ts)
         with self._lock:
-            item = self.RequestItem(coro, priority, request_ts)
-            if item not in self._list:
-                self._list.append(item)
+            if item.key in self._items:
+                return
+            self._items[item.key] = item
+            heappush(self._pending, (item.req_ts, next(self._counter), item))
+        for listener in self._enqueue_listeners:
+            listener()
+
+    def next_eligible_ts(self) -> None | float:
+        """Earliest timestamp at which a queued item is eligible, or None if the queue is empty."""
+        with self._lock:
+            if self._eligible:
+                return self._eligible[0][1]
+            if self._pending:
+                return self._pending[0][0]
+            return None
+
+    def add_enqueue_listener(self, listener: Callable[[], None]) -> None:
+        """Adds a callback that is called after a new item is enqueued. May be called from any thread."""
+        self._enqueue_listeners.append(listener)
+
+    def remove_enqueue_listener(self, listener: Callable[[], None]) -> None:
+        self._enqueue_listeners.remove(listener)
 
     def iter(self) -> Generator[RequestItem, Any, None]:
         with self._lock:
-            yield from self._list
+            yield from tuple(self._items.values())
 
-    def _dequeue_one(self, ts: None | float) -> None | RequestQueue.RequestItem:
-        if len(self._list) < 1:
-            return None
+    def _promote_eligible(self, ts: float) -> None:
+        """Moves items that are eligible at `ts` from the pending heap to the eligible heap."""
+        while self._pending and self._pending[0][0] < ts:
+            req_ts, order, item = heappop(self._pending)
+            heappush(self._eligible, (-item.priority, req_ts, order, item))
 
-        item = min(self._list)
-        if item.is_eligible(ts):
-            self._list.remove(item)
-            return item
+    def __len__(self) -> int:
+        return len(self._items)
 
 
     class RequestItem:
+        """Descriptor of a request to make to the Wynncraft API."""
 
-        def __init__(
-            self,
-            coro: Coroutine[AbstractWynnResponse[Any], Any, Any],
-            priority: int,
-            req_ts: float,
-        ) -> None:
-            self._req_ts = req_ts
-            self._coro = coro
+        __slots__ = ("_kind", "_arg", "_priority", "_req_ts")
+
+        def __init__(self, kind: RequestKind, arg: None | str, priority: int, req_ts: float) -> None:
+            self._kind = kind
+            self._arg = arg
             self._priority = priority
+            self._req_ts = req_ts
 
         def is_eligible(self, timestamp: None | float = None) -> bool:
             timestamp = timestamp or datetime.now().timestamp()
             return self.req_ts < timestamp
 
+        def to_coro(self, api: Api) -> Coroutine[Any, Any, AbstractWynnResponse[Any]]:
+            """Creates the coroutine that makes this request."""
+            match self._kind:
+                case RequestKind.GUILD:
+                    assert self._arg is not None
+                    return api.guild.get(self._arg)
+                case RequestKind.ONLINE_PLAYERS:
+                    return api.player.get_online_uuids()
+                case RequestKind.PLAYER:
+                    assert self._arg is not None
+                    return api.player.get_full_stats(self._arg)
+
         def __eq__(self, other: object | RequestQueue.RequestItem) -> bool:
             if isinstance(other, RequestQueue.RequestItem):
-                return (
-                        (self.coro.cr_frame.f_locals == other.coro.cr_frame.f_locals) and
-                        (self.coro.__qualname__ == other.coro.__qualname__)
-                )
+                return self.key == other.key
             return False
 
-        def __lt__(self, other: RequestQueue.RequestItem) -> bool:
-            """For min() function.
-            Return true to get favored more in min() function."""
-            if self.is_eligible() is False:
-                # items not eligible (expired endpoint) obviously shouldn't be favored in min()
-                return False
+        def __hash__(self) -> int:
+            return hash(self.key)
 
-            if self.priority != other.priority:
-                # Higher priority is favored
-                return self.priority > other.priority
-            else:
-                # Favor requests that has expired longer
-                return self.req_ts < other.req_ts
+        def __repr__(self) -> str:
+            return f"{self.__class__.__qualname__}({self._kind.name}, {self._arg!r}, priority={self._priority}, req_ts={self._req_ts})"
 
         @property
         def req_ts(self) -> float:
@@ -96,9 +135,19 @@ class RequestQueue:
             return self._req_ts
 
         @property
-        def coro(self) -> Coroutine[AbstractWynnResponse[Any], Any, Any]:
-            return self._coro
+        def kind(self) -> RequestKind:
+            return self._kind
+
+        @property
+        def arg(self) -> None | str:
+            """Argument passed to the endpoint, e.g. player UUID or guild name."""
+            return self._arg
 
         @property
         def priority(self) -> int:
             return self._priority
+
+        @property
+        def key(self) -> tuple[RequestKind, None | str]:
+            """Identity of the request, made of the endpoint kind and its argument."""
+            return (self._kind, self._arg)
@@ -1,15 +1,24 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Protocol
+import asyncio
+from typing import TYPE_CHECKING, Any, Coroutine, Protocol
 
 if TYPE_CHECKING:
     from datetime import datetime
 
 
 class Task(Protocol):
-    """Interface for heartbeat tasks."""
+    """Interface for heartbeat tasks.
+
+    The synchronous methods run the task on its own event loop. The `async_` counterparts run it on the
+    caller's running event loop.
+    """
+    _event_loop: None | asyncio.AbstractEventLoop
     def setup(self) -> None: ...
     def teardown(self) -> None: ...
     def run(self) -> None: ...
+    async def async_setup(self) -> None: ...
+    async def async_teardown(self) -> None: ...
+    async def async_run(self) -> None: ...
     @property
     def first_delay(self) -> float: ...
     @property
@@ -18,3 +27,10 @@ class Task(Protocol):
     def latest_run(self) -> datetime: ...
     @property
     def name(self) -> str: ...
+
+    def _run_sync(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Runs `coro` on the task's own event loop. The loop is created on first use, so tasks only run with the
+        `async_` methods, e.g. by `AsyncHeartbeat`, never create one."""
+        if self._event_loop is None:
+            self._event_loop = asyncio.new_event_loop()
+        self._event_loop.run_until_complete(coro)
@@ -3,7 +3,7 @@ import asyncio
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from . import Task
+from . import RequestKind, Task
 
 if TYPE_CHECKING:
     from . import RequestQueue, ResponseQueue
@@ -12,42 +12,108 @@ if TYPE_CHECKING:
 
 
 class TaskApiRequest(Task):
-    """implements `TaskBase`"""
+    """implements `TaskBase`
+
+    With `continuous` enabled, requests are started by a dispatcher coroutine that refills a slot as soon
+    as a request completes, and sleeps until the earliest queued request is eligible. `run` then only
+    collects the responses. This requires an event loop that keeps running between runs, e.g. `AsyncHeartbeat`.
+    """
 
     _CONCURRENT_REQUESTS = 15
 
-    def __init__(self, api: Api, logger: Logger, request_list: RequestQueue, response_list: ResponseQueue) -> None:
+    def __init__(
+        self,
+        api: Api,
+        logger: Logger,
+        request_list: RequestQueue,
+        response_list: ResponseQueue,
+        continuous: bool = False
+    ) -> None:
         self._api = api
         self._logger = logger
         self._request_list = request_list
         self._response_list = response_list
+        self._continuous = continuous
 
-        self._event_loop = asyncio.new_event_loop()
+        self._event_loop: None | asyncio.AbstractEventLoop = None
         self._latest_run = datetime.now()
         self._running_requests: list[asyncio.Task[AbstractWynnResponse[Any]]] = []
+        self._dispatcher: None | asyncio.Task[None] = None
+        self._wakeup: None | asyncio.Event = None
+        self._dispatcher_loop: None | asyncio.AbstractEventLoop = None
 
     def setup(self) -> None:
-        self._logger.console.debug(f"Setting up {self.name}")
-        self._event_loop.run_until_complete(self._api.start())
+        self._run_sync(self.async_setup())
 
     def teardown(self) -> None:
+        self._run_sync(self.async_teardown())
+
+    def run(self) -> None:
+        self._run_sync(self.async_run())
+
+    async def async_setup(self) -> None:
+        self._logger.console.debug(f"Setting up {self.name}")
+        await self._api.start()
+        if self._continuous:
+            self._wakeup = asyncio.Event()
+            self._dispatcher_loop = asyncio.get_running_loop()
+            self._request_list.add_enqueue_listener(self._on_enqueue)
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+    async def async_teardown(self) -> None:
         self._logger.console.debug(f"Tearing down {self.name}")
-        self._event_loop.run_until_complete(self._api.close())
+        if self._dispatcher is not None:
+            self._request_list.remove_enqueue_listener(self._on_enqueue)
+            self._dispatcher.cancel()
+            self._dispatcher = None
+        await self._api.close()
         for req in self._running_requests:
             req.cancel()
 
-    def run(self) -> None:
+    async def async_run(self) -> None:
         try:
-            self._event_loop.run_until_complete(self._run())
+            await self._run()
         except Exception as e:
-            self._event_loop.create_task(self._logger.discord.exception(f"Error {self.__class__.__qualname__}", e))
+            asyncio.create_task(self._logger.discord.exception(f"Error {self.__class__.__qualname__}", e))
         self._latest_run = datetime.now()
 
     async def _run(self) -> None:
         await self._check_api_session()
-        self._start_requests()
+        if self._dispatcher is None:
+            self._start_requests()
         self._check_responses()
 
+    async def _dispatch(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            self._wakeup.clear()
+            try:
+                self._start_requests()
+            except Exception as e:
+                asyncio.create_task(self._logger.discord.exception(f"Error {self.__class__.__qualname__} dispatcher", e))
+
+            timeout = None  # all slots are taken, wait until a request completes
+            if self._free_slots() > 0:
+                next_ts = self._request_list.next_eligible_ts()
+                if next_ts is not None:
+                    timeout = max(next_ts - datetime.now().timestamp(), 0.0)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except TimeoutError:
+                pass
+
+    def _on_enqueue(self) -> None:
+        # NOTE: enqueue may be called from another thread
+        if self._wakeup is not None and self._dispatcher_loop is not None:
+            self._dispatcher_loop.call_soon_threadsafe(self._wakeup.set)
+
+    def _on_request_done(self, _: asyncio.Task[AbstractWynnResponse[Any]]) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _free_slots(self) -> int:
+        return self._CONCURRENT_REQUESTS - sum(1 for req in self._running_requests if not req.done())
+
     async def _check_api_session(self) -> None:
         if not self._api.request.is_open():
             self._logger.console.warning("HTTP session is closed. Reopening...")
@@ -56,13 +122,14 @@ class TaskApiRequest(Task):
     def _start_requests(self) -> None:
         # NOTE: This prevents being ratelimited,
         # since requests won't be finishing when the client is ratelimited
-        running_req_amount = len(self._running_requests)
-        if running_req_amount < self._CONCURRENT_REQUESTS:
-            self._running_requests.extend(
-                    self._event_loop.create_task(req)
-                    # fill the event loop with eligible requests once there's slots open
-                    for req in self._request_list.dequeue(self._CONCURRENT_REQUESTS - running_req_amount)
-            )
+        free_slots = self._free_slots()
+        if free_slots <= 0:
+            return
+        # fill the event loop with eligible requests once there's slots open
+        for req in self._request_list.dequeue(free_slots):
+            task = asyncio.create_task(req.to_coro(self._api))
+            task.add_done_callback(self._on_request_done)
+            self._running_requests.append(task)
 
     def _check_responses(self) -> None:
         ok_results: list[AbstractWynnResponse[Any]] = []
@@ -73,13 +140,13 @@ class TaskApiRequest(Task):
 
             tasks_to_remove.append(task)
             if task.exception() is not None:
-                self._event_loop.create_task(self._logger.discord.exception(
+                asyncio.create_task(self._logger.discord.exception(
                         f"Error fetching from Wynn API ({task.get_coro().__qualname__})",
                         task.exception()
                 ))
                 # HACK: prevents WynnApiFetcher stopping when get_online_uuids is not requeued
-                if task.get_coro().__qualname__ == self._api.player.get_online_uuids.__qualname__:
-                    self._request_list.enqueue(0, self._api.player.get_online_uuids())
+                if task.get_coro().__qualname__ == RequestKind.ONLINE_PLAYERS.value:
+                    self._request_list.enqueue(0, RequestKind.ONLINE_PLAYERS)
             else:
                 # get_online_uuids will be requeued when the response is computed
                 ok_results.append(task.result())
@@ -3,12 +3,15 @@ import asyncio
 from datetime import datetime
 from typing import TYPE_CHECKING, Iterable
 
+from .player_activity_tracker import PlayerActivityTracker
+from .request_kind import RequestKind
 from .task import Task
 from fazdb.api.wynn.response import GuildResponse, PlayerResponse, OnlinePlayersResponse
-from fazdb.util import ApiResponseAdapter
+from fazdb.util import ApiResponseAdapter, PlayerResponseBatch, UuidCache
 from fazdb.db.fazdb.model import FazDbUptime
 
 if TYPE_CHECKING:
+    from aiomysql import Connection
     from . import RequestQueue, ResponseQueue
     from fazdb import Api, IFazDbDatabase, Logger
 
@@ -30,29 +33,42 @@ class TaskDbInsert(Task):
         self._request_list = request_list
         self._response_list = response_list
 
-        self._event_loop = asyncio.new_event_loop()
+        self._event_loop: None | asyncio.AbstractEventLoop = None
         self._latest_run = datetime.now()
         self._response_adapter = ApiResponseAdapter()
         self._response_handler = self._ResponseHandler(self._api, self._request_list)
+        self._activity_tracker = PlayerActivityTracker(self._db.player_activity_history_repository)
+        # NOTE: Session rows written in a rolled back tick are written again on the next tick
+        self._db.add_rollback_listener(self._activity_tracker.reset)
         self._start_time = datetime.now()
 
     def setup(self) -> None:
-        self._event_loop.run_until_complete(self._db.create_all())
-        # NOTE: Initial request. Results in a chain reaction of requests.
-        self._request_list.enqueue(0, self._api.player.get_online_uuids(), priority=999)
+        self._run_sync(self.async_setup())
 
-    def teardown(self) -> None: ...
+    def teardown(self) -> None:
+        self._run_sync(self.async_teardown())
 
     def run(self) -> None:
+        self._run_sync(self.async_run())
+
+    async def async_setup(self) -> None:
+        await self._db.create_all()
+        await self._db.load_caches()
+        # NOTE: Initial request. Results in a chain reaction of requests.
+        self._request_list.enqueue(0, RequestKind.ONLINE_PLAYERS, priority=999)
+
+    async def async_teardown(self) -> None:
+        # NOTE: Closes the connection pool of this loop, which is shared by every task under AsyncHeartbeat
+        await self._db.query.close()
+
+    async def async_run(self) -> None:
         try:
-            self._event_loop.run_until_complete(self._run())
+            await self._run()
         except Exception as e:
-            self._event_loop.create_task(self._logger.discord.exception(f"Error {self.__class__.__qualname__}", e))
+            asyncio.create_task(self._logger.discord.exception(f"Error {self.__class__.__qualname__}", e))
         self._latest_run = datetime.now()
 
     async def _run(self) -> None:
-        await self._db.fazdb_uptime_repository.insert((FazDbUptime(self._start_time, datetime.now()),))
-
         online_players_resp: None | OnlinePlayersResponse = None
         player_resps: list[PlayerResponse] = []
         guild_resps: list[GuildResponse] = []
@@ -70,39 +86,35 @@ class TaskDbInsert(Task):
         self._response_handler.handle_player_response(player_resps)
         self._response_handler.handle_guild_response(guild_resps)
 
-        if online_players_resp:
-            await self._insert_online_players_response(online_players_resp)
-        if player_resps:
-            await self._insert_player_responses(player_resps)
-        if guild_resps:
-            await self._insert_guild_response(guild_resps)
-
-    async def _insert_online_players_response(self, resp: OnlinePlayersResponse) -> None:
-        await self._db.online_players_repository.insert(self._response_adapter.OnlinePlayers.to_online_players(resp))
-        await self._db.player_activity_history_repository.insert(
-                self._response_adapter.OnlinePlayers.to_player_activity_history(
-                        resp,
-                        self._response_handler.online_players
-                )
+        # NOTE: Everything from this tick is committed once, in a single transaction
+        async with self._db.unit_of_work() as conn:
+            await self._db.fazdb_uptime_repository.insert((FazDbUptime(self._start_time, datetime.now()),), conn)
+            if online_players_resp:
+                await self._insert_online_players_response(online_players_resp, conn)
+            if player_resps:
+                await self._insert_player_responses(player_resps, conn)
+            if guild_resps:
+                await self._insert_guild_response(guild_resps, conn)
+
+    async def _insert_online_players_response(self, resp: OnlinePlayersResponse, conn: None | Connection = None) -> None:
+        await self._db.online_players_repository.insert(self._response_adapter.OnlinePlayers.to_online_players(resp), conn)
+        # NOTE: Only sessions that opened or closed are written, plus a periodic checkpoint of the open ones
+        await self._activity_tracker.update(
+                self._response_handler.logged_on_uuids,
+                self._response_handler.logged_off_uuids,
+                resp.headers.to_datetime(),
+                conn
         )
 
-    async def _insert_player_responses(self, resps: list[PlayerResponse]) -> None:
-        character_history = []
-        character_info = []
-        player_history = []
-        player_info = []
-        for resp in resps:
-            character_history.extend(self._response_adapter.Player.to_character_history(resp))
-            character_info.extend(self._response_adapter.Player.to_character_info(resp))
-            player_history.append(self._response_adapter.Player.to_player_history(resp))
-            player_info.append(self._response_adapter.Player.to_player_info(resp))
-
-        await self._db.player_info_repository.insert(player_info)
-        await self._db.character_info_repository.insert(character_info)
-        await self._db.player_history_repository.insert(player_history)
-        await self._db.character_history_repository.insert(character_history)
+    async def _insert_player_responses(self, resps: list[PlayerResponse], conn: None | Connection = None) -> None:
+        # NOTE: Read into columns in one pass. Rows are only assembled for what the repositories' caches find changed
+        batch = PlayerResponseBatch(resps)
+        await self._db.player_info_repository.insert_columns(batch.player_info_columns(), conn)
+        await self._db.character_info_repository.insert_columns(batch.character_info_columns(), conn)
+        await self._db.player_history_repository.insert_columns(batch.player_history_columns(), conn)
+        await self._db.character_history_repository.insert_columns(batch.character_history_columns(), conn)
 
-    async def _insert_guild_response(self, resps: list[GuildResponse]) -> None:
+    async def _insert_guild_response(self, resps: list[GuildResponse], conn: None | Connection = None) -> None:
         guild_info = []
         guild_history = []
         guild_member_history = []
@@ -111,13 +123,16 @@ class TaskDbInsert(Task):
             guild_history.append(self._response_adapter.Guild.to_guild_history(resp))
             guild_member_history.extend(self._response_adapter.Guild.to_guild_member_history(resp))
 
-        await self._db.guild_info_repository.insert(guild_info)
-        await self._db.guild_history_repository.insert(guild_history)
-        await self._db.guild_member_history_repository.insert(guild_member_history)
+        await self._db.guild_info_repository.insert(guild_info, conn)
+        await self._db.guild_history_repository.insert(guild_history, conn)
+        await self._db.guild_member_history_repository.insert(guild_member_history, conn)
 
     @property
     def response_handler(self) -> TaskDbInsert._ResponseHandler: return self._response_handler
 
+    @property
+    def activity_tracker(self) -> PlayerActivityTracker: return self._activity_tracker
+
     @property
     def first_delay(self) -> float: return 1.0
 
@@ -142,6 +157,11 @@ class TaskDbInsert(Task):
             self._online_players: dict[str, datetime] = {}
             self._logged_on_guilds: set[str] = set()
             self._logged_on_players: set[str] = set()
+            self._logged_off_players: set[str] = set()
+            self._logged_on_uuids: list[bytes] = []
+            self._logged_off_uuids: list[bytes] = []
+            self._online_uuids: bytes = b""
+            """Sorted 16-byte UUIDs of the latest online players response"""
 
         def handle_onlineplayers_response(self, resp: None | OnlinePlayersResponse) -> None:
             if not resp: return
@@ -161,26 +181,28 @@ class TaskDbInsert(Task):
 
         # OnlinePlayersResponse
         def _process_onlineplayers_response(self, resp: OnlinePlayersResponse) -> None:
-            new_online_uuids: set[str] = {str(uuid) for uuid in resp.body.players}
-            prev_online_uuids: set[str] = set(self.online_players)
+            # NOTE: Merges the sorted UUID blocks, so only the players that logged on or off are converted to str
+            self._logged_on_uuids, self._logged_off_uuids = resp.body.diff(self._online_uuids, resp.body.uuids)
+            self._online_uuids = resp.body.uuids
 
-            logged_off: set[str] = prev_online_uuids - new_online_uuids
-            self._logged_on_players: set[str] = new_online_uuids - prev_online_uuids
+            self._logged_on_players = {UuidCache.to_str(uuid) for uuid in self._logged_on_uuids}
+            self._logged_off_players = {UuidCache.to_str(uuid) for uuid in self._logged_off_uuids}
 
-            for uuid in logged_off:
+            for uuid in self._logged_off_players:
                 del self.online_players[uuid]
 
-            for uuid in self.logged_on_players:
-                self.online_players[uuid] = resp.headers.to_datetime()
+            logon_datetime = resp.headers.to_datetime()
+            for uuid in self._logged_on_players:
+                self.online_players[uuid] = logon_datetime
 
         def _enqueue_player(self) -> None:
             for uuid in self.logged_on_players:
-                self._request_list.enqueue(0, self._api.player.get_full_stats(uuid))
+                self._request_list.enqueue(0, RequestKind.PLAYER, uuid)
 
         def _requeue_onlineplayers(self, resp: OnlinePlayersResponse) -> None:
             self._request_list.enqueue(
                     resp.headers.expires.to_datetime().timestamp(),
-                    self._api.player.get_online_uuids(),
+                    RequestKind.ONLINE_PLAYERS,
                     priority=500
             )
 
@@ -218,7 +240,7 @@ class TaskDbInsert(Task):
 
         def _enqueue_guild(self) -> None:
             for guild_name in self._logged_on_guilds:
-                self._request_list.enqueue(0, self._api.guild.get(guild_name))
+                self._request_list.enqueue(0, RequestKind.GUILD, guild_name)
 
         def _requeue_player(self, resps: Iterable[PlayerResponse]) -> None:
             for resp in resps:
@@ -227,7 +249,8 @@ class TaskDbInsert(Task):
 
                 self._request_list.enqueue(
                         resp.headers.expires.to_datetime().timestamp(),  # due to ratelimit
-                        self._api.player.get_full_stats(resp.body.uuid.uuid)
+                        RequestKind.PLAYER,
+                        resp.body.uuid.uuid
                 )
 
         # GuildResponse
@@ -238,7 +261,8 @@ class TaskDbInsert(Task):
 
                 self._request_list.enqueue(
                         resp.headers.expires.to_datetime().timestamp(),
-                        self._api.guild.get(resp.body.name)
+                        RequestKind.GUILD,
+                        resp.body.name
                 )
 
         @property
@@ -251,6 +275,21 @@ class TaskDbInsert(Task):
             """ Set of latest logged on players' uuids. Needed by PlayerActivityHistory. """
             return self._logged_on_players
 
+        @property
+        def logged_off_players(self) -> set[str]:
+            """ Set of latest logged off players' uuids. """
+            return self._logged_off_players
+
+        @property
+        def logged_on_uuids(self) -> list[bytes]:
+            """ Latest logged on players' 16-byte uuids, sorted. Needed by PlayerActivityTracker. """
+            return self._logged_on_uuids
+
+        @property
+        def logged_off_uuids(self) -> list[bytes]:
+            """ Latest logged off players' 16-byte uuids, sorted. """
+            return self._logged_off_uuids
+
         @property
         def online_players(self) -> dict[str, datetime]:
             """ Dict of online players' uuids, paired with their logged on timestamp. """
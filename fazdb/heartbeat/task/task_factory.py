@@ -0,0 +1,27 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from .request_queue import RequestQueue
+from .response_queue import ResponseQueue
+from .task_api_request import TaskApiRequest
+from .task_db_insert import TaskDbInsert
+from .task_status_report import TaskStatusReport
+
+if TYPE_CHECKING:
+    from .task import Task
+    from fazdb import Api, IFazDbDatabase, Logger
+
+
+class TaskFactory:
+    """Builds the heartbeat tasks, sharing one request and one response queue."""
+
+    @staticmethod
+    def create_all(api: Api, db: IFazDbDatabase, logger: Logger, continuous: bool = False) -> list[Task]:
+        """Tasks in the order they're set up. `continuous` is passed to `TaskApiRequest`."""
+        request_list = RequestQueue()
+        response_list = ResponseQueue()
+
+        api_request = TaskApiRequest(api, logger, request_list, response_list, continuous=continuous)
+        db_insert = TaskDbInsert(api, db, logger, request_list, response_list)
+        status_report = TaskStatusReport(logger, api, api_request, db, db_insert, request_list)
+        return [api_request, db_insert, status_report]
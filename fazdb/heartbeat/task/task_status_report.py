@@ -35,24 +35,20 @@ class TaskStatusReport(Task):
         self._db_insert = db_insert
         self._request_list = request_list
 
-        self._event_loop = asyncio.new_event_loop()
+        self._event_loop: None | asyncio.AbstractEventLoop = None
         self._latest_run = self._start_time = datetime.now()
         self._message_id: None | int = None
         self._url = Config.discord_log_webhook
 
     def setup(self) -> None:
-        self._event_loop.run_until_complete(self.async_setup())
+        self._run_sync(self.async_setup())
 
     def teardown(self) -> None: ...
 
     def run(self) -> None:
-        try:
-            self._event_loop.run_until_complete(self._run())
-        except Exception as e:
-            self._event_loop.create_task(self._logger.discord.exception(f"Error {self.__class__.__qualname__}", e))
-        self._latest_run = datetime.now()
+        self._run_sync(self.async_run())
 
-    async def async_setup(self):
+    async def async_setup(self) -> None:
         async with ClientSession() as s:
             hook = discord.Webhook.from_url(self._url, session=s)
             await hook.edit(name="faz-db Information")
@@ -63,6 +59,15 @@ class TaskStatusReport(Task):
         self._api.player.get_full_stats = perf.bind_async(self._api.player.get_full_stats)
         self._api.player.get_online_uuids = perf.bind_async(self._api.player.get_online_uuids)
 
+    async def async_teardown(self) -> None: ...
+
+    async def async_run(self) -> None:
+        try:
+            await self._run()
+        except Exception as e:
+            asyncio.create_task(self._logger.discord.exception(f"Error {self.__class__.__qualname__}", e))
+        self._latest_run = datetime.now()
+
     async def _run(self) -> None:
         await self._send()
 
@@ -106,6 +111,7 @@ class TaskStatusReport(Task):
             "\n│"
             "\n├── Api Stats/"
             "\n│   ├── Ratelimit      : {}"
+            "\n│   ├── Response Cache : [ {} hits | {} misses ]"
             "\n│   ├── Online Players : {}"
             "\n│   ├── Online Guilds  : {}"
             "\n│   ├── Avg Guild Req Duration         : {:.2f}"
@@ -140,7 +146,7 @@ class TaskStatusReport(Task):
         }
 
         for req in self._request_list.iter():
-            index = match_qualname.get(req.coro.__qualname__, 3)
+            index = match_qualname.get(req.kind.value, 3)
             unique_request_list["queued"][index] += 1
             if req.is_eligible(now_ts):
                 unique_request_list["eligible"][index] += 1
@@ -185,6 +191,8 @@ class TaskStatusReport(Task):
                 (await db_total_size) / self.Util.MB_TO_BYTE,  # db size
 
                 self._api.ratelimit.remaining,  # ratelimit
+                self._api.request.cache_hits,  # response cache hits
+                self._api.request.cache_misses,  # response cache misses
                 len(self._db_insert.response_handler.online_players),  # online player
                 len(self._db_insert.response_handler.online_guilds),  # online guild
 
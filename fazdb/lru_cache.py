@@ -0,0 +1,43 @@
+from collections import OrderedDict
+
+
+class LruCache[K, V]:
+    """Mapping that holds at most `maxsize` items, evicting the least recently used item first."""
+
+    __slots__ = ("_maxsize", "_data")
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self._maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+
+    def get(self, key: K, default: None | V = None) -> None | V:
+        """Value of `key`, marking it as most recently used, or `default` if it isn't cached."""
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return default
+        return self._data[key]
+
+    def put(self, key: K, value: V) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K, default: None | V = None) -> None | V:
+        return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
@@ -1,4 +1,6 @@
 # type: ignore
 from .error_handler import ErrorHandler
+from .uuid_cache import UuidCache
 
 from .api_response_adapter import ApiResponseAdapter
+from .player_response_batch import PlayerResponseBatch
@@ -1,6 +1,9 @@
 from __future__ import annotations
-from typing import Generator, TYPE_CHECKING
+from decimal import Decimal
+from typing import Any, Generator, TYPE_CHECKING
 
+from fazdb.api.wynn.model.enum import Gamemode
+from fazdb.api.wynn.model.field import BodyDateField, CharacterTypeField
 from fazdb.db.fazdb.model import (
     CharacterHistory,
     CharacterInfo,
@@ -13,13 +16,19 @@ from fazdb.db.fazdb.model import (
     PlayerInfo,
 )
 
+from .uuid_cache import UuidCache
+
 if TYPE_CHECKING:
     from datetime import datetime
     from fazdb.api.wynn.response import GuildResponse, OnlinePlayersResponse, PlayerResponse
 
 
 class ApiResponseAdapter:
-    """Adapter for converting wynncraft API responses to DB models."""
+    """Adapter for converting wynncraft API responses to DB models.
+
+    The `*_rows` methods project the raw response body straight to the repositories' row tuples
+    (see `Repository.insert_rows`), skipping the API and DB model objects.
+    """
 
     class Player:
 
@@ -88,6 +97,83 @@ class ApiResponseAdapter:
                     first_join=resp.body.first_join.to_datetime()
             )
 
+        @staticmethod
+        def to_character_history_rows(resp: PlayerResponse) -> Generator[tuple[Any, ...], None, None]:
+            """Rows for `CharacterHistoryRepository.insert_rows`. Same values as `to_character_history`."""
+            datetime = resp.headers.to_datetime()
+            characters = resp.body.raw["characters"]
+            stats_list: list[tuple[Any, ...]] = []
+            for ch_uuid, ch in characters.items():
+                gamemodes = {gm.upper() for gm in ch["gamemode"]}
+                prof = ch["professions"]
+                stats = (
+                        UuidCache.to_bytes(ch_uuid),
+                        ch["level"],
+                        ch["xp"],
+                        ch["wars"],
+                        ch["mobsKilled"],
+                        ch["chestsFound"],
+                        ch["logins"],
+                        ch["deaths"],
+                        ch["discoveries"],
+                        Gamemode.HARDCORE.value in gamemodes,
+                        Gamemode.ULTIMATE_IRONMAN.value in gamemodes,
+                        Gamemode.IRONMAN.value in gamemodes,
+                        Gamemode.CRAFTSMAN.value in gamemodes,
+                        Gamemode.HUNTED.value in gamemodes,
+                        _profession(prof, "alchemism"),
+                        _profession(prof, "armouring"),
+                        _profession(prof, "cooking"),
+                        _profession(prof, "jeweling"),
+                        _profession(prof, "scribing"),
+                        _profession(prof, "tailoring"),
+                        _profession(prof, "weaponsmithing"),
+                        _profession(prof, "woodworking"),
+                        _profession(prof, "mining"),
+                        _profession(prof, "woodcutting"),
+                        _profession(prof, "farming"),
+                        _profession(prof, "fishing"),
+                        (ch.get("dungeons") or {}).get("total", 0),
+                        len(ch["quests"]),
+                        (ch.get("raids") or {}).get("total", 0),
+                )
+                stats_list.append(stats)
+            unique_ids = CharacterHistory.compute_unique_ids(stats_list)
+            for ch, stats, unique_id in zip(characters.values(), stats_list, unique_ids):
+                # NOTE: Column order puts playtime after wars, but it isn't part of the unique ID
+                yield stats[:4] + (Decimal(ch["playtime"]),) + stats[4:] + (datetime, unique_id)
+
+        @staticmethod
+        def to_character_info_rows(resp: PlayerResponse) -> Generator[tuple[Any, ...], None, None]:
+            """Rows for `CharacterInfoRepository.insert_rows`. Same values as `to_character_info`."""
+            uuid = UuidCache.to_bytes(resp.body.raw["uuid"])
+            for ch_uuid, ch in resp.body.raw["characters"].items():
+                yield (UuidCache.to_bytes(ch_uuid), uuid, CharacterTypeField(ch["type"]).get_kind_str())
+
+        @staticmethod
+        def to_player_history_row(resp: PlayerResponse) -> tuple[Any, ...]:
+            """Row for `PlayerHistoryRepository.insert_rows`. Same values as `to_player_history`."""
+            raw = resp.body.raw
+            guild = raw.get("guild")
+            stats = (
+                    UuidCache.to_bytes(raw["uuid"]),
+                    raw["username"],
+                    raw["supportRank"],
+                    guild["name"] if guild else None,
+                    guild["rank"] if guild else None,
+                    raw["rank"],
+            )
+            return (
+                    stats[:3] + (Decimal(raw["playtime"]),) + stats[3:]
+                    + (resp.headers.to_datetime(), PlayerHistory.compute_unique_id(*stats))
+            )
+
+        @staticmethod
+        def to_player_info_row(resp: PlayerResponse) -> tuple[Any, ...]:
+            """Row for `PlayerInfoRepository.insert_rows`. Same values as `to_player_info`."""
+            raw = resp.body.raw
+            return (UuidCache.to_bytes(raw["uuid"]), raw["username"], BodyDateField(raw["firstJoin"]).to_datetime())
+
     class Guild:
 
         @staticmethod
@@ -124,19 +210,25 @@ class ApiResponseAdapter:
 
         @staticmethod
         def to_online_players(resp: OnlinePlayersResponse) -> Generator[OnlinePlayers, None, None]:
-            return (OnlinePlayers(uuid=uuid.to_bytes(), server=server) for uuid, server in resp.body.iter_players())
+            return (OnlinePlayers(uuid=uuid, server=server) for uuid, server in resp.body.iter_uuids())
 
         @staticmethod
         def to_player_activity_history(
             resp: OnlinePlayersResponse,
             logon_timestamps: dict[str, datetime]
         ) -> Generator[PlayerActivityHistory, None, None]:
+            datetime = resp.headers.to_datetime()
             return (
                     PlayerActivityHistory(
-                            uuid.to_bytes(),  # the user's uuid
-                            logon_timestamps[uuid.username_or_uuid],  # when did the user logged on
-                            resp.headers.to_datetime()  # the response timestamp
+                            uuid,  # the user's uuid
+                            logon_timestamps[UuidCache.to_str(uuid)],  # when did the user logged on
+                            datetime  # the response timestamp
                     )
-                    for uuid in resp.body.players
-                    if uuid.is_uuid() is True
+                    for uuid, _ in resp.body.iter_uuids()
             )
+
+
+def _profession(node: dict[str, Any], name: str) -> Decimal:
+    """Same as `Player.Character.Professions.ProfessionInfo.to_decimal`."""
+    info = node.get(name, {})
+    return info.get("level", 0) + (Decimal(info.get("xpPercent", 0)) / 100)
@@ -0,0 +1,166 @@
+from __future__ import annotations
+from array import array
+from decimal import Decimal
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterable, Sequence
+
+from fazdb.api.wynn.model.enum import Gamemode
+from fazdb.api.wynn.model.field import BodyDateField, CharacterTypeField
+from fazdb.db.fazdb.model import CharacterHistory, PlayerHistory
+
+from .uuid_cache import UuidCache
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from fazdb.api.wynn.response import PlayerResponse
+
+
+class PlayerResponseBatch:
+    """A tick's worth of `PlayerResponse`s, stored column by column.
+
+    Numeric stats are kept in `array.array`s and UUIDs in one block of 16-byte UUIDs. The body of every response is
+    read in one pass. The `*_columns` methods return the columns of each table in its repository's `_COLUMNS` order,
+    for `Repository.insert_columns`. Unique IDs are hashed with `compute_unique_ids_from_columns`, so no row is
+    assembled until the repository knows which ones changed. Rows made from the columns are the same as the rows
+    of `ApiResponseAdapter.Player.to_*_rows`.
+    """
+
+    _CHARACTER_INTS: tuple[str, ...] = (
+        "level", "xp", "wars", "mobsKilled", "chestsFound", "logins", "deaths", "discoveries"
+    )
+    _GAMEMODES: tuple[str, ...] = (
+        Gamemode.HARDCORE.value, Gamemode.ULTIMATE_IRONMAN.value, Gamemode.IRONMAN.value, Gamemode.CRAFTSMAN.value,
+        Gamemode.HUNTED.value
+    )
+    _PROFESSIONS: tuple[str, ...] = (
+        "alchemism", "armouring", "cooking", "jeweling", "scribing", "tailoring", "weaponsmithing", "woodworking",
+        "mining", "woodcutting", "farming", "fishing"
+    )
+
+    def __init__(self, resps: Iterable[PlayerResponse]) -> None:
+        # NOTE: Player columns, one entry per response
+        self._player_uuids = bytearray()
+        self._usernames: list[str] = []
+        self._support_ranks: list[None | str] = []
+        self._guild_names: list[None | str] = []
+        self._guild_ranks: list[None | str] = []
+        self._ranks: list[str] = []
+        self._player_playtimes = array("d")
+        self._first_joins: list[str] = []
+        self._datetimes: list[datetime] = []
+
+        # NOTE: Character columns, one entry per character
+        self._character_uuids = bytearray()
+        self._character_players = array("l")
+        """Index of the character's player in the player columns"""
+        self._character_types: list[str] = []
+        self._character_playtimes = array("d")
+        self._character_ints = [array("q") for _ in self._CHARACTER_INTS]
+        self._character_gamemodes = [array("b") for _ in self._GAMEMODES]
+        self._profession_levels = [array("l") for _ in self._PROFESSIONS]
+        self._profession_xp_percents = [array("l") for _ in self._PROFESSIONS]
+        self._dungeon_completions = array("q")
+        self._quest_completions = array("q")
+        self._raid_completions = array("q")
+
+        for resp in resps:
+            self._add(resp)
+
+    def _add(self, resp: PlayerResponse) -> None:
+        raw = resp.body.raw
+        player_index = len(self._usernames)
+        guild = raw.get("guild")
+        self._player_uuids += UuidCache.to_bytes(raw["uuid"])
+        self._usernames.append(raw["username"])
+        self._support_ranks.append(raw["supportRank"])
+        self._guild_names.append(guild["name"] if guild else None)
+        self._guild_ranks.append(guild["rank"] if guild else None)
+        self._ranks.append(raw["rank"])
+        self._player_playtimes.append(raw["playtime"])
+        self._first_joins.append(raw["firstJoin"])
+        self._datetimes.append(resp.headers.to_datetime())
+
+        for ch_uuid, ch in raw["characters"].items():
+            self._character_uuids += UuidCache.to_bytes(ch_uuid)
+            self._character_players.append(player_index)
+            self._character_types.append(ch["type"])
+            self._character_playtimes.append(ch["playtime"])
+            for column, key in zip(self._character_ints, self._CHARACTER_INTS):
+                column.append(ch[key])
+            gamemodes = {gm.upper() for gm in ch["gamemode"]}
+            for column, gamemode in zip(self._character_gamemodes, self._GAMEMODES):
+                column.append(gamemode in gamemodes)
+            professions = ch["professions"]
+            for levels, xp_percents, name in zip(self._profession_levels, self._profession_xp_percents, self._PROFESSIONS):
+                info = professions.get(name, {})
+                levels.append(info.get("level", 0))
+                xp_percents.append(info.get("xpPercent", 0))
+            self._dungeon_completions.append((ch.get("dungeons") or {}).get("total", 0))
+            self._quest_completions.append(len(ch["quests"]))
+            self._raid_completions.append((ch.get("raids") or {}).get("total", 0))
+
+    def character_history_columns(self) -> list[Sequence[Any]]:
+        """Columns for `CharacterHistoryRepository.insert_columns`."""
+        uuids = self._split_uuids(self._character_uuids)
+        # NOTE: bools, not the stored 0/1, as version 1 unique IDs hash their `str()`
+        gamemodes = [list(map(bool, column)) for column in self._character_gamemodes]
+        professions = [
+            list(map(self._profession, levels, xp_percents))
+            for levels, xp_percents in zip(self._profession_levels, self._profession_xp_percents)
+        ]
+        completions = [self._dungeon_completions, self._quest_completions, self._raid_completions]
+        unique_ids = CharacterHistory.compute_unique_ids_from_columns(
+                [uuids, *self._character_ints, *gamemodes, *professions, *completions]
+        )
+        level, xp, wars, *counters = self._character_ints
+        # NOTE: Column order puts playtime after wars, but it isn't part of the unique ID
+        return [
+            uuids, level, xp, wars, list(map(Decimal, self._character_playtimes)), *counters, *gamemodes,
+            *professions, *completions, list(map(self._datetimes.__getitem__, self._character_players)), unique_ids
+        ]
+
+    def character_info_columns(self) -> list[Sequence[Any]]:
+        """Columns for `CharacterInfoRepository.insert_columns`."""
+        player_uuids = self._split_uuids(self._player_uuids)
+        return [
+            self._split_uuids(self._character_uuids),
+            list(map(player_uuids.__getitem__, self._character_players)),
+            [CharacterTypeField(type_).get_kind_str() for type_ in self._character_types]
+        ]
+
+    def player_history_columns(self) -> list[Sequence[Any]]:
+        """Columns for `PlayerHistoryRepository.insert_columns`."""
+        uuids = self._split_uuids(self._player_uuids)
+        unique_ids = PlayerHistory.compute_unique_ids_from_columns(
+                [uuids, self._usernames, self._support_ranks, self._guild_names, self._guild_ranks, self._ranks]
+        )
+        return [
+            uuids, self._usernames, self._support_ranks, list(map(Decimal, self._player_playtimes)),
+            self._guild_names, self._guild_ranks, self._ranks, self._datetimes, unique_ids
+        ]
+
+    def player_info_columns(self) -> list[Sequence[Any]]:
+        """Columns for `PlayerInfoRepository.insert_columns`."""
+        return [
+            self._split_uuids(self._player_uuids),
+            self._usernames,
+            [BodyDateField(first_join).to_datetime() for first_join in self._first_joins]
+        ]
+
+    @staticmethod
+    def _split_uuids(block: bytearray) -> list[bytes]:
+        block_ = bytes(block)
+        return [block_[i:i + 16] for i in range(0, len(block_), 16)]
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _profession(level: int, xp_percent: int) -> Decimal:
+        """Same as `Player.Character.Professions.ProfessionInfo.to_decimal`. Cached, most characters share levels."""
+        return level + (Decimal(xp_percent) / 100)
+
+    def __len__(self) -> int:
+        return len(self._usernames)
+
+    @property
+    def character_count(self) -> int:
+        return len(self._character_players)
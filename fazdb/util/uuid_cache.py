@@ -0,0 +1,40 @@
+from functools import lru_cache
+from uuid import UUID
+
+
+class UuidCache:
+    """Bounded cache of conversions between UUID strings and their 16-byte values.
+
+    Shared by the API fields and the DB columns, so UUIDs seen on every refresh, e.g. online players, are only
+    parsed once while they stay in the cache.
+    """
+
+    MAXSIZE = 32768
+    """Sized above the peak online player count."""
+
+    @staticmethod
+    def to_bytes(uuid: str) -> bytes:
+        """16-byte value of `uuid`. Raises `ValueError` if `uuid` isn't a valid UUID."""
+        ret = UuidCache.parse(uuid)
+        if ret is None:
+            raise ValueError(f"badly formed UUID string: {uuid!r}")
+        return ret
+
+    @staticmethod
+    @lru_cache(maxsize=MAXSIZE)
+    def parse(uuid: str) -> None | bytes:
+        """16-byte value of `uuid`, or None if `uuid` isn't a valid UUID, e.g. a username."""
+        try:
+            return UUID(uuid).bytes
+        except ValueError:
+            return None
+
+    @staticmethod
+    @lru_cache(maxsize=MAXSIZE)
+    def to_str(uuid: bytes, hyphen: bool = True) -> str:
+        return str(UUID(bytes=uuid)) if hyphen else uuid.hex()
+
+    @staticmethod
+    def clear() -> None:
+        UuidCache.parse.cache_clear()
+        UuidCache.to_str.cache_clear()
@@ -0,0 +1,57 @@
+from typing import Any
+import unittest
+
+from fazdb.api.wynn.model import Guild, Player
+
+
+class TestApiModelLazy(unittest.TestCase):
+    """Tests that nested objects of the API models are parsed on first access."""
+
+    def setUp(self) -> None:
+        self._player_raw: dict[str, Any] = {
+            "username": "Player0", "online": False, "server": None, "activeCharacter": None,
+            "uuid": "aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee", "rank": "Player", "rankBadge": None,
+            "shortenedRank": None, "supportRank": None, "veteran": None,
+            "firstJoin": "2020-01-01T00:00:00.000Z", "lastJoin": "2024-01-30T11:50:00.000Z", "playtime": 1.5,
+            "forumLink": None, "ranking": {}, "publicProfile": True,
+        }
+        self._guild_raw: dict[str, Any] = {
+            "uuid": "aaaaaaaa-0000-0000-0000-000000000000", "name": "Guild0", "prefix": "G0", "level": 1,
+            "xpPercent": 0, "territories": 0, "wars": None, "created": "2020-01-01T00:00:00.000Z", "online": 0,
+        }
+
+    def test_player_nested_objects_parsed_on_access(self) -> None:
+        # PREPARE
+        player = Player(self._player_raw)
+
+        # ACT, ASSERT
+        # NOTE: Assert that nodes absent from raw are only read when their property is accessed
+        with self.assertRaises(KeyError):
+            player.global_data
+        with self.assertRaises(KeyError):
+            player.characters
+
+        self._player_raw["characters"] = {}
+        self.assertDictEqual(player.characters, {})
+        # NOTE: Assert that the parsed object is cached
+        self.assertIs(player.characters, player.characters)
+        self.assertIsNone(player.guild)
+
+    def test_guild_nested_objects_parsed_on_access(self) -> None:
+        # PREPARE
+        guild = Guild(self._guild_raw)
+
+        # ACT, ASSERT
+        with self.assertRaises(KeyError):
+            guild.members
+        with self.assertRaises(KeyError):
+            guild.season_ranks
+
+        self._guild_raw["members"] = {"total": 0, "owner": {}}
+        members = guild.members
+        self.assertIs(guild.members, members)
+        self.assertDictEqual(members.owner, {})
+        self.assertIs(members.owner, members.owner)
+        # NOTE: Assert that each rank is parsed independently
+        with self.assertRaises(KeyError):
+            members.chief
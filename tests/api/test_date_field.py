@@ -0,0 +1,46 @@
+import json
+import unittest
+
+from dateutil import parser
+
+from fazdb.api.wynn.model import Headers
+from fazdb.api.wynn.model.field import BodyDateField, HeaderDateField
+
+
+class TestDateField(unittest.TestCase):
+    """Tests that the fixed-format parsers agree with dateutil."""
+
+    def test_header_date_field(self) -> None:
+        with open("tests/_fixtures/guilds.json") as f:
+            headers = [header for _, header in json.load(f).values()]
+        datestrs = [header["Date"] for header in headers] + [header["Expires"] for header in headers]
+        # NOTE: Assert that non-GMT dates fall back to dateutil
+        datestrs.append("Tue, 30 Jan 2024 11:59:35 +0100")
+
+        for datestr in datestrs:
+            self.assertEqual(HeaderDateField(datestr).to_datetime(), parser.parse(datestr))
+
+    def test_body_date_field(self) -> None:
+        for datestr in ("2020-01-01T00:00:00.000Z", "2024-01-30T11:50:00.123456Z", "2024-01-30 11:50:00"):
+            dt = BodyDateField(datestr).to_datetime()
+            self.assertEqual(dt, parser.parse(datestr))
+            self.assertEqual(dt.tzinfo is None, parser.parse(datestr).tzinfo is None)
+
+    def test_headers_to_datetime(self) -> None:
+        # PREPARE
+        headers = Headers({
+            "Cache-Control": "max-age=30",
+            "Date": "Tue, 30 Jan 2024 11:59:35 GMT",
+            "Expires": "Tue, 30 Jan 2024 12:00:05 GMT",
+            "RateLimit-Limit": "180",
+            "RateLimit-Remaining": "179",
+            "RateLimit-Reset": "25",
+        })
+
+        # ACT
+        dt = headers.to_datetime()
+
+        # ASSERT
+        self.assertEqual(dt, parser.parse("Tue, 30 Jan 2024 11:59:35 GMT"))
+        # NOTE: Assert that the timestamp is computed once
+        self.assertIs(headers.to_datetime(), dt)
@@ -0,0 +1,29 @@
+import json
+import unittest
+
+from fazdb.api.wynn.model import Guild
+
+
+class TestGuildMembersIndex(unittest.TestCase):
+
+    def setUp(self) -> None:
+        with open("tests/_fixtures/guilds.json") as f:
+            self._guilds = [Guild(body) for body, _ in json.load(f).values()]
+
+    def test_index(self) -> None:
+        for guild in self._guilds:
+            members = list(guild.members.iter_members())
+
+            self.assertEqual(guild.members.get_online_members(), sum(1 for _, _, info in members if info.online))
+            self.assertListEqual(
+                    list(guild.members.iter_online_members()),
+                    [member for member in members if member[2].online]
+            )
+            for rank in Guild.Members.RANKS:
+                self.assertEqual(guild.members.get_rank_count(rank), sum(1 for r, _, _ in members if r == rank))
+            for _, identifier, info in members:
+                uuid = identifier.to_bytes() if identifier.is_uuid() else info.uuid.to_bytes()  # type: ignore
+                self.assertIs(guild.members.get_member(uuid), info)
+
+    def test_get_member_missing(self) -> None:
+        self.assertIsNone(self._guilds[0].members.get_member(b"\x00" * 16))
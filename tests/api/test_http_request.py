@@ -0,0 +1,116 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+import json
+import threading
+from typing import Any
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from fazdb.api import HttpRequest, JsonDecoder, RatelimitHandler
+
+
+class TestHttpRequest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self) -> None:
+        async def handler(request: web.Request) -> web.Response:
+            size = int(request.match_info["size"])
+            return web.json_response({"data": "x" * size})
+
+        async def expiring_handler(request: web.Request) -> web.Response:
+            self._requests += 1
+            expires = datetime.now(timezone.utc) + timedelta(seconds=int(request.match_info["seconds"]))
+            return web.json_response({"data": self._requests}, headers={"Expires": format_datetime(expires, usegmt=True)})
+
+        self._requests = 0
+        app = web.Application()
+        app.router.add_get("/{size}", handler)
+        app.router.add_get("/expires/{seconds}", expiring_handler)
+        self._server = TestServer(app)
+        await self._server.start_server()
+        self._executor = ThreadPoolExecutor(1, thread_name_prefix="TestDecode")
+
+    async def asyncTearDown(self) -> None:
+        await self._server.close()
+        self._executor.shutdown()
+
+    @staticmethod
+    def _factory(body: dict[str, Any]) -> tuple[str, int]:
+        return (threading.current_thread().name, len(body["data"]))
+
+    async def test_get_offloads_large_bodies(self) -> None:
+        # PREPARE
+        async with HttpRequest(str(self._server.make_url("")), executor=self._executor, offload_threshold=1024) as request:
+            # ACT
+            small = await request.get("/10", body_factory=self._factory)
+            large = await request.get("/4096", body_factory=self._factory)
+            no_factory = await request.get("/4096")
+
+        # ASSERT
+        # NOTE: Assert that only bodies above the threshold are decoded and built in the pool
+        self.assertEqual(small.body, (threading.current_thread().name, 10))
+        self.assertTrue(large.body[0].startswith("TestDecode"))
+        self.assertEqual(large.body[1], 4096)
+        self.assertEqual(no_factory.body, {"data": "x" * 4096})
+
+    async def test_get_without_executor(self) -> None:
+        async with HttpRequest(str(self._server.make_url(""))) as request:
+            resp = await request.get("/4096", body_factory=self._factory)
+
+        self.assertEqual(resp.body, (threading.current_thread().name, 4096))
+
+    async def test_get_json_loads(self) -> None:
+        # PREPARE
+        raws: list[bytes] = []
+
+        def json_loads(raw: bytes) -> Any:
+            raws.append(raw)
+            return JsonDecoder.get("json")(raw)
+
+        # ACT
+        async with HttpRequest(str(self._server.make_url("")), json_loads=json_loads) as request:
+            resp = await request.get("/3")
+
+        # ASSERT
+        self.assertEqual(resp.body, {"data": "xxx"})
+        self.assertEqual(raws, [b'{"data": "xxx"}'])
+
+    async def test_get_cache(self) -> None:
+        # PREPARE
+        ratelimit = Mock(spec=RatelimitHandler)
+        ratelimit.limit = AsyncMock()
+
+        # ACT
+        async with HttpRequest(str(self._server.make_url("")), ratelimit=ratelimit, cache_size=2) as request:
+            fresh = [await request.get("/expires/60") for _ in range(2)]
+            expired = [await request.get("/expires/-60") for _ in range(2)]
+
+            # ASSERT
+            # NOTE: Assert that fresh responses are served from the cache until they expire
+            self.assertListEqual([resp.body["data"] for resp in fresh], [1, 1])
+            self.assertListEqual([resp.body["data"] for resp in expired], [2, 3])
+            self.assertEqual(request.cache_hits, 1)
+            self.assertEqual(request.cache_misses, 3)
+            # NOTE: Assert that the cache hit didn't wait on the ratelimiter
+            self.assertEqual(ratelimit.limit.await_count, 3)
+
+    async def test_get_without_cache(self) -> None:
+        # ACT
+        async with HttpRequest(str(self._server.make_url(""))) as request:
+            resps = [await request.get("/expires/60") for _ in range(2)]
+
+            # ASSERT
+            self.assertListEqual([resp.body["data"] for resp in resps], [1, 2])
+            self.assertEqual(request.cache_misses, 0)
+
+
+class TestJsonDecoder(unittest.TestCase):
+
+    def test_get(self) -> None:
+        self.assertIs(JsonDecoder.get("json"), json.loads)
+        self.assertEqual(JsonDecoder.get()(b'{"a": [1]}'), {"a": [1]})
+        with self.assertRaises(ImportError):
+            JsonDecoder.get("not_a_json_module")
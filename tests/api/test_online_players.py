@@ -0,0 +1,57 @@
+from uuid import UUID
+import unittest
+
+from fazdb.api.wynn.model import OnlinePlayers
+
+
+class TestOnlinePlayers(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.uuid0 = "00000000-0000-0000-0000-000000000000"
+        self.uuid1 = "11111111-1111-1111-1111-111111111111"
+        self.uuid2 = "22222222-2222-2222-2222-222222222222"
+        self.uuid3 = "33333333-3333-3333-3333-333333333333"
+
+    def _bytes(self, *uuids: str) -> bytes:
+        return b"".join(UUID(uuid).bytes for uuid in uuids)
+
+    def test_compact_form(self) -> None:
+        # ACT
+        online_players = OnlinePlayers({
+            "total": 4,
+            "players": {self.uuid2: "WC2", "username": "WC1", self.uuid0: "WC1", self.uuid1: "WC2"}
+        })
+
+        # ASSERT
+        # NOTE: Assert that the UUIDs are sorted, and usernames are left out.
+        self.assertEqual(online_players.uuids, self._bytes(self.uuid0, self.uuid1, self.uuid2))
+        self.assertEqual(len(online_players), 3)
+        self.assertListEqual(list(online_players.iter_uuids()), [
+            (UUID(self.uuid0).bytes, "WC1"),
+            (UUID(self.uuid1).bytes, "WC2"),
+            (UUID(self.uuid2).bytes, "WC2"),
+        ])
+        self.assertEqual(len(online_players.servers), 2)
+        # NOTE: Assert that the players dict still has every key.
+        self.assertEqual(len(online_players.players), 4)
+
+    def test_diff(self) -> None:
+        # PREPARE
+        old = self._bytes(self.uuid0, self.uuid1, self.uuid2)
+        new = self._bytes(self.uuid1, self.uuid3)
+
+        # ACT
+        logged_on, logged_off = OnlinePlayers.diff(old, new)
+
+        # ASSERT
+        self.assertListEqual(logged_on, [UUID(self.uuid3).bytes])
+        self.assertListEqual(logged_off, [UUID(self.uuid0).bytes, UUID(self.uuid2).bytes])
+
+    def test_diff_unchanged_or_empty(self) -> None:
+        # PREPARE
+        uuids = self._bytes(self.uuid0, self.uuid1)
+
+        # ACT, ASSERT
+        self.assertEqual(OnlinePlayers.diff(uuids, uuids), ([], []))
+        self.assertEqual(OnlinePlayers.diff(b"", uuids), ([UUID(self.uuid0).bytes, UUID(self.uuid1).bytes], []))
+        self.assertEqual(OnlinePlayers.diff(uuids, b""), ([], [UUID(self.uuid0).bytes, UUID(self.uuid1).bytes]))
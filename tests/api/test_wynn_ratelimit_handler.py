@@ -0,0 +1,61 @@
+# pyright: reportPrivateUsage=false
+import asyncio
+from time import perf_counter
+import unittest
+from unittest.mock import MagicMock
+
+from fazdb.api.wynn.wynn_ratelimit_handler import WynnRatelimitHandler
+
+
+class TestWynnRatelimitHandler(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._handler = WynnRatelimitHandler(5, 180, MagicMock(), burst=1)
+
+    @staticmethod
+    def _headers(remaining: int, reset: int) -> dict[str, str]:
+        return {
+            "Cache-Control": "public,max-age=60",
+            "Date": "Sun, 18 Oct 2026 00:00:00 GMT",
+            "Expires": "Sun, 18 Oct 2026 00:01:00 GMT",
+            "RateLimit-Limit": "180",
+            "RateLimit-Remaining": str(remaining),
+            "RateLimit-Reset": str(reset),
+        }
+
+    def test_update(self) -> None:
+        # ACT
+        self._handler.update(self._headers(65, 2))
+
+        # ASSERT
+        # NOTE: Assert that the budget above min_limit is spread over the reset window
+        self.assertEqual(self._handler.remaining, 65)
+        self.assertEqual(self._handler.reset, 2)
+        self.assertAlmostEqual(self._handler._rate, 30.0)
+
+    def test_limit_paces_requests(self) -> None:
+        # PREPARE
+        async def act() -> float:
+            self._handler.update(self._headers(25, 1))  # 20 tokens per second
+            t1 = perf_counter()
+            await asyncio.gather(*(self._handler.limit() for _ in range(5)))
+            return perf_counter() - t1
+
+        # ACT
+        elapsed = asyncio.run(act())
+
+        # ASSERT
+        # NOTE: Assert that concurrent callers are spread out instead of let through at once
+        self.assertGreaterEqual(elapsed, 0.15)
+        self.assertLess(elapsed, 1.0)
+
+    def test_ratelimited_drains_bucket(self) -> None:
+        # PREPARE
+        self._handler.update(self._headers(100, 10))
+
+        # ACT
+        asyncio.run(self._handler.ratelimited())
+
+        # ASSERT
+        self.assertEqual(self._handler.tokens, 0)
+        self.assertAlmostEqual(self._handler._rate, 0.1)
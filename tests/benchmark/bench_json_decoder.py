@@ -0,0 +1,33 @@
+"""Decoding time of the API response fixtures with each installed `JsonDecoder` module.
+
+Run with `python -m tests.benchmark.bench_json_decoder` from the repository root.
+"""
+import importlib
+from timeit import repeat
+
+from fazdb.api import JsonDecoder
+
+FIXTURES = ("tests/_fixtures/guilds.json", "tests/_fixtures/online_players.json")
+
+
+def main() -> None:
+    raws: dict[str, bytes] = {}
+    for fixture in FIXTURES:
+        with open(fixture, "rb") as f:
+            raws[fixture] = f.read()
+
+    print(f"{'decoder':<10}{'fixture':<40}{'KB':>8}{'ms':>10}{'MB/s':>9}")
+    for name in JsonDecoder.DECODERS:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            print(f"{name:<10}not installed")
+            continue
+        loads = JsonDecoder.get(name)
+        for fixture, raw in raws.items():
+            elapsed = min(repeat(lambda: loads(raw), number=5, repeat=5)) / 5
+            print(f"{name:<10}{fixture:<40}{len(raw) / 1e3:>8.1f}{elapsed * 1e3:>10.2f}{len(raw) / elapsed / 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Per-instance memory and construction time of the slotted model classes, compared against
+copies of the same classes without `__slots__`, on the guilds fixture.
+
+Run with `python -m tests.benchmark.bench_model_slots` from the repository root.
+"""
+from __future__ import annotations
+import ast
+import gc
+import inspect
+import json
+import sys
+from timeit import timeit
+import tracemalloc
+from typing import Any, Callable, Sequence
+
+from fazdb.api.wynn.model import Guild
+from fazdb.api.wynn.model.field import UsernameOrUuidField
+from fazdb.db.fazdb.model import GuildMemberHistory
+from fazdb.db.fazdb.model.column import DateColumn, UuidColumn
+
+GUILDS_FIXTURE_FP = "tests/_fixtures/guilds.json"
+
+
+def unslotted(cls: type) -> type:
+    """Copy of `cls` that stores its attributes in a per-instance `__dict__`, made by re-running its
+    module's source without the `__slots__` declarations."""
+    module = sys.modules[cls.__module__]
+    tree = ast.parse(inspect.getsource(module))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            node.body = [
+                stmt for stmt in node.body
+                if not (isinstance(stmt, ast.Assign) and any(getattr(t, "id", None) == "__slots__" for t in stmt.targets))
+            ]
+    namespace: dict[str, Any] = {"__name__": f"{module.__name__}_unslotted", "__package__": module.__package__}
+    exec(compile(tree, module.__file__ or "", "exec"), namespace)
+    ret: Any = namespace
+    for name in cls.__qualname__.split("."):
+        ret = ret[name] if isinstance(ret, dict) else getattr(ret, name)
+    return ret
+
+
+def measure(factory: Callable[[Any], object], args: Sequence[Any]) -> tuple[float, float]:
+    """Returns (bytes per instance, microseconds per instance)."""
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.take_snapshot()
+    objs = [factory(arg) for arg in args]
+    end = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in end.compare_to(start, "filename"))
+    # NOTE: Don't count the list holding the instances
+    size -= objs.__sizeof__()
+    elapsed = timeit(lambda: [factory(arg) for arg in args], number=5) / 5
+    return size / len(args), elapsed / len(args) * 1e6
+
+
+def main() -> None:
+    with open(GUILDS_FIXTURE_FP) as f:
+        guilds = [(body, headers) for body, headers in json.load(f).values()]
+
+    members = [
+        (uuid.to_bytes() if uuid.is_uuid() else memberinfo.uuid.to_bytes(), memberinfo.contributed, memberinfo.joined.to_datetime())  # type: ignore
+        for body, _ in guilds
+        for _, uuid, memberinfo in Guild(body).members.iter_members()
+    ]
+    member_keys = [key for body, _ in guilds for rank in ("owner", "chief", "strategist", "captain", "recruiter", "recruit") for key in body["members"][rank]]
+    cases: list[tuple[str, type, Callable[[type], Callable[[Any], object]], Sequence[Any]]] = [
+        ("GuildMemberHistory", GuildMemberHistory, lambda cls: lambda a: cls(a[0], a[1], a[2], a[2]), members),
+        ("UuidColumn", UuidColumn, lambda cls: lambda a: cls(a[0]), members),
+        ("DateColumn", DateColumn, lambda cls: lambda a: cls(a[2]), members),
+        ("UsernameOrUuidField", UsernameOrUuidField, lambda cls: lambda a: cls(a), member_keys),
+        ("Guild.Members.MemberInfo", Guild.Members.MemberInfo, lambda cls: lambda a: cls(a), [
+            member for body, _ in guilds for rank in ("owner", "chief", "strategist", "captain", "recruiter", "recruit")
+            for member in body["members"][rank].values()
+        ]),
+    ]
+
+    print(f"{'class':<26}{'rows':>7}{'slotted B':>12}{'dict B':>10}{'slotted us':>12}{'dict us':>10}")
+    for name, cls, factory, args in cases:
+        slotted_size, slotted_time = measure(factory(cls), args)
+        dict_size, dict_time = measure(factory(unslotted(cls)), args)
+        print(f"{name:<26}{len(args):>7}{slotted_size:>12.1f}{dict_size:>10.1f}{slotted_time:>12.3f}{dict_time:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
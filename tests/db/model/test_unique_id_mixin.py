@@ -0,0 +1,104 @@
+# pyright: reportPrivateUsage=false
+from array import array
+from datetime import datetime, timezone
+from decimal import Decimal
+import hashlib
+import unittest
+
+from fazdb.db.fazdb.model import GuildHistory, GuildMemberHistory, PlayerHistory
+from fazdb.db.fazdb.model.column import DateColumn, UniqueIdMixin, UuidColumn
+
+
+class TestUniqueIdMixin(unittest.TestCase):
+
+    def tearDown(self) -> None:
+        UniqueIdMixin.set_unique_id_version(1)
+
+    def test_v1_unique_id(self) -> None:
+        # PREPARE
+        args = ("Guild0", Decimal("12.34"), 3, 4, 50, 6)
+
+        # ACT
+        guild_history = GuildHistory(*args, datetime=datetime(2024, 1, 1))
+
+        # ASSERT
+        # NOTE: Assert that version 1 is unchanged from the values stored so far
+        self.assertEqual(guild_history.unique_id.uuid, hashlib.sha256("Guild012.3434506".encode()).digest())
+
+    def test_v2_unique_id(self) -> None:
+        # PREPARE
+        UniqueIdMixin.set_unique_id_version(2)
+        joined = datetime(2024, 1, 30, 11, 50, tzinfo=timezone.utc)
+
+        # ACT
+        member = GuildMemberHistory(b"\x01" * 16, 100, joined, datetime(2024, 1, 31))
+        same_member = GuildMemberHistory(UuidColumn(b"\x01" * 16), 100, DateColumn(joined.replace(tzinfo=None)), datetime(2024, 2, 1))
+        other_member = GuildMemberHistory(b"\x01" * 16, 101, joined, datetime(2024, 1, 31))
+
+        # ASSERT
+        self.assertEqual(len(member.unique_id.uuid), 16)
+        self.assertEqual(member.unique_id.uuid, same_member.unique_id.uuid)
+        self.assertNotEqual(member.unique_id.uuid, other_member.unique_id.uuid)
+
+    def test_v2_nullable_values(self) -> None:
+        UniqueIdMixin.set_unique_id_version(2)
+
+        # NOTE: Assert that None and an empty string don't collide
+        self.assertNotEqual(
+                PlayerHistory.compute_unique_id(b"\x01" * 16, "Player0", None, "", None, "Player"),
+                PlayerHistory.compute_unique_id(b"\x01" * 16, "Player0", "", None, None, "Player")
+        )
+        # NOTE: Assert that values that don't fit the declared layout still hash
+        self.assertEqual(len(GuildHistory.compute_unique_id("Guild0", Decimal(1), None, 1 << 70, 0, 0)), 16)
+
+    def test_compute_unique_ids(self) -> None:
+        rows = [("Guild0", Decimal("1.5"), 1, 2, 3, 4), ("Guild1", Decimal("2.5"), 1, 2, 3, 4)]
+        for version in UniqueIdMixin.UNIQUE_ID_VERSIONS:
+            UniqueIdMixin.set_unique_id_version(version)
+            self.assertListEqual(GuildHistory.compute_unique_ids(rows), [GuildHistory.compute_unique_id(*row) for row in rows])
+
+    def test_compute_unique_ids_batch(self) -> None:
+        # PREPARE
+        UniqueIdMixin.set_unique_id_version(2)
+        joined = datetime(2024, 1, 30, 11, 50)
+        rows = [(i.to_bytes(16, "little"), i, joined) for i in range(UniqueIdMixin._V2Layout._BATCH_ROWS + 3)]
+        # NOTE: Doesn't fit `q`, so the batch falls back to hashing row by row
+        bad_rows = rows[:2] + [(b"\x00" * 16, None, joined)]
+
+        # ACT
+        unique_ids = GuildMemberHistory.compute_unique_ids(rows)
+        bad_unique_ids = GuildMemberHistory.compute_unique_ids(bad_rows)
+
+        # ASSERT
+        # NOTE: Assert that rows packed together, across chunks, hash the same as rows hashed alone
+        self.assertListEqual(unique_ids, [GuildMemberHistory.compute_unique_id(*row) for row in rows])
+        self.assertEqual(len(set(unique_ids)), len(rows))
+        self.assertListEqual(bad_unique_ids[:2], unique_ids[:2])
+        self.assertEqual(bad_unique_ids[2], GuildMemberHistory.compute_unique_id(*bad_rows[2]))
+
+    def test_compute_unique_ids_from_columns(self) -> None:
+        # PREPARE
+        joined = datetime(2024, 1, 30, 11, 50)
+        rows = [(i.to_bytes(16, "little"), i, joined) for i in range(UniqueIdMixin._V2Layout._BATCH_ROWS + 3)]
+        uuids, contributed, joins = zip(*rows)
+        columns = [list(uuids), array("q", contributed), list(joins)]
+
+        for version in UniqueIdMixin.UNIQUE_ID_VERSIONS:
+            UniqueIdMixin.set_unique_id_version(version)
+
+            # ACT
+            unique_ids = GuildMemberHistory.compute_unique_ids_from_columns(columns)
+
+            # ASSERT
+            # NOTE: Assert that values packed from their columns hash the same as the rows
+            self.assertListEqual(unique_ids, GuildMemberHistory.compute_unique_ids(rows))
+
+        # NOTE: Assert that columns whose values don't fit the layout fall back to the rows
+        self.assertListEqual(
+                GuildMemberHistory.compute_unique_ids_from_columns([[b"\x00" * 16], [None], [joined]]),
+                [GuildMemberHistory.compute_unique_id(b"\x00" * 16, None, joined)]
+        )
+
+    def test_set_unique_id_version_unknown(self) -> None:
+        with self.assertRaises(ValueError):
+            UniqueIdMixin.set_unique_id_version(3)
@@ -0,0 +1,97 @@
+# pyright: reportPrivateUsage=false
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from fazdb.db import DatabaseQuery
+from fazdb.db.fazdb.model import OnlinePlayers
+from fazdb.db.fazdb.repository import OnlinePlayersRepository
+
+
+class TestOnlinePlayersRepositoryDiff(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._db = Mock(spec=DatabaseQuery)
+        self._db.local_infile = False
+        self._db.execute = AsyncMock(side_effect=self._execute)
+        self._repo = OnlinePlayersRepository(self._db)
+        self._conn = Mock()
+        self._uuid0 = b"\x00" * 16
+        self._uuid1 = b"\x01" * 16
+        self._uuid2 = b"\x02" * 16
+        self._drift = 0
+
+    async def _execute(self, sql: str, params: None | tuple[object, ...], conn: object) -> int:
+        if params is None:
+            return 0
+        if sql.startswith("UPDATE"):
+            return len(params) - 1 - self._drift
+        if sql.startswith("REPLACE"):
+            return len(params) // 2
+        return len(params)
+
+    def _insert(self, players: dict[bytes, str]) -> int:
+        entities = [OnlinePlayers(uuid, server) for uuid, server in players.items()]
+        return asyncio.run(self._repo.insert(entities, self._conn))
+
+    def _statements(self) -> list[str]:
+        return [call.args[0].split(" ")[0] for call in self._db.execute.call_args_list]
+
+    def test_first_insert_rewrites(self) -> None:
+        # ACT
+        self._insert({self._uuid0: "WC1", self._uuid1: "WC1"})
+
+        # ASSERT
+        # NOTE: Assert that the table is cleared, as its rows are unknown on startup
+        self.assertListEqual(self._statements(), ["DELETE", "REPLACE"])
+
+    def test_insert_writes_changes(self) -> None:
+        # PREPARE
+        self._insert({self._uuid0: "WC1", self._uuid1: "WC1"})
+        self._db.execute.reset_mock()
+
+        # ACT
+        affected_rows = self._insert({self._uuid1: "WC2", self._uuid2: "WC1"})
+
+        # ASSERT
+        # NOTE: Assert that player 0 is deleted, player 2 inserted, and player 1 moved to WC2
+        calls = self._db.execute.call_args_list
+        self.assertListEqual(self._statements(), ["DELETE", "REPLACE", "UPDATE"])
+        self.assertEqual(calls[0].args[1], (self._uuid0,))
+        self.assertEqual(calls[1].args[1], (self._uuid2, "WC1"))
+        self.assertEqual(calls[2].args[1], ("WC2", self._uuid1))
+        self.assertEqual(affected_rows, 3)
+
+        # ACT
+        self._db.execute.reset_mock()
+        self._insert({self._uuid1: "WC2", self._uuid2: "WC1"})
+
+        # ASSERT
+        # NOTE: Assert that nothing is written if nothing changed
+        self._db.execute.assert_not_awaited()
+
+    def test_insert_rewrites_on_drift(self) -> None:
+        # PREPARE
+        self._insert({self._uuid0: "WC1"})
+        self._db.execute.reset_mock()
+        self._drift = 1
+
+        # ACT
+        self._insert({self._uuid0: "WC2"})
+
+        # ASSERT
+        # NOTE: Assert that the table is rewritten once the update doesn't match the written rows
+        self.assertListEqual(self._statements(), ["UPDATE", "DELETE", "REPLACE"])
+
+    def test_clear_cache_rewrites(self) -> None:
+        # PREPARE
+        self._insert({self._uuid0: "WC1"})
+        self._db.execute.reset_mock()
+
+        # ACT
+        self._repo.clear_cache()
+        self._insert({self._uuid0: "WC1"})
+
+        # ASSERT
+        # NOTE: Assert that the table is rewritten after a rollback
+        self.assertListEqual(self._statements(), ["DELETE", "REPLACE"])
@@ -0,0 +1,143 @@
+# pyright: reportPrivateUsage=false
+import asyncio
+import os
+from datetime import datetime, timedelta, timezone
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from fazdb.db import DatabaseQuery
+from fazdb.db.fazdb.model import FazDbUptime, GuildMemberHistory
+from fazdb.db.fazdb.repository import (
+    FazDbUptimeRepository,
+    GuildMemberHistoryRepository,
+    PlayerActivityHistoryRepository,
+)
+
+
+class TestRepositoryBulkInsert(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._db = Mock(spec=DatabaseQuery)
+        self._db.execute = AsyncMock(side_effect=lambda sql, params, conn: len(params) // 2)
+        self._repo = FazDbUptimeRepository(self._db)
+        self._dt = datetime(2024, 1, 1)
+        self._entities = [FazDbUptime(self._dt, self._dt) for _ in range(5)]
+
+    def test_insert(self) -> None:
+        # ACT
+        affected_rows = asyncio.run(self._repo.insert(self._entities))
+
+        # ASSERT
+        # NOTE: Assert that all rows are sent in one multi-row statement with positional parameters
+        self._db.execute.assert_awaited_once()
+        sql, params, _ = self._db.execute.call_args.args
+        self.assertEqual(
+                sql,
+                "REPLACE INTO `kans_uptime` (`start_time`, `stop_time`) VALUES " + ", ".join(["(%s, %s)"] * 5)
+        )
+        self.assertEqual(params, (self._dt,) * 10)
+        self.assertEqual(affected_rows, 5)
+
+    def test_insert_chunked(self) -> None:
+        # PREPARE
+        row_size = self._repo._estimate_row_size(self._repo._model_to_tuple(self._entities[0]))
+        max_allowed_packet = row_size * 2 * 2  # two rows per statement
+
+        # ACT
+        with patch.object(FazDbUptimeRepository, "_MAX_ALLOWED_PACKET", max_allowed_packet):
+            affected_rows = asyncio.run(self._repo.insert(self._entities))
+
+        # ASSERT
+        # NOTE: Assert that rows are split into statements that fit the packet size
+        self.assertListEqual([len(call.args[1]) // 2 for call in self._db.execute.call_args_list], [2, 2, 1])
+        self.assertEqual(affected_rows, 5)
+
+    def test_insert_empty(self) -> None:
+        # ACT
+        affected_rows = asyncio.run(self._repo.insert([]))
+
+        # ASSERT
+        self._db.execute.assert_not_awaited()
+        self.assertEqual(affected_rows, 0)
+
+    def test_model_to_dict(self) -> None:
+        self.assertDictEqual(
+                self._repo._model_to_dict(self._entities[0]),
+                {"start_time": self._dt, "stop_time": self._dt}
+        )
+
+    def test_insert_load_data(self) -> None:
+        # PREPARE
+        files: list[str] = []
+
+        async def execute(sql: str, params: tuple[str], conn: None) -> int:
+            with open(params[0]) as f:
+                files.append(f.read())
+            return 2
+
+        self._db.local_infile = True
+        self._db.execute = AsyncMock(side_effect=execute)
+        repo = GuildMemberHistoryRepository(self._db)
+        entities = [
+                GuildMemberHistory(b"\x00" * 16, 1, self._dt, self._dt),
+                GuildMemberHistory(b"\xff" * 16, 2, self._dt, self._dt),
+        ]
+
+        # ACT
+        with patch.object(GuildMemberHistoryRepository, "_LOAD_DATA_THRESHOLD", 2):
+            affected_rows = asyncio.run(repo.insert(entities))
+
+        # ASSERT
+        # NOTE: Assert that rows are sent as TSV with hex encoded binary columns, ignoring duplicates
+        sql, (path,), _ = self._db.execute.call_args.args
+        self.assertTrue(sql.startswith("LOAD DATA LOCAL INFILE %s IGNORE INTO TABLE `guild_member_history`"))
+        self.assertIn("(@`uuid`, `contributed`, `joined`, `datetime`, @`unique_id`)", sql)
+        self.assertIn("SET `uuid` = UNHEX(@`uuid`), `unique_id` = UNHEX(@`unique_id`)", sql)
+        dt = "2024-01-01 00:00:00"
+        self.assertEqual(files[0].splitlines()[0], "\t".join(("00" * 16, "1", dt, dt, entities[0].unique_id.uuid.hex())))
+        self.assertEqual(len(files[0].splitlines()), 2)
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(affected_rows, 2)
+
+    def test_to_tsv(self) -> None:
+        # PREPARE
+        binary_columns = frozenset(map(GuildMemberHistoryRepository._COLUMNS.index, GuildMemberHistoryRepository._BINARY_COLUMNS))
+        aware = datetime(2024, 1, 1, 12, 30, 0, 500, tzinfo=timezone(timedelta(hours=2)))
+        rows = [
+                (None, 1, self._dt, self._dt, b"\x01" * 16),
+                (b"\x00" * 16, 2, aware, self._dt, b"\x02" * 16),
+        ]
+
+        # ACT
+        lines = GuildMemberHistoryRepository._to_tsv(rows, binary_columns).splitlines()
+
+        # ASSERT
+        # NOTE: Assert that binary columns come from the column definitions, not from the first row's values
+        self.assertEqual(lines[0], "\t".join(("\\N", "1", "2024-01-01 00:00:00", "2024-01-01 00:00:00", "01" * 16)))
+        # NOTE: Assert that datetimes are written as the INSERT path escapes them, timezone dropped
+        self.assertEqual(lines[1].split("\t")[:3], ["00" * 16, "2", "2024-01-01 12:30:00.000500"])
+
+        # ACT, ASSERT
+        # NOTE: Assert that bytes in a column that isn't binary are rejected, instead of written as str(bytes)
+        with self.assertRaises(ValueError):
+            GuildMemberHistoryRepository._to_tsv([(b"\x00" * 16, b"\x01", self._dt, self._dt, b"\x02" * 16)], binary_columns)
+
+    def test_update_logoff_datetime(self) -> None:
+        # PREPARE
+        repo = PlayerActivityHistoryRepository(self._db)
+        logoff = datetime(2024, 1, 2)
+        sessions = [(b"\x00" * 16, self._dt), (b"\x01" * 16, self._dt)]
+
+        # ACT
+        asyncio.run(repo.update_logoff_datetime(sessions, logoff))
+
+        # ASSERT
+        # NOTE: Assert that every session is updated with one statement
+        self._db.execute.assert_awaited_once()
+        sql, params, _ = self._db.execute.call_args.args
+        self.assertEqual(
+                sql,
+                "UPDATE `player_activity_history` SET `logoff_datetime` = %s"
+                " WHERE (`uuid`, `logon_datetime`) IN ((%s, %s), (%s, %s))"
+        )
+        self.assertEqual(params, (logoff, b"\x00" * 16, self._dt, b"\x01" * 16, self._dt))
@@ -0,0 +1,151 @@
+# pyright: reportPrivateUsage=false
+import asyncio
+from datetime import datetime, timedelta
+from itertools import chain
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from fazdb.db import DatabaseQuery
+from fazdb.db.fazdb.repository import CharacterHistoryRepository, GuildInfoRepository, PlayerInfoRepository
+
+
+class TestCharacterHistoryRepositoryCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._db = Mock(spec=DatabaseQuery)
+        self._db.local_infile = False
+        self._db.execute = AsyncMock(side_effect=lambda sql, params, conn: len(params) // 2)
+        self._repo = CharacterHistoryRepository(self._db)
+
+    def _sent_character_uuids(self) -> list[bytes]:
+        return [call.args[1][0] for call in self._db.execute.call_args_list]
+
+    def test_insert_rows_skips_unchanged(self) -> None:
+        # PREPARE
+        row0 = (b"\x00" * 16, b"a" * 16)
+        row1 = (b"\x01" * 16, b"b" * 16)
+        self._repo._COLUMNS = ("character_uuid", "unique_id")  # type: ignore
+
+        # ACT
+        asyncio.run(self._repo.insert_rows([row0, row1]))
+        self._db.execute.reset_mock()
+        asyncio.run(self._repo.insert_rows([row0, (b"\x01" * 16, b"c" * 16)]))
+
+        # ASSERT
+        # NOTE: Assert that only the character whose unique_id changed is sent again
+        self.assertListEqual(self._sent_character_uuids(), [b"\x01" * 16])
+
+        # ACT
+        self._db.execute.reset_mock()
+        self._repo.clear_cache()
+        asyncio.run(self._repo.insert_rows([row0]))
+
+        # ASSERT
+        # NOTE: Assert that rows are sent again once the cache is cleared, e.g. after a rollback
+        self.assertListEqual(self._sent_character_uuids(), [b"\x00" * 16])
+
+    def test_insert_columns_skips_unchanged(self) -> None:
+        # PREPARE
+        uuid0, uuid1, uuid2, uuid3 = (bytes([i]) * 16 for i in range(4))
+        self._repo._COLUMNS = ("character_uuid", "unique_id")  # type: ignore
+        asyncio.run(self._repo.insert_columns([[uuid0, uuid1, uuid2], [b"a" * 16, b"b" * 16, b"c" * 16]]))
+
+        for unique_ids, expected in (
+            ([b"a" * 16, b"b" * 16, b"c" * 16, b"d" * 16], [(uuid3, b"d" * 16)]),
+            ([b"a" * 16, b"x" * 16, b"c" * 16, b"y" * 16], [(uuid1, b"x" * 16), (uuid3, b"y" * 16)]),
+            ([b"a" * 16, b"x" * 16, b"c" * 16, b"y" * 16], []),
+        ):
+            # ACT
+            self._db.execute.reset_mock()
+            asyncio.run(self._repo.insert_columns([[uuid0, uuid1, uuid2, uuid3], unique_ids]))
+
+            # ASSERT
+            # NOTE: Assert that rows are only assembled and sent for the changed values, as with insert_rows
+            if expected:
+                self._db.execute.assert_awaited_once()
+                self.assertEqual(self._db.execute.call_args.args[1], tuple(chain.from_iterable(expected)))
+            else:
+                self._db.execute.assert_not_awaited()
+
+        # ACT, ASSERT
+        with self.assertRaises(ValueError):
+            asyncio.run(self._repo.insert_columns([[uuid0]]))
+
+    def test_load_cache(self) -> None:
+        # PREPARE
+        self._db.fetch = AsyncMock(return_value=[{"character_uuid": b"\x00" * 16, "unique_id": b"a" * 16}])
+        self._repo._COLUMNS = ("character_uuid", "unique_id")  # type: ignore
+
+        # ACT
+        asyncio.run(self._repo.load_cache())
+        asyncio.run(self._repo.insert_rows([(b"\x00" * 16, b"a" * 16)]))
+
+        # ASSERT
+        # NOTE: Assert that the read is bounded to recent rows and the cache size, and the warmed row isn't sent
+        since, limit = self._db.fetch.call_args.args[1]
+        self.assertAlmostEqual(
+                since, datetime.now() - CharacterHistoryRepository._CACHE_WARM_WINDOW, delta=timedelta(minutes=1)
+        )
+        self.assertEqual(limit, CharacterHistoryRepository._CACHE_MAXSIZE)
+        self._db.execute.assert_not_awaited()
+
+
+class TestInfoRepositoryCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._db = Mock(spec=DatabaseQuery)
+        self._db.local_infile = False
+        self._db.execute = AsyncMock(return_value=1)
+        self._dt = datetime(2024, 1, 1)
+
+    def test_player_info_upserts_changed_rows(self) -> None:
+        # PREPARE
+        repo = PlayerInfoRepository(self._db)
+        uuid0 = b"\x00" * 16
+        uuid1 = b"\x01" * 16
+
+        # ACT
+        asyncio.run(repo.insert_rows([(uuid0, "Player0", self._dt), (uuid1, "Player1", self._dt)]))
+        self._db.execute.reset_mock()
+        asyncio.run(repo.insert_rows([(uuid0, "Player0", self._dt), (uuid1, "Renamed", self._dt)]))
+
+        # ASSERT
+        # NOTE: Assert that only the renamed player is sent, with an upsert instead of REPLACE
+        self._db.execute.assert_awaited_once()
+        sql, params, _ = self._db.execute.call_args.args
+        self.assertEqual(
+                sql,
+                "INSERT INTO `player_info` (`uuid`, `latest_username`, `first_join`) VALUES (%s, %s, %s)"
+                " AS new ON DUPLICATE KEY UPDATE `latest_username` = new.`latest_username`,"
+                " `first_join` = new.`first_join`"
+        )
+        self.assertEqual(params, (uuid1, "Renamed", self._dt))
+
+    def test_player_info_load_cache(self) -> None:
+        # PREPARE
+        repo = PlayerInfoRepository(self._db)
+        uuid0 = b"\x00" * 16
+        self._db.fetch = AsyncMock(
+                return_value=[{"uuid": uuid0, "latest_username": "Player0", "first_join": self._dt}]
+        )
+
+        # ACT
+        asyncio.run(repo.load_cache())
+        asyncio.run(repo.insert_rows([(uuid0, "Player0", self._dt)]))
+
+        # ASSERT
+        # NOTE: Assert that the warmed player isn't sent again
+        self.assertEqual(self._db.fetch.call_args.args[1], (PlayerInfoRepository._CACHE_MAXSIZE,))
+        self._db.execute.assert_not_awaited()
+
+    def test_guild_info_skips_known_keys(self) -> None:
+        # PREPARE
+        repo = GuildInfoRepository(self._db)
+
+        # ACT
+        asyncio.run(repo.insert_rows([(b"\x00" * 16, "Guild0", "G", self._dt)]))
+        asyncio.run(repo.insert_rows([(b"\x00" * 16, "Guild0", "GG", self._dt)]))
+
+        # ASSERT
+        # NOTE: Assert that a guild is only sent once, as INSERT IGNORE wouldn't change it
+        self._db.execute.assert_awaited_once()
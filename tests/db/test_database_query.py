@@ -0,0 +1,100 @@
+# pyright: reportPrivateUsage=false
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fazdb.db import DatabaseQuery
+
+
+class TestDatabaseQuery(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._conn = MagicMock()
+        self._conn.last_usage = 0.0
+        self._conn.ping = AsyncMock()
+        self._pool = MagicMock()
+        self._pool.acquire.return_value.__aenter__ = AsyncMock(return_value=self._conn)
+        self._pool.acquire.return_value.__aexit__ = AsyncMock(return_value=None)
+        self._pool.wait_closed = AsyncMock()
+        self._query = DatabaseQuery("user", "password", "host", 3306, "db", pool_maxsize=5, pool_ping_interval=30.0)
+
+    def test_create_connection_pooled(self) -> None:
+        # PREPARE
+        async def act() -> list[object]:
+            conns: list[object] = []
+            for _ in range(3):
+                async with self._query.create_connection() as conn:
+                    conns.append(conn)
+            await self._query.close()
+            return conns
+
+        # ACT
+        with patch("fazdb.db.database_query.create_pool", AsyncMock(return_value=self._pool)) as create_pool:
+            conns = asyncio.run(act())
+
+        # ASSERT
+        # NOTE: Assert that the pool is created once and every call borrows from it
+        create_pool.assert_awaited_once()
+        self.assertEqual(create_pool.call_args.kwargs["maxsize"], 5)
+        self.assertListEqual(conns, [self._conn] * 3)
+        self.assertEqual(self._pool.acquire.call_count, 3)
+        self._pool.close.assert_called_once()
+
+    def test_check_health(self) -> None:
+        # PREPARE
+        async def act(last_usage: float) -> None:
+            self._conn.last_usage = asyncio.get_running_loop().time() - last_usage
+            await self._query._check_health(self._conn)
+
+        # ACT
+        asyncio.run(act(1.0))
+
+        # ASSERT
+        # NOTE: Assert that recently used connections aren't pinged
+        self._conn.ping.assert_not_awaited()
+
+        # ACT
+        asyncio.run(act(60.0))
+
+        # ASSERT
+        self._conn.ping.assert_awaited_once_with(reconnect=True)
+
+    def test_is_pooled(self) -> None:
+        self.assertTrue(self._query.is_pooled)
+        self.assertFalse(DatabaseQuery("user", "password", "host", 3306, "db").is_pooled)
+
+    def test_transaction(self) -> None:
+        # PREPARE
+        self._conn.begin = AsyncMock()
+        self._conn.commit = AsyncMock()
+        self._conn.rollback = AsyncMock()
+        curs = MagicMock()
+        curs.execute = AsyncMock()
+        curs.rowcount = 1
+        self._conn.cursor.return_value.__aenter__ = AsyncMock(return_value=curs)
+        self._conn.cursor.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        async def act(fail: bool) -> None:
+            async with self._query.transaction() as conn:
+                await self._query.execute("SELECT 1", connection=conn)
+                await self._query.execute("SELECT 2", connection=conn)
+                if fail:
+                    raise ValueError
+
+        # ACT
+        with patch("fazdb.db.database_query.create_pool", AsyncMock(return_value=self._pool)):
+            asyncio.run(act(False))
+
+        # ASSERT
+        # NOTE: Assert that statements on a borrowed connection are committed once, by the transaction
+        self.assertEqual(curs.execute.await_count, 2)
+        self._conn.commit.assert_awaited_once()
+
+        # ACT
+        with patch("fazdb.db.database_query.create_pool", AsyncMock(return_value=self._pool)):
+            with self.assertRaises(ValueError):
+                asyncio.run(act(True))
+
+        # ASSERT
+        self._conn.rollback.assert_awaited_once()
+        self._conn.commit.assert_awaited_once()
@@ -0,0 +1,74 @@
+# pyright: reportPrivateUsage=false
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, AsyncGenerator
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from fazdb.db import DatabaseQuery
+from fazdb.db.fazdb import FazDbDatabase
+
+
+class TestFazDbDatabase(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self._conn = Mock()
+        self._query = Mock(spec=DatabaseQuery)
+        self._query.local_infile = False
+        self._query.execute = AsyncMock(return_value=1)
+
+        @asynccontextmanager
+        async def transaction() -> AsyncGenerator[Any, Any]:
+            yield self._conn
+
+        self._query.transaction = transaction
+        self._db = FazDbDatabase(Mock(), self._query)
+
+    async def test_unit_of_work_rollback_clears_caches(self) -> None:
+        # PREPARE
+        repo = self._db.player_info_repository
+        row = (b"\x00" * 16, "Player0", datetime(2024, 1, 1))
+        clear_caches = [Mock(wraps=other.clear_cache) for other in self._db._repositories]
+        for other, clear_cache in zip(self._db._repositories, clear_caches):
+            other.clear_cache = clear_cache
+        listener = Mock()
+        self._db.add_rollback_listener(listener)
+
+        # ACT
+        with self.assertRaises(RuntimeError):
+            async with self._db.unit_of_work() as conn:
+                await repo.insert_rows([row], conn)
+                raise RuntimeError
+
+        # ASSERT
+        # NOTE: Assert that every repository dropped the rows it cached as written
+        for clear_cache in clear_caches:
+            clear_cache.assert_called_once()
+        listener.assert_called_once_with()
+
+        # ACT
+        self._query.execute.reset_mock()
+        async with self._db.unit_of_work() as conn:
+            await repo.insert_rows([row], conn)
+
+        # ASSERT
+        # NOTE: Assert that the rolled back row isn't filtered as already written
+        self._query.execute.assert_awaited_once()
+        self.assertEqual(self._query.execute.call_args.args[1], row)
+
+    async def test_unit_of_work_commit_keeps_caches(self) -> None:
+        # PREPARE
+        repo = self._db.player_info_repository
+        row = (b"\x00" * 16, "Player0", datetime(2024, 1, 1))
+        listener = Mock()
+        self._db.add_rollback_listener(listener)
+
+        # ACT
+        async with self._db.unit_of_work() as conn:
+            await repo.insert_rows([row], conn)
+        async with self._db.unit_of_work() as conn:
+            await repo.insert_rows([row], conn)
+
+        # ASSERT
+        self._query.execute.assert_awaited_once()
+        listener.assert_not_called()
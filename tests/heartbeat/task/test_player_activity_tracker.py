@@ -0,0 +1,118 @@
+import asyncio
+from datetime import datetime, timedelta
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from fazdb.db.fazdb.repository import PlayerActivityHistoryRepository
+from fazdb.heartbeat.task import PlayerActivityTracker
+
+
+class TestPlayerActivityTracker(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._repo = Mock(spec=PlayerActivityHistoryRepository)
+        self._repo.insert_rows = AsyncMock(side_effect=self._insert_rows)
+        self._repo.update_logoff_datetime = AsyncMock(side_effect=self._update_logoff_datetime)
+        self._tracker = PlayerActivityTracker(self._repo, timedelta(minutes=5))
+        self._inserted: list[tuple[bytes, datetime, datetime]] = []
+        self._updated: list[tuple[list[tuple[bytes, datetime]], datetime]] = []
+        self._uuid0 = b"\x00" * 16
+        self._uuid1 = b"\x01" * 16
+        self._dt = datetime(2024, 1, 1)
+
+    async def _insert_rows(self, rows: object, conn: object) -> int:
+        self._inserted.extend(rows)  # type: ignore
+        return 0
+
+    async def _update_logoff_datetime(self, sessions: object, logoff_datetime: datetime, conn: object) -> int:
+        self._updated.append((list(sessions), logoff_datetime))  # type: ignore
+        return 0
+
+    def _update(self, logged_on: list[bytes], logged_off: list[bytes], minutes: int) -> None:
+        asyncio.run(self._tracker.update(logged_on, logged_off, self._dt + timedelta(minutes=minutes)))
+
+    def test_sessions(self) -> None:
+        # ACT
+        self._update([self._uuid0], [], 0)
+        self._update([self._uuid1], [], 1)
+
+        # ASSERT
+        # NOTE: Assert that a row is only inserted when a session opens, without updating open sessions.
+        self.assertListEqual(self._inserted, [
+                (self._uuid0, self._dt, self._dt),
+                (self._uuid1, self._dt + timedelta(minutes=1), self._dt + timedelta(minutes=1)),
+        ])
+        self.assertListEqual(self._updated, [])
+
+        # ACT
+        self._update([], [self._uuid0], 2)
+
+        # ASSERT
+        # NOTE: Assert that the closed session's logoff is when the player was last seen online.
+        self.assertListEqual(self._updated, [([(self._uuid0, self._dt)], self._dt + timedelta(minutes=1))])
+        self.assertDictEqual(self._tracker.sessions, {self._uuid1: self._dt + timedelta(minutes=1)})
+
+    def test_checkpoint(self) -> None:
+        # PREPARE
+        self._update([self._uuid0], [], 0)
+
+        # ACT
+        self._update([], [], 4)
+        self._update([], [], 5)
+
+        # ASSERT
+        # NOTE: Assert that open sessions are only updated once the checkpoint interval has passed.
+        self.assertListEqual(self._updated, [([(self._uuid0, self._dt)], self._dt + timedelta(minutes=5))])
+
+    def test_reset(self) -> None:
+        # PREPARE
+        self._update([self._uuid0], [], 0)
+        self._inserted.clear()
+
+        # ACT
+        self._tracker.reset()
+        self._update([], [], 1)
+
+        # ASSERT
+        # NOTE: Assert that every open session is written again after a reset.
+        self.assertListEqual(self._inserted, [(self._uuid0, self._dt, self._dt + timedelta(minutes=1))])
+
+    def test_reset_after_logoff(self) -> None:
+        # PREPARE
+        self._update([self._uuid0, self._uuid1], [], 0)
+        self._update([], [self._uuid0], 1)
+        self._inserted.clear()
+
+        # ACT
+        # NOTE: The update closing player 0's session was rolled back
+        self._tracker.reset()
+        self._update([], [], 2)
+
+        # ASSERT
+        # NOTE: Assert that the closed session is written again, with its logoff when player 0 was last seen online.
+        self.assertListEqual(self._inserted, [
+                (self._uuid0, self._dt, self._dt),
+                (self._uuid1, self._dt, self._dt + timedelta(minutes=2)),
+        ])
+
+        # ACT
+        self._inserted.clear()
+        self._tracker.reset()
+        self._update([], [], 3)
+
+        # ASSERT
+        # NOTE: Assert that the closed session is kept until an update that wasn't rolled back.
+        self.assertListEqual(self._inserted, [
+                (self._uuid0, self._dt, self._dt),
+                (self._uuid1, self._dt, self._dt + timedelta(minutes=3)),
+        ])
+
+        # ACT
+        self._inserted.clear()
+        self._update([], [], 4)
+        self._tracker.reset()
+        self._update([], [], 5)
+
+        # ASSERT
+        # NOTE: Assert that a committed closed session isn't written again.
+        self.assertListEqual(self._inserted, [(self._uuid1, self._dt, self._dt + timedelta(minutes=5))])
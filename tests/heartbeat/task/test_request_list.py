@@ -1,8 +1,10 @@
 # pyright: reportPrivateUsage=none
 import unittest
 from datetime import datetime as dt
+from unittest.mock import Mock
 
-from fazdb.heartbeat.task import RequestQueue
+from fazdb.api import WynnApi
+from fazdb.heartbeat.task import RequestKind, RequestQueue
 
 
 class TestRequestList(unittest.TestCase):
@@ -10,23 +12,21 @@ class TestRequestList(unittest.TestCase):
     def setUp(self) -> None:
         self.request_list = RequestQueue()
 
-    async def mock_coro(self, arg: str) -> str:
-        return arg
-
     def test_enqueue_and_dequeue(self) -> None:
         # sourcery skip: class-extract-method
         # PREPARE
-        testCoro1 = self.mock_coro('foo')
         testRequestTs1 = dt.now().timestamp() - 100
 
         # ACT
-        self.request_list.enqueue(testRequestTs1, testCoro1)
+        self.request_list.enqueue(testRequestTs1, RequestKind.PLAYER, 'foo')
 
         # ASSERT
         # NOTE: Assert that the request is enqueued properly
-        self.assertEqual(len(self.request_list._list), 1)
-        self.assertEqual(self.request_list._list[0].coro, testCoro1)
-        self.assertEqual(self.request_list._list[0]._req_ts, testRequestTs1)
+        queued = list(self.request_list.iter())
+        self.assertEqual(len(queued), 1)
+        self.assertEqual(queued[0].kind, RequestKind.PLAYER)
+        self.assertEqual(queued[0].arg, 'foo')
+        self.assertEqual(queued[0]._req_ts, testRequestTs1)
 
         # ACT
         result = self.request_list.dequeue(1)
@@ -34,17 +34,15 @@ class TestRequestList(unittest.TestCase):
         # ASSERT
         # NOTE: Assert that the correct request is dequeued
         self.assertEqual(len(result), 1)
-        self.assertEqual(result[0], testCoro1)
+        self.assertEqual(result[0].key, (RequestKind.PLAYER, 'foo'))
 
     def test_dequeue_with_request_ts(self) -> None:
         # PREPARE
-        testCoro1 = self.mock_coro('foo')
-        testCoro2 = self.mock_coro('bar')
         testRequestTs1 = dt.now().timestamp() - 100
         testRequestTs2 = dt.now().timestamp() - 200  # earlier timestamp
 
-        self.request_list.enqueue(testRequestTs1, testCoro1)
-        self.request_list.enqueue(testRequestTs2, testCoro2)
+        self.request_list.enqueue(testRequestTs1, RequestKind.PLAYER, 'foo')
+        self.request_list.enqueue(testRequestTs2, RequestKind.PLAYER, 'bar')
 
         # ACT
         result = self.request_list.dequeue(1)
@@ -52,98 +50,171 @@ class TestRequestList(unittest.TestCase):
         # ASSERT
         # NOTE: Assert that the request with the earliest timestamp is dequeued first
         self.assertEqual(len(result), 1)
-        self.assertEqual(result[0], testCoro2)
-        remaining_item = self.request_list._list.pop()
+        self.assertEqual(result[0].arg, 'bar')
+        remaining_item = list(self.request_list.iter()).pop()
         # NOTE: Assert that the remaining item is the one with the later timestamp
-        self.assertEqual(remaining_item.coro, testCoro1)
+        self.assertEqual(remaining_item.arg, 'foo')
         self.assertEqual(remaining_item._req_ts, testRequestTs1)
 
     def test_dequeue_with_priority(self) -> None:
         # PREPARE
-        testCoro1 = self.mock_coro('foo')
-        testCoro2 = self.mock_coro('bar')
         testRequestTs1 = dt.now().timestamp() - 100
         testRequestTs2 = dt.now().timestamp() - 50  # should still return higher priority
-        self.request_list.enqueue(testRequestTs1, testCoro1, priority=100)
-        self.request_list.enqueue(testRequestTs2, testCoro2, priority=200)  # higher priority
+        self.request_list.enqueue(testRequestTs1, RequestKind.PLAYER, 'foo', priority=100)
+        self.request_list.enqueue(testRequestTs2, RequestKind.ONLINE_PLAYERS, priority=200)  # higher priority
 
         # ACT
         result = self.request_list.dequeue(1)
 
         # ASSERT
         self.assertEqual(len(result), 1)
-        self.assertEqual(result.pop(), testCoro2)
+        self.assertEqual(result.pop().kind, RequestKind.ONLINE_PLAYERS)
 
     def test_dequeue_equal_all(self) -> None:
         # PREPARE
-        testCoros = [self.mock_coro(str(i)) for i in range(100)]
+        testArgs = [str(i) for i in range(100)]
         testRequestTs = 0
-        for coro in testCoros:
-            self.request_list.enqueue(testRequestTs, coro)
+        for arg in testArgs:
+            self.request_list.enqueue(testRequestTs, RequestKind.PLAYER, arg)
 
         # ACT
         result = self.request_list.dequeue(15)
 
         # ASSERT
         self.assertEqual(len(result), 15)
-        for coro in result:
-            self.assertTrue(coro in testCoros)
+        for item in result:
+            self.assertTrue(item.arg in testArgs)
+
+    def test_dequeue_skips_ineligible(self) -> None:
+        # PREPARE
+        self.request_list.enqueue(dt.now().timestamp() + 1000, RequestKind.ONLINE_PLAYERS, priority=999)  # not eligible yet
+        self.request_list.enqueue(dt.now().timestamp() - 100, RequestKind.PLAYER, 'bar')
+
+        # ACT
+        result = self.request_list.dequeue(2)
+
+        # ASSERT
+        # NOTE: Assert that an ineligible item doesn't block eligible items behind it
+        self.assertListEqual([item.key for item in result], [(RequestKind.PLAYER, 'bar')])
+        self.assertEqual(len(self.request_list), 1)
+
+    def test_enqueue_duplicate(self) -> None:
+        # ACT
+        self.request_list.enqueue(0, RequestKind.PLAYER, 'foo')
+        self.request_list.enqueue(0, RequestKind.PLAYER, 'foo')
+        self.request_list.enqueue(0, RequestKind.GUILD, 'foo')
+
+        # ASSERT
+        # NOTE: Assert that the duplicate is rejected
+        self.assertEqual(len(self.request_list), 2)
+
+        # ACT
+        result = self.request_list.dequeue(2)
+        self.request_list.enqueue(0, RequestKind.PLAYER, 'foo')
+
+        # ASSERT
+        # NOTE: Assert that a request can be queued again once it has been dequeued
+        self.assertListEqual(
+                [item.key for item in result],
+                [(RequestKind.PLAYER, 'foo'), (RequestKind.GUILD, 'foo')]
+        )
+        self.assertEqual(len(self.request_list), 1)
+
+    def test_next_eligible_ts(self) -> None:
+        # PREPARE
+        now = dt.now().timestamp()
+
+        # ASSERT
+        self.assertIsNone(self.request_list.next_eligible_ts())
+
+        # ACT
+        self.request_list.enqueue(now + 200, RequestKind.PLAYER, 'foo')
+        self.request_list.enqueue(now + 100, RequestKind.PLAYER, 'bar')
+
+        # ASSERT
+        # NOTE: Assert that the earliest timestamp is returned
+        self.assertEqual(self.request_list.next_eligible_ts(), now + 100)
+
+    def test_enqueue_listener(self) -> None:
+        # PREPARE
+        listener = Mock()
+        self.request_list.add_enqueue_listener(listener)
+
+        # ACT
+        self.request_list.enqueue(0, RequestKind.PLAYER, 'foo')
+        self.request_list.enqueue(0, RequestKind.PLAYER, 'foo')
+
+        # ASSERT
+        # NOTE: Assert that the listener is only called for items that are actually enqueued
+        listener.assert_called_once_with()
+
+        # ACT
+        self.request_list.remove_enqueue_listener(listener)
+        self.request_list.enqueue(0, RequestKind.PLAYER, 'bar')
+
+        # ASSERT
+        listener.assert_called_once_with()
 
     def test_iter(self) -> None:
         # PREPARE
-        coro1 = self.mock_coro("foo")
-        coro2 = self.mock_coro("bar")
         request_ts = dt.now().timestamp()
-        self.request_list.enqueue(request_ts, coro1)
-        self.request_list.enqueue(request_ts, coro2)
+        self.request_list.enqueue(request_ts, RequestKind.PLAYER, "foo")
+        self.request_list.enqueue(request_ts, RequestKind.PLAYER, "bar")
 
         # ACT
         result = list(self.request_list.iter())
 
         # ASSERT
         self.assertEqual(len(result), 2)
-        self.assertEqual(result[0].coro, coro1)
-        self.assertEqual(result[1].coro, coro2)
+        self.assertEqual(result[0].arg, "foo")
+        self.assertEqual(result[1].arg, "bar")
 
     def test_request_item_is_eligible(self) -> None:
         # PREPARE
-        testCoro1 = self.mock_coro("foo")
         testRequestTs1 = dt.now().timestamp() - 1 # Past timestamp
-        request_item = RequestQueue.RequestItem(testCoro1, 100, testRequestTs1)
+        request_item = RequestQueue.RequestItem(RequestKind.PLAYER, "foo", 100, testRequestTs1)
 
         # ASSERT
         self.assertTrue(request_item.is_eligible())
 
     def test_request_item_is_not_eligible(self) -> None:
         # PREPARE
-        testCoro1 = self.mock_coro("foo")
         testRequestTs1 = dt.now().timestamp() + 1000  # Future timestamp
-        request_item = RequestQueue.RequestItem(testCoro1, 100, testRequestTs1)
+        request_item = RequestQueue.RequestItem(RequestKind.PLAYER, "foo", 100, testRequestTs1)
 
         # ASSERT
         # NOTE: Assert that request item is not eligible
         self.assertFalse(request_item.is_eligible())
 
-    def test_request_item_comparison(self) -> None:
+    def test_request_item_equality(self) -> None:
         # PREPARE
-        testCoro1 = self.mock_coro("foo")
-        testCoro2 = self.mock_coro("bar")
-        request_item1 = RequestQueue.RequestItem(testCoro1, 100, 0)
-        request_item2 = RequestQueue.RequestItem(testCoro2, 200, 0)
+        request_ts = dt.now().timestamp()
+        request_item1 = RequestQueue.RequestItem(RequestKind.PLAYER, "foo", 100, request_ts)
+        request_item2 = RequestQueue.RequestItem(RequestKind.PLAYER, "foo", 100, request_ts)
 
         # ASSERT
-        self.assertLess(request_item2, request_item1)
+        self.assertEqual(request_item1, request_item2)
 
-    def test_request_item_equality(self) -> None:
+    def test_request_item_to_coro(self) -> None:
         # PREPARE
-        testCoro1 = self.mock_coro("foo")
-        testCoro2 = self.mock_coro("foo")
-        request_ts = dt.now().timestamp()
-        request_item1 = RequestQueue.RequestItem(testCoro1, 100, request_ts)
-        request_item2 = RequestQueue.RequestItem(testCoro2, 100, request_ts)
+        api = Mock(spec=WynnApi)
+        player_item = RequestQueue.RequestItem(RequestKind.PLAYER, "foo", 100, 0)
+        guild_item = RequestQueue.RequestItem(RequestKind.GUILD, "bar", 100, 0)
+        online_item = RequestQueue.RequestItem(RequestKind.ONLINE_PLAYERS, None, 100, 0)
+
+        # ACT
+        player_coro = player_item.to_coro(api)
+        guild_coro = guild_item.to_coro(api)
+        online_coro = online_item.to_coro(api)
 
         # ASSERT
-        self.assertEqual(request_item1, request_item2)
+        # NOTE: Assert that each kind is dispatched to its endpoint
+        api.player.get_full_stats.assert_called_once_with("foo")
+        api.guild.get.assert_called_once_with("bar")
+        api.player.get_online_uuids.assert_called_once_with()
+        self.assertIs(player_coro, api.player.get_full_stats())
+        self.assertIs(guild_coro, api.guild.get())
+        self.assertIs(online_coro, api.player.get_online_uuids())
 
     def tearDown(self) -> None:
         pass
@@ -1,7 +1,9 @@
 # pyright: reportPrivateUsage=false
+import asyncio
 import unittest
 from unittest.mock import AsyncMock, MagicMock
 
+from fazdb.heartbeat.task import RequestKind, RequestQueue
 from fazdb.heartbeat.task.task_api_request import TaskApiRequest
 
 
@@ -58,3 +60,30 @@ class TestTaskApiRequest(unittest.TestCase):
 
         self.assertEqual(len(self.task._running_requests), 1)
         self.task._response_list.put.assert_called_once()
+
+    def test_continuous_dispatch(self):
+        # PREPARE
+        async def get_full_stats(uuid: str) -> str:
+            await asyncio.sleep(0.01)
+            return uuid
+
+        request_list = RequestQueue()
+        self.api.start = AsyncMock()
+        self.api.close = AsyncMock()
+        self.api.player.get_full_stats = get_full_stats
+        task = TaskApiRequest(self.api, self.logger, request_list, self.response_list, continuous=True)
+
+        async def act() -> None:
+            await task.async_setup()
+            for i in range(TaskApiRequest._CONCURRENT_REQUESTS * 2):
+                request_list.enqueue(0, RequestKind.PLAYER, str(i))
+            await asyncio.sleep(0.1)
+            await task.async_teardown()
+
+        # ACT
+        asyncio.run(act())
+
+        # ASSERT
+        # NOTE: Assert that completed requests free up their slot without waiting for the next run
+        self.assertEqual(len(request_list), 0)
+        self.assertEqual(sum(1 for req in task._running_requests if req.done() and not req.cancelled()), 30)
@@ -1,16 +1,29 @@
 # pyright: reportPrivateUsage=false
 from datetime import datetime
 import unittest
-from unittest.mock import AsyncMock, MagicMock, Mock
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 from fazdb.api import WynnApi
+from fazdb.api.wynn.model import OnlinePlayers
 from fazdb.api.wynn.response import (
     GuildResponse,
     OnlinePlayersResponse,
     PlayerResponse,
 )
 from fazdb.db.fazdb import FazDbDatabase
-from fazdb.heartbeat.task import RequestQueue, ResponseQueue, TaskDbInsert
+from fazdb.db.fazdb.repository import (
+    CharacterHistoryRepository,
+    CharacterInfoRepository,
+    FazDbUptimeRepository,
+    GuildHistoryRepository,
+    GuildInfoRepository,
+    GuildMemberHistoryRepository,
+    OnlinePlayersRepository,
+    PlayerHistoryRepository,
+    PlayerInfoRepository,
+)
+from fazdb.heartbeat.task import PlayerActivityTracker, RequestKind, RequestQueue, ResponseQueue, TaskDbInsert
+from fazdb.util import UuidCache
 
 
 class TestTaskDbInsert(unittest.TestCase):
@@ -22,6 +35,13 @@ class TestTaskDbInsert(unittest.TestCase):
         self._response_list = Mock(spec_set=ResponseQueue)
         self._task = TaskDbInsert(self._api, self._db, MagicMock(), self._request_list, self._response_list)
 
+    def test_init(self) -> None:
+        # ASSERT
+        # NOTE: Assert that the event loop is only created by the synchronous methods.
+        self.assertIsNone(self._task._event_loop)
+        # NOTE: Assert that the activity tracker rewrites its sessions when a tick is rolled back.
+        self._db.add_rollback_listener.assert_called_once_with(self._task.activity_tracker.reset)
+
     def test_setup(self) -> None:
         # PREPARE
         self._db.create_all = AsyncMock()
@@ -31,55 +51,29 @@ class TestTaskDbInsert(unittest.TestCase):
 
         # ASSERT
         self._db.create_all.assert_called_once()
-        self._request_list.enqueue.assert_called_once_with(0, self._api.player.get_online_uuids(), priority=999)
-
-    def test_run(self) -> None:
-        # PREPARE
-        self._task._run = AsyncMock()
+        self._db.load_caches.assert_called_once()
+        self._request_list.enqueue.assert_called_once_with(0, RequestKind.ONLINE_PLAYERS, priority=999)
 
-        # ACT
-        self._task.run()
-
-        # ASSERT
-        self._task._run.assert_called_once()
-
-    async def test__run(self) -> None:
+    def test_teardown(self) -> None:
         # PREPARE
-        self._response_list.get.return_value = None
-        self._task._response_handler = Mock(spec_set=TaskDbInsert._ResponseHandler)
-        online_players = Mock(spec_set=OnlinePlayersResponse)
-        player = Mock(spec_set=PlayerResponse)
-        guild = Mock(spec_set=GuildResponse)
+        self._db.query.close = AsyncMock()
 
         # ACT
-        await self._task._run()
+        self._task.teardown()
 
         # ASSERT
-        self._db.fazdb_uptime_repository.insert.assert_called_once()
-        self._task._response_handler.handle_onlineplayers_response.assert_not_called()
-        self._task._response_handler.handle_player_response.assert_not_called()
-        self._task._response_handler.handle_guild_response.assert_not_called()
+        # NOTE: Assert that the connection pool is closed.
+        self._db.query.close.assert_awaited_once()
 
+    def test_run(self) -> None:
         # PREPARE
-        self._response_list.get.return_value = [online_players, player, guild]
+        self._task._run = AsyncMock()
 
         # ACT
-        await self._task._run()
+        self._task.run()
 
         # ASSERT
-        self._task._response_handler.handle_onlineplayers_response.assert_called_once_with(online_players)
-        self._task._response_handler.handle_player_response.assert_called_once_with(player)
-        self._task._response_handler.handle_guild_response.assert_called_once_with(guild)
-        self._db.fazdb_uptime_repository.insert.assert_called_once()
-        self._db.online_players_repository.insert.assert_called_once()
-        self._db.player_activity_history_repository.insert.assert_called_once()
-        self._db.player_info_repository.insert.assert_called_once()
-        self._db.character_info_repository.insert.assert_called_once()
-        self._db.player_history_repository.insert.assert_called_once()
-        self._db.character_history_repository.insert.assert_called_once()
-        self._db.guild_info_repository.insert.assert_called_once()
-        self._db.guild_history_repository.insert.assert_called_once()
-        self._db.guild_member_history_repository.insert.assert_called_once()
+        self._task._run.assert_called_once()
 
     def test__insert_online_players_response(self) -> None:
         # TODO: Implement test
@@ -103,6 +97,75 @@ class TestTaskDbInsert(unittest.TestCase):
         pass
 
 
+class TestTaskDbInsertRun(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self._api = Mock(spec=WynnApi)
+        self._db = Mock(spec=FazDbDatabase)
+        self._request_list = Mock(spec_set=RequestQueue)
+        self._response_list = Mock(spec_set=ResponseQueue)
+        self._task = TaskDbInsert(self._api, self._db, MagicMock(), self._request_list, self._response_list)
+
+        self._db.unit_of_work.return_value.__aenter__ = AsyncMock(return_value=Mock())
+        self._db.unit_of_work.return_value.__aexit__ = AsyncMock(return_value=None)
+        self._db.fazdb_uptime_repository = Mock(spec=FazDbUptimeRepository)
+        self._db.online_players_repository = Mock(spec=OnlinePlayersRepository)
+        self._db.player_info_repository = Mock(spec=PlayerInfoRepository)
+        self._db.character_info_repository = Mock(spec=CharacterInfoRepository)
+        self._db.player_history_repository = Mock(spec=PlayerHistoryRepository)
+        self._db.character_history_repository = Mock(spec=CharacterHistoryRepository)
+        self._db.guild_info_repository = Mock(spec=GuildInfoRepository)
+        self._db.guild_history_repository = Mock(spec=GuildHistoryRepository)
+        self._db.guild_member_history_repository = Mock(spec=GuildMemberHistoryRepository)
+        self._task._response_adapter = MagicMock()
+        self._task._response_handler = Mock(spec_set=TaskDbInsert._ResponseHandler)
+        self._task._activity_tracker = Mock(spec_set=PlayerActivityTracker)
+
+    async def test__run(self) -> None:
+        # PREPARE
+        self._response_list.get.return_value = []
+        online_players = Mock(spec=OnlinePlayersResponse)
+        player = Mock(spec=PlayerResponse)
+        guild = Mock(spec=GuildResponse)
+
+        # ACT
+        await self._task._run()
+
+        # ASSERT
+        # NOTE: Assert that only the uptime is written without responses.
+        self._db.fazdb_uptime_repository.insert.assert_awaited_once()
+        self._task._response_handler.handle_onlineplayers_response.assert_called_once_with(None)
+        self._task._response_handler.handle_player_response.assert_called_once_with([])
+        self._task._response_handler.handle_guild_response.assert_called_once_with([])
+        self._db.online_players_repository.insert.assert_not_called()
+        self._task._activity_tracker.update.assert_not_called()
+
+        # PREPARE
+        self._response_list.get.return_value = [online_players, player, guild]
+        self._task._response_handler.reset_mock()
+
+        # ACT
+        with patch("fazdb.heartbeat.task.task_db_insert.PlayerResponseBatch"):
+            await self._task._run()
+
+        # ASSERT
+        self._task._response_handler.handle_onlineplayers_response.assert_called_once_with(online_players)
+        self._task._response_handler.handle_player_response.assert_called_once_with([player])
+        self._task._response_handler.handle_guild_response.assert_called_once_with([guild])
+        self.assertEqual(self._db.fazdb_uptime_repository.insert.await_count, 2)
+        self._db.online_players_repository.insert.assert_awaited_once()
+        self._task._activity_tracker.update.assert_awaited_once()
+        self._db.player_info_repository.insert_columns.assert_awaited_once()
+        self._db.character_info_repository.insert_columns.assert_awaited_once()
+        self._db.player_history_repository.insert_columns.assert_awaited_once()
+        self._db.character_history_repository.insert_columns.assert_awaited_once()
+        self._db.guild_info_repository.insert.assert_awaited_once()
+        self._db.guild_history_repository.insert.assert_awaited_once()
+        self._db.guild_member_history_repository.insert.assert_awaited_once()
+        # NOTE: Assert that every write of the tick is in one unit of work.
+        self.assertEqual(self._db.unit_of_work.call_count, 2)
+
+
 class TestResponseHandler(unittest.TestCase):
 
     def setUp(self) -> None:
@@ -113,16 +176,16 @@ class TestResponseHandler(unittest.TestCase):
     # OnlinePlayerResponse
     def test_process_new_response(self) -> None:
         # PREPARE
-        uuid0 = "0"
-        uuid1 = "1"
-        uuid2 = "2"
+        uuid0 = "00000000-0000-0000-0000-000000000000"
+        uuid1 = "11111111-1111-1111-1111-111111111111"
+        uuid2 = "22222222-2222-2222-2222-222222222222"
         datetime0 = Mock(spec_set=datetime)
         datetime1 = Mock(spec_set=datetime)
         resp0 = MagicMock()
         resp1 = MagicMock()
-        resp0.body.players = {uuid0, uuid1}
+        resp0.body = OnlinePlayers({"total": 2, "players": {uuid1: "WC1", uuid0: "WC2"}})
         resp0.headers.to_datetime.return_value = datetime0
-        resp1.body.players = {uuid1, uuid2}
+        resp1.body = OnlinePlayers({"total": 2, "players": {uuid2: "WC1", uuid1: "WC1"}})
         resp1.headers.to_datetime.return_value = datetime1
 
         # ACT
@@ -143,6 +206,11 @@ class TestResponseHandler(unittest.TestCase):
         # ASSERT
         # NOTE: Assert that only player 2 has logged on because player 1 is already logged on.
         self.assertSetEqual(self._manager._logged_on_players, {uuid2})
+        # NOTE: Assert that only player 0 has logged off.
+        self.assertSetEqual(self._manager.logged_off_players, {uuid0})
+        # NOTE: Assert that the same players are kept as 16-byte UUIDs, for PlayerActivityTracker.
+        self.assertListEqual(self._manager.logged_on_uuids, [UuidCache.to_bytes(uuid2)])
+        self.assertListEqual(self._manager.logged_off_uuids, [UuidCache.to_bytes(uuid0)])
         # NOTE: Assert that player 0 is no longer online, while player 1 and player 2 has the correct logged on datetime.
         self.assertDictEqual(self._manager.online_players, {
                 uuid1: datetime0,
@@ -159,9 +227,7 @@ class TestResponseHandler(unittest.TestCase):
 
         # ASSERT
         # NOTE: Assert that the correct player is being queued.
-        self._api.player.get_full_stats.assert_called_once_with(uuid0)
-        # NOTE: Assert that enqueue is called with the correct arguments.
-        self.__request_list.enqueue.assert_called_once_with(0, self._api.player.get_full_stats())
+        self.__request_list.enqueue.assert_called_once_with(0, RequestKind.PLAYER, uuid0)
 
     def test_requeueonline_players(self) -> None:
         # PREPARE
@@ -173,7 +239,7 @@ class TestResponseHandler(unittest.TestCase):
 
         # ASSERT
         # NOTE: Assert that enqueue is called with the correct arguments.
-        self.__request_list.enqueue.assert_called_once_with(69, self._api.player.get_online_uuids(), priority=500)
+        self.__request_list.enqueue.assert_called_once_with(69, RequestKind.ONLINE_PLAYERS, priority=500)
 
 
     # PlayerResponse
@@ -242,15 +308,14 @@ class TestResponseHandler(unittest.TestCase):
 
         # ASSERT
         # NOTE: Assert that the correct guild is being queued.
-        self._api.guild.get.assert_called_once_with(guild0)
-        # NOTE: Assert that enqueue is called with the correct arguments.
-        self.__request_list.enqueue.assert_called_once_with(0, self._api.guild.get())
+        self.__request_list.enqueue.assert_called_once_with(0, RequestKind.GUILD, guild0)
 
     def test_requeue_player(self) -> None:
         # PREPARE
         resp1 = MagicMock()
         resp2 = MagicMock()  # continued
         resp1.body.online = True
+        resp1.body.uuid.uuid = "player0"
         resp1.headers.expires.to_datetime().timestamp.return_value = 69
         resp2.body.online = False
 
@@ -258,10 +323,8 @@ class TestResponseHandler(unittest.TestCase):
         self._manager._requeue_player([resp2, resp1])
 
         # ASSERT
-        # NOTE: Assert that self._api.player.get_online_uuids() is called with the correct arguments
-        self._api.player.get_full_stats.assert_called_once()
         # NOTE: Assert that enqueue is called with the correct arguments.
-        self.__request_list.enqueue.assert_called_once_with(69, self._api.player.get_full_stats())
+        self.__request_list.enqueue.assert_called_once_with(69, RequestKind.PLAYER, "player0")
 
 
     # GuildResponse
@@ -279,7 +342,5 @@ class TestResponseHandler(unittest.TestCase):
         self._manager._requeue_guild([testResp1, testResp2])
 
         # ASSERT
-        # NOTE: Assert that self._api.guild.get() is called with the correct arguments
-        self._api.guild.get.assert_called_once_with(testName1)
         # NOTE: Assert that enqueue is called with the correct arguments.
-        self.__request_list.enqueue.assert_called_once_with(69, self._api.guild.get())
+        self.__request_list.enqueue.assert_called_once_with(69, RequestKind.GUILD, testName1)
@@ -0,0 +1,59 @@
+# pyright: reportPrivateUsage=false
+import asyncio
+from threading import Event
+from time import sleep
+import unittest
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+
+from fazdb.heartbeat import AsyncHeartbeat
+from fazdb.heartbeat.task import Task
+
+
+class TestAsyncHeartbeat(unittest.TestCase):
+
+    def setUp(self) -> None:
+        with patch("fazdb.heartbeat.async_heartbeat.TaskFactory.create_all", return_value=[]):
+            self._heartbeat = AsyncHeartbeat(MagicMock(), MagicMock(), MagicMock())
+        self._task = MagicMock(spec=Task)
+        self._task.async_setup = AsyncMock()
+        self._task.async_teardown = AsyncMock()
+        self._task.async_run = AsyncMock()
+        type(self._task).first_delay = PropertyMock(return_value=0.0)
+        type(self._task).interval = PropertyMock(return_value=0.01)
+        type(self._task).name = PropertyMock(return_value="MockTask")
+        self._heartbeat._tasks = [self._task]
+
+    def test_start_and_stop(self) -> None:
+        # ACT
+        self._heartbeat.start()
+        sleep(0.1)
+        self._heartbeat.stop()
+
+        # ASSERT
+        # NOTE: Assert that the task is set up once, run repeatedly on the same loop, then torn down
+        self.assertFalse(self._heartbeat.is_alive())
+        self._task.async_setup.assert_awaited_once()
+        self.assertGreater(self._task.async_run.await_count, 1)
+        self._task.async_teardown.assert_awaited_once()
+        self._task.run.assert_not_called()
+
+    def test_stop_during_setup(self) -> None:
+        # PREPARE
+        setting_up = Event()
+
+        async def async_setup() -> None:
+            setting_up.set()
+            await asyncio.sleep(3600)
+
+        self._task.async_setup = AsyncMock(side_effect=async_setup)
+
+        # ACT
+        self._heartbeat.start()
+        self.assertTrue(setting_up.wait(1))
+        self._heartbeat.stop()
+
+        # ASSERT
+        # NOTE: Assert that stop doesn't wait for the setup to finish, and the task that wasn't set up isn't torn down
+        self.assertFalse(self._heartbeat.is_alive())
+        self._task.async_run.assert_not_awaited()
+        self._task.async_teardown.assert_not_awaited()
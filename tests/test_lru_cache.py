@@ -0,0 +1,38 @@
+import unittest
+
+from fazdb.lru_cache import LruCache
+
+
+class TestLruCache(unittest.TestCase):
+
+    def test_evicts_least_recently_used(self) -> None:
+        # PREPARE
+        cache: LruCache[str, int] = LruCache(2)
+        cache.put("a", 0)
+        cache.put("b", 1)
+
+        # ACT
+        cache.get("a")
+        cache.put("c", 2)
+
+        # ASSERT
+        # NOTE: Assert that "b" is evicted, as "a" was used more recently.
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.get("a"), 0)
+        self.assertEqual(cache.get("c"), 2)
+        self.assertEqual(len(cache), 2)
+
+    def test_get_default_and_pop(self) -> None:
+        # PREPARE
+        cache: LruCache[str, int] = LruCache(2)
+        cache.put("a", 0)
+
+        # ACT, ASSERT
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("b", 1), 1)
+        self.assertEqual(cache.pop("a"), 0)
+        self.assertNotIn("a", cache)
+
+    def test_invalid_maxsize(self) -> None:
+        with self.assertRaises(ValueError):
+            LruCache(0)
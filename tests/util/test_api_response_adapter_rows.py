@@ -0,0 +1,94 @@
+# pyright: reportPrivateUsage=false
+from typing import Any
+import unittest
+
+from fazdb.api.wynn.response import PlayerResponse
+from fazdb.db.fazdb.repository import (
+    CharacterHistoryRepository,
+    CharacterInfoRepository,
+    PlayerHistoryRepository,
+    PlayerInfoRepository,
+)
+from fazdb.util import ApiResponseAdapter
+
+HEADERS = {
+    "Cache-Control": "max-age=30",
+    "Date": "Tue, 30 Jan 2024 11:59:35 GMT",
+    "Expires": "Tue, 30 Jan 2024 11:59:54 GMT",
+    "RateLimit-Limit": "180",
+    "RateLimit-Remaining": "179",
+    "RateLimit-Reset": "25",
+}
+
+
+def make_character(type_: str, gamemode: list[str], **kwargs: Any) -> dict[str, Any]:
+    return {
+        "type": type_, "nickname": None, "level": 106, "xp": 1234, "xpPercent": 12, "totalLevel": 1500,
+        "wars": 3, "playtime": 123.45, "mobsKilled": 4000, "chestsFound": 50, "itemsIdentified": None,
+        "blocksWalked": 99999, "logins": 321, "deaths": 12, "discoveries": 450, "preEconomy": None,
+        "pvp": {"kills": None, "deaths": None}, "gamemode": gamemode,
+        "skillPoints": {"strength": 10},
+        "professions": {"fishing": {"level": 30, "xpPercent": 55}, "mining": {"level": 110}},
+        "dungeons": {"total": 7, "list": {"Decrepit Sewers": 7}}, "raids": None,
+        "quests": ["King's Recruit", "Enzan's Brother"],
+    } | kwargs
+
+
+def make_player(guild: None | dict[str, Any]) -> dict[str, Any]:
+    return {
+        "username": "Player0", "online": True, "server": "WC1",
+        "activeCharacter": "11111111-2222-3333-4444-555555555555",
+        "uuid": "aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee", "rank": "Player", "rankBadge": None,
+        "legacyRankColour": None, "shortenedRank": None, "supportRank": "vip", "veteran": None,
+        "firstJoin": "2020-01-01T00:00:00.000Z", "lastJoin": "2024-01-30T11:50:00.000Z", "playtime": 456.7,
+        "guild": guild,
+        "globalData": {
+            "wars": 3, "totalLevel": 1500, "killedMobs": 4000, "chestsFound": 50, "dungeons": {"total": 7},
+            "raids": {"total": 0}, "completedQuests": 2, "pvp": {"kills": 0, "deaths": 0}
+        },
+        "forumLink": None, "ranking": {}, "publicProfile": True,
+        "characters": {
+            "11111111-2222-3333-4444-555555555555": make_character("DARKWIZARD", ["hardcore", "ironman"]),
+            "66666666-7777-8888-9999-000000000000": make_character("ARCHER", [], raids={"total": 2}, level=5),
+        },
+    }
+
+
+class TestApiResponseAdapterRows(unittest.TestCase):
+    """Tests that the row projections match the rows made from DB models."""
+
+    def setUp(self) -> None:
+        self._adapter = ApiResponseAdapter()
+        self._resps = [
+            PlayerResponse(make_player({"uuid": "aaaaaaaa-0000-0000-0000-000000000000", "name": "Guild0",
+                                        "prefix": "G0", "rank": "CHIEF", "rankStars": None}), HEADERS),
+            PlayerResponse(make_player(None), HEADERS),
+        ]
+
+    def test_to_character_history_rows(self) -> None:
+        for resp in self._resps:
+            self.assertListEqual(
+                    list(self._adapter.Player.to_character_history_rows(resp)),
+                    [CharacterHistoryRepository._model_to_tuple(e) for e in self._adapter.Player.to_character_history(resp)]
+            )
+
+    def test_to_character_info_rows(self) -> None:
+        for resp in self._resps:
+            self.assertListEqual(
+                    list(self._adapter.Player.to_character_info_rows(resp)),
+                    [CharacterInfoRepository._model_to_tuple(e) for e in self._adapter.Player.to_character_info(resp)]
+            )
+
+    def test_to_player_history_row(self) -> None:
+        for resp in self._resps:
+            self.assertTupleEqual(
+                    self._adapter.Player.to_player_history_row(resp),
+                    PlayerHistoryRepository._model_to_tuple(self._adapter.Player.to_player_history(resp))
+            )
+
+    def test_to_player_info_row(self) -> None:
+        for resp in self._resps:
+            self.assertTupleEqual(
+                    self._adapter.Player.to_player_info_row(resp),
+                    PlayerInfoRepository._model_to_tuple(self._adapter.Player.to_player_info(resp))
+            )
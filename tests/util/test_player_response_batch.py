@@ -0,0 +1,83 @@
+# pyright: reportPrivateUsage=false
+from array import array
+from typing import Any, Sequence
+import unittest
+
+from fazdb.api.wynn.response import PlayerResponse
+from fazdb.db.fazdb.model.column import UniqueIdMixin
+from fazdb.db.fazdb.repository import (
+    CharacterHistoryRepository,
+    CharacterInfoRepository,
+    PlayerHistoryRepository,
+    PlayerInfoRepository,
+)
+from fazdb.util import ApiResponseAdapter, PlayerResponseBatch
+
+from .test_api_response_adapter_rows import HEADERS, make_character, make_player
+
+
+class TestPlayerResponseBatch(unittest.TestCase):
+    """Tests that the batch rows match the rows made from DB models."""
+
+    def setUp(self) -> None:
+        guildless = make_player(None) | {"uuid": "12345678-1234-1234-1234-123456789abc", "username": "Player1"}
+        guildless["characters"] = {
+            "abcdefab-cdef-abcd-efab-cdefabcdefab": make_character(
+                "SHAMAN", ["craftsman", "hunted", "ultimate_ironman"], professions={}
+            )
+        }
+        self._resps = [
+            PlayerResponse(make_player({"uuid": "aaaaaaaa-0000-0000-0000-000000000000", "name": "Guild0",
+                                        "prefix": "G0", "rank": "CHIEF", "rankStars": None}), HEADERS),
+            PlayerResponse(guildless, HEADERS),
+        ]
+
+    def tearDown(self) -> None:
+        UniqueIdMixin.set_unique_id_version(1)
+
+    @staticmethod
+    def _rows(columns: Sequence[Sequence[Any]]) -> list[tuple[Any, ...]]:
+        return list(zip(*columns))
+
+    def _assert_rows(self) -> None:
+        adapter = ApiResponseAdapter.Player
+        batch = PlayerResponseBatch(self._resps)
+
+        # ASSERT
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(batch.character_count, 3)
+        self.assertListEqual(self._rows(batch.character_history_columns()), [
+            CharacterHistoryRepository._model_to_tuple(e) for resp in self._resps for e in adapter.to_character_history(resp)
+        ])
+        self.assertListEqual(self._rows(batch.character_info_columns()), [
+            CharacterInfoRepository._model_to_tuple(e) for resp in self._resps for e in adapter.to_character_info(resp)
+        ])
+        self.assertListEqual(self._rows(batch.player_history_columns()), [
+            PlayerHistoryRepository._model_to_tuple(adapter.to_player_history(resp)) for resp in self._resps
+        ])
+        self.assertListEqual(self._rows(batch.player_info_columns()), [
+            PlayerInfoRepository._model_to_tuple(adapter.to_player_info(resp)) for resp in self._resps
+        ])
+        # NOTE: Assert that the columns line up with the repositories' columns
+        self.assertEqual(len(batch.character_history_columns()), len(CharacterHistoryRepository._COLUMNS))
+        self.assertEqual(len(batch.player_history_columns()), len(PlayerHistoryRepository._COLUMNS))
+        self.assertIsInstance(batch.character_history_columns()[1], array)
+
+    def test_rows_match_model_rows(self) -> None:
+        self._assert_rows()
+
+    def test_rows_match_model_rows_v2(self) -> None:
+        # PREPARE
+        UniqueIdMixin.set_unique_id_version(2)
+
+        # ACT, ASSERT
+        self._assert_rows()
+
+    def test_empty_batch(self) -> None:
+        # ACT
+        batch = PlayerResponseBatch([])
+
+        # ASSERT
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(self._rows(batch.character_history_columns()), [])
+        self.assertEqual(self._rows(batch.player_info_columns()), [])
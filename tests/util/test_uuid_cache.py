@@ -0,0 +1,40 @@
+from uuid import UUID
+import unittest
+
+from fazdb.api.wynn.model.field import UsernameOrUuidField, UuidField
+from fazdb.db.fazdb.model.column import UuidColumn
+from fazdb.util import UuidCache
+
+
+class TestUuidCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        UuidCache.clear()
+        self._uuid = "aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee"
+
+    def test_to_bytes(self) -> None:
+        self.assertEqual(UuidCache.to_bytes(self._uuid), UUID(self._uuid).bytes)
+        with self.assertRaises(ValueError):
+            UuidCache.to_bytes("Player0")
+
+    def test_to_str(self) -> None:
+        uuid_bytes = UUID(self._uuid).bytes
+        self.assertEqual(UuidCache.to_str(uuid_bytes), self._uuid)
+        self.assertEqual(UuidCache.to_str(uuid_bytes, False), self._uuid.replace("-", ""))
+
+    def test_shared_by_fields_and_columns(self) -> None:
+        # ACT
+        field = UsernameOrUuidField(self._uuid)
+        UuidField(self._uuid).to_bytes()
+        UuidColumn.from_str(self._uuid)
+        username = UsernameOrUuidField("Player0")
+
+        # ASSERT
+        # NOTE: Assert that the UUID string is only parsed once
+        self.assertEqual(UuidCache.parse.cache_info().misses, 2)
+        self.assertTrue(field.is_uuid())
+        self.assertEqual(field.uuid, UUID(self._uuid))
+        self.assertFalse(username.is_uuid())
+        self.assertEqual(username.username, "Player0")
+        with self.assertRaises(ValueError):
+            username.to_bytes()